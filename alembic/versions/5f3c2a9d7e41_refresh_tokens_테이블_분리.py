@@ -0,0 +1,71 @@
+"""refresh_tokens 테이블 분리
+
+Revision ID: 5f3c2a9d7e41
+Revises: 332742179f0c
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5f3c2a9d7e41"
+down_revision: str | None = "332742179f0c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "refresh_tokens",
+        sa.Column("token_hash", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("token_hash"),
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_user_id"), "refresh_tokens", ["user_id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_expires_at"),
+        "refresh_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+    # 기존 세션 이전 (만료 시각은 알 수 없으므로 기본 유효 기간 7일 적용)
+    op.execute(
+        """
+        INSERT INTO refresh_tokens (token_hash, user_id, expires_at)
+        SELECT
+            encode(sha256(convert_to(refresh_token, 'UTF8')), 'hex'),
+            id,
+            now() + interval '7 days'
+        FROM users
+        WHERE refresh_token IS NOT NULL
+        """
+    )
+    op.drop_column("users", "refresh_token")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # 해시만 저장하므로 기존 토큰은 복원할 수 없음 (재로그인 필요)
+    op.add_column(
+        "users",
+        sa.Column("refresh_token", sa.String(length=255), nullable=True),
+    )
+    op.drop_index(op.f("ix_refresh_tokens_expires_at"), table_name="refresh_tokens")
+    op.drop_index(op.f("ix_refresh_tokens_user_id"), table_name="refresh_tokens")
+    op.drop_table("refresh_tokens")
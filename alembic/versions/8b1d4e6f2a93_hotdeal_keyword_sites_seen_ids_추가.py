@@ -0,0 +1,33 @@
+"""hotdeal_keyword_sites 테이블에 seen_ids 추가
+
+Revision ID: 8b1d4e6f2a93
+Revises: 5f3c2a9d7e41
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8b1d4e6f2a93"
+down_revision: str | None = "5f3c2a9d7e41"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 행은 NULL로 두고 다음 크롤링에서 external_id를 기준으로 채움
+    op.add_column(
+        "hotdeal_keyword_sites",
+        sa.Column("seen_ids", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("hotdeal_keyword_sites", "seen_ids")
@@ -0,0 +1,27 @@
+import argparse
+
+from app.src.core.config import settings
+from app.src.core.security import calibrate_bcrypt_rounds
+
+
+def main():
+    """
+    이 호스트에서 목표 검증 시간에 맞는 bcrypt 작업 비용을 측정해 출력합니다.
+    출력된 값을 .env의 PASSWORD_HASH_ROUNDS에 저장하면
+    모든 워커가 같은 비용을 사용합니다.
+    """
+    parser = argparse.ArgumentParser(description="bcrypt 작업 비용 보정")
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=settings.PASSWORD_HASH_TARGET_MS,
+        help="목표 검증 시간 (ms)",
+    )
+    args = parser.parse_args()
+
+    rounds = calibrate_bcrypt_rounds(args.target_ms)
+    print(f"PASSWORD_HASH_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main()
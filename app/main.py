@@ -1,5 +1,6 @@
 # app/main.py
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -14,9 +15,15 @@ import app.src.domain.user.models
 from app.src.core.config import settings
 from app.src.core.exceptions.base_exceptions import BaseHTTPException
 from app.src.core.logger import logger
+from app.src.core.security import password_hash_executor
 from app.src.domain.admin.v1 import router as admin_router
+from app.src.domain.chat.v1 import router as chat_router
 from app.src.domain.hotdeal.v1 import router as hotdeal_router
+from app.src.domain.user.token_store import (
+    sweep_expired_refresh_tokens_periodically,
+)
 from app.src.domain.user.v1 import router as user_router
+from app.src.llm import llm_client_registry
 
 # CORS 설정
 if settings.ENVIRONMENT == "local":
@@ -45,10 +52,21 @@ async def lifespan(app: FastAPI):
     # 애플리케이션 시작
     logger.info("애플리케이션 시작...")
     logger.info("origins: %s", origins)
+    sweep_task = None
+    if settings.REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS > 0:
+        sweep_task = asyncio.create_task(
+            sweep_expired_refresh_tokens_periodically(
+                settings.REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS
+            )
+        )
     yield
 
     # 애플리케이션 종료
     logger.info("애플리케이션 종료...")
+    if sweep_task is not None:
+        sweep_task.cancel()
+    await llm_client_registry.aclose()
+    password_hash_executor.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -89,6 +107,7 @@ app.openapi = custom_openapi
 app.include_router(user_router.router, prefix="/api/user")
 app.include_router(hotdeal_router.router, prefix="/api/hotdeal")
 app.include_router(admin_router.router, prefix="/api")
+app.include_router(chat_router.router, prefix="/api/chat")
 
 
 @app.exception_handler(BaseHTTPException)
@@ -1,24 +1,35 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
 import httpx
 
+from app.src.core.config import settings
 from app.src.core.logger import logger
 from app.src.domain.hotdeal.schemas import CrawledKeyword
 from app.src.Infrastructure.crawling.proxy_manager import ProxyManager
+from app.src.Infrastructure.crawling.rate_limiter import (
+    get_host_rate_limiter,
+    parse_retry_after,
+)
 
 
 class BaseCrawler(ABC):
     """크롤러의 기본 추상 클래스."""
 
+    # HTML 파서 구현 (백엔드 이름 -> 파싱 함수). 하위 클래스에서 사이트별로 등록
+    parsers: dict[str, Callable[[str], list[CrawledKeyword]]] = {}
+
     def __init__(
         self,
         keyword: str,
         client: httpx.AsyncClient,
+        parser_backend: str | None = None,
     ):
         self.keyword = keyword
         self.proxy_manager: ProxyManager = ProxyManager()
         self.results = []
         self.client = client
+        self.parser_backend = parser_backend or settings.CRAWL_PARSER_BACKEND
 
     @property
     @abstractmethod
@@ -28,24 +39,39 @@ class BaseCrawler(ABC):
         """크롤링 대상 URL (하위 클래스에서 구현 필수)."""
         pass
 
-    @abstractmethod
     def parse(
         self,
         html: str,
     ) -> list[CrawledKeyword]:
-        """파싱 로직 (사이트별 구현 필요)."""
-        pass
+        """parser_backend에 해당하는 파서로 파싱 (사이트별로 parsers 등록 필요)."""
+        try:
+            parser = self.parsers[self.parser_backend]
+        except KeyError as e:
+            crawler_name = type(self).__name__
+            raise ValueError(
+                f"Unknown parser backend for {crawler_name}: {self.parser_backend}"
+            ) from e
+        return parser(html)
 
     async def fetch(
         self,
         url: str = None,
         timeout: int = 10,
     ) -> str | None:
-        """HTML 가져오기 (프록시 포함)."""
+        """
+        HTML 가져오기 (프록시 포함).
+        요청 간격과 동시 요청 수는 호스트별 스케줄러가 조절합니다.
+        """
         target_url = url or self.url
-        logger.info(f"[{self.keyword}] 요청: {target_url}")
+        rate_limiter = get_host_rate_limiter(target_url)
         try:
-            response = await self.client.get(target_url, timeout=timeout)
+            async with rate_limiter.slot():
+                logger.info(f"[{self.keyword}] 요청: {target_url}")
+                response = await self.client.get(target_url, timeout=timeout)
+                rate_limiter.record(
+                    response.status_code,
+                    parse_retry_after(response.headers.get("Retry-After")),
+                )
 
             if response.status_code in [403, 430]:
                 if response.status_code == 430:
@@ -68,7 +94,13 @@ class BaseCrawler(ABC):
         url: str,
         timeout: int = 20,
     ) -> str | None:
-        """프록시를 사용하여 HTML 가져오기."""
+        """
+        프록시를 사용하여 HTML 가져오기.
+        프록시 요청도 같은 호스트로 가므로 호스트별 스케줄러를 거칩니다.
+        프록시의 403/430은 그 프록시 IP가 차단된 것이므로 호스트의 요청 속도에는
+        반영하지 않고, 호스트가 속도 제한을 알리는 429만 반영합니다.
+        """
+        rate_limiter = get_host_rate_limiter(url)
         for _ in range(15):
             proxy_url = self.proxy_manager.get_next_proxy()
             if not proxy_url:
@@ -76,8 +108,16 @@ class BaseCrawler(ABC):
                 return None
 
             try:
-                async with httpx.AsyncClient(proxy=proxy_url) as proxy_client:
+                async with (
+                    rate_limiter.slot(),
+                    httpx.AsyncClient(proxy=proxy_url) as proxy_client,
+                ):
                     response = await proxy_client.get(url, timeout=timeout)
+                    if response.status_code == 429:
+                        rate_limiter.record(
+                            response.status_code,
+                            parse_retry_after(response.headers.get("Retry-After")),
+                        )
 
                     if response.status_code in [403, 430]:
                         logger.warning(
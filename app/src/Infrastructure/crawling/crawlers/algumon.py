@@ -1,3 +1,5 @@
+from html.parser import HTMLParser
+
 from bs4 import BeautifulSoup
 
 from app.src.core.logger import logger
@@ -5,42 +7,180 @@ from app.src.domain.hotdeal.schemas import CrawledKeyword
 from app.src.Infrastructure.crawling.base_crawler import BaseCrawler
 
 
+def _make_product(
+    post_id: str | None,
+    action_uri: str | None,
+    link_text: str | None,
+    price_text: str | None,
+    meta_text: str | None,
+) -> CrawledKeyword | None:
+    """상품 항목의 값으로 CrawledKeyword를 만듭니다. (link_text가 None이면 링크 없음)"""
+    if not (post_id and action_uri and link_text is not None):
+        return None
+    return CrawledKeyword(
+        id=post_id,
+        title=link_text.strip(),
+        link=f"https://www.algumon.com{action_uri.strip()}",
+        price=(price_text.strip() if price_text is not None else None),
+        meta_data=(meta_text.strip() if meta_text is not None else "")
+        .replace("\n", "")
+        .replace("\r", "")
+        .replace(" ", ""),
+    )
+
+
+def parse_with_bs4(html: str) -> list[CrawledKeyword]:
+    """BeautifulSoup으로 전체 문서 트리를 만든 뒤 상품 리스트를 찾습니다."""
+    soup = BeautifulSoup(html, "html.parser")
+    product_list = soup.find("ul", class_="product post-list")
+    if not product_list:
+        logger.warning("알구몬 상품 리스트를 찾을 수 없습니다.")
+        return []
+
+    products = []
+    for li in product_list.find_all("li"):
+        product_link = li.find("a", class_="product-link")
+        product_price = li.find("small", class_="product-price")
+        meta_info = li.find("small", class_="deal-price-meta-info")
+        product = _make_product(
+            li.get("data-post-id"),
+            li.get("data-action-uri"),
+            product_link.text if product_link else None,
+            product_price.text if product_price else None,
+            meta_info.text if meta_info else None,
+        )
+        if product:
+            products.append(product)
+    return products
+
+
+# 상품 항목에서 텍스트를 뽑을 요소: (태그, class) -> 필드 이름
+_FIELD_ELEMENTS = {
+    ("a", "product-link"): "link",
+    ("small", "product-price"): "price",
+    ("small", "deal-price-meta-info"): "meta",
+}
+
+
+class _ProductListEnded(Exception):
+    """상품 리스트가 끝나 나머지 문서를 읽을 필요가 없을 때 사용"""
+
+
+class _ProductItem:
+    def __init__(self, attrs: dict[str, str | None]):
+        self.post_id = attrs.get("data-post-id")
+        self.action_uri = attrs.get("data-action-uri")
+        self.texts: dict[str, list[str]] = {}
+        # 텍스트를 모으는 중인 필드: 필드 이름 -> [태그, 같은 태그 중첩 수]
+        self.capturing: dict[str, list] = {}
+
+
+class AlgumonProductListParser(HTMLParser):
+    """
+    트리를 만들지 않고 태그를 순서대로 읽으며
+    `ul.product.post-list` 안의 상품 항목만 뽑는 파서.
+    parse_with_bs4와 같은 결과를 반환하며,
+    상품 리스트가 끝나면 나머지 문서는 읽지 않습니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.found = False
+        self._ul_depth = 0
+        self._open_items: list[_ProductItem] = []
+        self.items: list[_ProductItem] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if not self._ul_depth:
+            if tag == "ul":
+                class_value = dict(attrs).get("class") or ""
+                if " ".join(class_value.split()) == "product post-list":
+                    self.found = True
+                    self._ul_depth = 1
+            return
+        if tag == "ul":
+            self._ul_depth += 1
+        for item in self._open_items:
+            for capture in item.capturing.values():
+                if capture[0] == tag:
+                    capture[1] += 1
+        if tag == "li":
+            item = _ProductItem(dict(attrs))
+            self._open_items.append(item)
+            self.items.append(item)
+            return
+        if not self._open_items or (tag != "a" and tag != "small"):
+            return
+        classes = (dict(attrs).get("class") or "").split()
+        for class_name in classes:
+            field = _FIELD_ELEMENTS.get((tag, class_name))
+            if field is None:
+                continue
+            # 항목마다 처음 나온 요소만 사용 (bs4의 find와 동일)
+            for item in self._open_items:
+                if field not in item.texts:
+                    item.texts[field] = []
+                    item.capturing[field] = [tag, 0]
+
+    def handle_endtag(self, tag: str) -> None:
+        if not self._ul_depth:
+            return
+        for item in self._open_items:
+            for field, capture in list(item.capturing.items()):
+                if capture[0] != tag:
+                    continue
+                if capture[1]:
+                    capture[1] -= 1
+                else:
+                    del item.capturing[field]
+        if tag == "li" and self._open_items:
+            self._open_items.pop().capturing.clear()
+        elif tag == "ul":
+            self._ul_depth -= 1
+            if not self._ul_depth:
+                raise _ProductListEnded
+
+    def handle_data(self, data: str) -> None:
+        for item in self._open_items:
+            for field in item.capturing:
+                item.texts[field].append(data)
+
+
+def parse_with_stream(html: str) -> list[CrawledKeyword]:
+    """표준 라이브러리 HTMLParser로 상품 리스트 부분만 읽습니다."""
+    parser = AlgumonProductListParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except _ProductListEnded:
+        pass
+    if not parser.found:
+        logger.warning("알구몬 상품 리스트를 찾을 수 없습니다.")
+        return []
+
+    products = []
+    for item in parser.items:
+        texts = {field: "".join(chunks) for field, chunks in item.texts.items()}
+        product = _make_product(
+            item.post_id,
+            item.action_uri,
+            texts.get("link"),
+            texts.get("price"),
+            texts.get("meta"),
+        )
+        if product:
+            products.append(product)
+    return products
+
+
 class AlgumonCrawler(BaseCrawler):
+    parsers = {
+        "stream": parse_with_stream,
+        "bs4": parse_with_bs4,
+    }
+
     @property
     def url(
         self,
     ) -> str:
         return f"https://www.algumon.com/search/{self.keyword}"
-
-    def parse(
-        self,
-        html: str,
-    ) -> list[CrawledKeyword]:
-        soup = BeautifulSoup(html, "html.parser")
-        product_list = soup.find("ul", class_="product post-list")
-        if not product_list:
-            logger.warning("알구몬 상품 리스트를 찾을 수 없습니다.")
-            return []
-
-        products = []
-        for li in product_list.find_all("li"):
-            post_id = li.get("data-post-id")
-            action_uri = li.get("data-action-uri")
-            product_link = li.find("a", class_="product-link")
-            product_price = li.find("small", class_="product-price")
-            meta_info = li.find("small", class_="deal-price-meta-info")
-
-            if post_id and action_uri and product_link:
-                products.append(
-                    CrawledKeyword(
-                        id=post_id,
-                        title=product_link.text.strip(),
-                        link=f"https://www.algumon.com{action_uri.strip()}",
-                        price=(product_price.text.strip() if product_price else None),
-                        meta_data=(meta_info.text.strip() if meta_info else "")
-                        .replace("\n", "")
-                        .replace("\r", "")
-                        .replace(" ", ""),
-                    )
-                )
-        return products
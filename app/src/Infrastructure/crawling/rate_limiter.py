@@ -0,0 +1,163 @@
+import asyncio
+import random
+import threading
+from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.core.token_bucket import TokenBucket
+
+# 호스트가 요청 속도를 낮추라는 의미로 보내는 상태 코드
+THROTTLE_STATUS_CODES = frozenset({403, 429, 430})
+
+
+class HostRateLimiter:
+    """
+    호스트 하나에 대한 요청 스케줄러.
+    - 초당 rate개씩 채워지는 TokenBucket(최대 burst개)으로 요청 간격을 조절
+    - 동시 요청 수는 AIMD로 조절: 차단 응답이면 절반으로 줄이고,
+      현재 한도만큼 연속 성공하면 1 증가
+    - 차단 응답 후에는 요청 속도를 절반으로 낮추고 잠시 멈추며,
+      속도가 회복될 때까지만 간격에 jitter 추가
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        max_concurrency: int = 5,
+        min_rate: float = 0.1,
+        cooldown: float = 5.0,
+    ):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.max_concurrency = max_concurrency
+        self.concurrency = max_concurrency
+        self.cooldown = cooldown
+        self._bucket = TokenBucket(capacity=burst, refill_rate=rate)
+        self._successes = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        # 슬롯을 기다리는 요청 (이벤트 루프에 묶이지 않도록 대기할 때마다 future 생성)
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def rate(self) -> float:
+        """현재 초당 요청 수"""
+        return self._bucket.refill_rate
+
+    @property
+    def throttled(self) -> bool:
+        """차단 응답으로 낮춘 속도가 아직 회복되지 않았으면 True"""
+        return self.rate < self.max_rate
+
+    def try_acquire(self) -> float:
+        """
+        토큰을 차감하고 0을 반환합니다.
+        기다려야 하면 차감하지 않고 대기 시간(초)을 반환합니다.
+        """
+        wait = self._bucket.try_acquire(1)
+        if wait > 0 and self.throttled:
+            wait += random.uniform(0, 1 / self.rate)
+        return wait
+
+    async def _acquire_slot(self) -> None:
+        while self._in_flight >= self.concurrency:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # 깨워진 직후 취소되면 다른 대기 요청에 슬롯을 넘김
+                if not waiter.cancelled():
+                    self._wake_waiters()
+                raise
+        self._in_flight += 1
+
+    def _wake_waiters(self) -> None:
+        available = self.concurrency - self._in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            # 취소된 대기 요청은 건너뜀
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator["HostRateLimiter", None]:
+        """
+        동시 요청 슬롯과 토큰을 얻은 뒤 요청을 실행합니다.
+        응답은 record()로 알려줍니다.
+        """
+        await self._acquire_slot()
+        try:
+            while (wait := self.try_acquire()) > 0:
+                await asyncio.sleep(wait)
+            yield self
+        finally:
+            self._release_slot()
+
+    def record(self, status_code: int, retry_after: float | None = None) -> None:
+        """응답 상태 코드를 반영해 동시 요청 수와 요청 속도를 조절합니다."""
+        with self._lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                self._successes = 0
+                self.concurrency = max(1, self.concurrency // 2)
+                self._bucket.set_rate(max(self.min_rate, self.rate / 2))
+                pause = retry_after if retry_after is not None else self.cooldown
+                self._bucket.pause(pause)
+                logger.warning(
+                    f"{status_code} 응답: 동시 요청 {self.concurrency}개, "
+                    f"초당 {self.rate:.2f}회로 낮추고 {pause:.1f}초 대기"
+                )
+                return
+            self._successes += 1
+            if self._successes >= self.concurrency:
+                self._successes = 0
+                self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+                self._bucket.set_rate(min(self.max_rate, self.rate * 1.5))
+        # 한도가 늘었으면 대기 중인 요청을 깨움
+        self._wake_waiters()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 단위)를 숫자로 변환합니다. HTTP 날짜 형식은 무시합니다."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+_host_rate_limiters: dict[str, HostRateLimiter] = {}
+_host_rate_limiters_lock = threading.Lock()
+
+
+def get_host_rate_limiter(url: str) -> HostRateLimiter:
+    """
+    URL 호스트별 프로세스 전역 HostRateLimiter를 반환합니다.
+    설정은 settings.CRAWL_* 기본값을 사용하며,
+    CRAWL_HOST_RATE_LIMITS로 호스트별 초당 요청 수를 지정할 수 있습니다.
+    """
+    host = urlsplit(url).netloc
+    with _host_rate_limiters_lock:
+        rate_limiter = _host_rate_limiters.get(host)
+        if rate_limiter is None:
+            rate_limiter = HostRateLimiter(
+                rate=settings.CRAWL_HOST_RATE_LIMITS.get(
+                    host, settings.CRAWL_RATE_PER_SECOND
+                ),
+                burst=settings.CRAWL_BURST,
+                max_concurrency=settings.CRAWL_MAX_CONCURRENCY,
+                cooldown=settings.CRAWL_THROTTLE_COOLDOWN_SECONDS,
+            )
+            _host_rate_limiters[host] = rate_limiter
+        return rate_limiter
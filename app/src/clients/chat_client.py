@@ -1,19 +1,64 @@
-from collections.abc import Generator
+import asyncio
+from collections.abc import AsyncGenerator, Generator, Iterable
 
-from app.src.llm import LlmModels
-from app.src.models.message import Message
+from app.src.clients.completion_cache import (
+    CompletionCache,
+    make_cache_key,
+    replay_stream,
+)
+from app.src.llm import BatchRequest, BatchResult, LlmModels, TokenBudgeter
+from app.src.llm.batch import BatchHandler, iterate_in_background_loop
+from app.src.models.message_list import MessageSource
 
 
 class ChatClient:
     def __init__(
         self,
         llm_model: LlmModels,
-        messages: list[Message],
+        messages: MessageSource,
         model_name: str | None = None,
+        token_budgeter: TokenBudgeter | None = None,
+        completion_cache: CompletionCache | None = None,
     ):
         self.llm_model = llm_model
         self.model_name = model_name or llm_model.get_default_model_name()
         self.messages = messages
+        self.token_budgeter = token_budgeter or TokenBudgeter()
+        self.completion_cache = completion_cache
+
+    def _get_messages_in_budget(
+        self,
+        max_tokens: int,
+        messages: MessageSource | None = None,
+        model_name: str | None = None,
+    ) -> MessageSource:
+        """모델의 컨텍스트 윈도우를 넘지 않도록 오래된 메시지를 잘라냅니다."""
+        return self.token_budgeter.fit(
+            self.messages if messages is None else messages,
+            context_window=self.llm_model.get_context_window(
+                model_name or self.model_name
+            ),
+            max_tokens=max_tokens,
+        )
+
+    def _get_cache_key(
+        self,
+        messages: MessageSource,
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+        model_name: str | None = None,
+    ) -> str | None:
+        if self.completion_cache is None:
+            return None
+        return make_cache_key(
+            provider=self.llm_model.provider_name,
+            model_name=model_name or self.model_name,
+            messages=messages,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+        )
 
     def get_completion_stream(
         self,
@@ -23,15 +68,137 @@ class ChatClient:
     ) -> Generator[str, None, None]:
         """LLM 모델 객체에 스트리밍 생성을 위임하고 결과를 yield합니다."""
         try:
+            messages = self._get_messages_in_budget(max_tokens)
+            cache_key = self._get_cache_key(messages, temperature, max_tokens, top_p)
+            if cache_key:
+                cached = self.completion_cache.get(cache_key)
+                if cached is not None:
+                    yield from replay_stream(cached)
+                    return
+
             stream = self.llm_model.generate_completion_stream(
-                messages=self.messages,
+                messages=messages,
                 model_name=self.model_name,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 top_p=top_p,
             )
-            yield from stream
+            chunks: list[str] = []
+            for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+
+            # 끝까지 받은 응답만 캐시에 저장
+            if cache_key:
+                self.completion_cache.set(cache_key, "".join(chunks))
 
         except Exception as e:
             print(f"ChatClient에서 스트림 처리 중 예외 발생: {e}")
             raise
+
+    async def aget_completion_stream(
+        self,
+        temperature: float = 1.2,
+        max_tokens: int = 2500,
+        top_p: float = 0.95,
+    ) -> AsyncGenerator[str, None]:
+        """
+        get_completion_stream의 비동기 버전.
+        하나의 이벤트 루프에서 여러 스트림을 동시에 처리합니다.
+        """
+        try:
+            messages = self._get_messages_in_budget(max_tokens)
+            cache_key = self._get_cache_key(messages, temperature, max_tokens, top_p)
+            if cache_key:
+                # 디스크 캐시 I/O가 이벤트 루프를 막지 않도록 스레드에서 조회
+                cached = await asyncio.to_thread(self.completion_cache.get, cache_key)
+                if cached is not None:
+                    for chunk in replay_stream(cached):
+                        yield chunk
+                    return
+
+            stream = self.llm_model.agenerate_completion_stream(
+                messages=messages,
+                model_name=self.model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+            )
+            chunks: list[str] = []
+            async for chunk in stream:
+                chunks.append(chunk)
+                yield chunk
+
+            # 끝까지 받은 응답만 캐시에 저장
+            if cache_key:
+                await asyncio.to_thread(
+                    self.completion_cache.set, cache_key, "".join(chunks)
+                )
+
+        except Exception as e:
+            print(f"ChatClient에서 비동기 스트림 처리 중 예외 발생: {e}")
+            raise
+
+    def _prepare_batch_request(self, request: BatchRequest) -> BatchRequest:
+        """기본 모델 이름을 채우고 메시지를 토큰 예산에 맞게 자릅니다."""
+        model_name = request.model_name or self.model_name
+        messages = self._get_messages_in_budget(
+            request.max_tokens, messages=request.messages, model_name=model_name
+        )
+        return request.model_copy(
+            update={"model_name": model_name, "messages": messages}
+        )
+
+    async def _complete_with_cache(
+        self, request: BatchRequest, complete: BatchHandler
+    ) -> BatchResult:
+        """캐시에 있는 요청은 호출 없이 반환하고, 성공한 응답은 캐시에 저장합니다."""
+        cache_key = self._get_cache_key(
+            request.messages,
+            request.temperature,
+            request.max_tokens,
+            request.top_p,
+            model_name=request.model_name,
+        )
+        if cache_key:
+            cached = await asyncio.to_thread(self.completion_cache.get, cache_key)
+            if cached is not None:
+                return BatchResult(id=request.id, content=cached)
+        result = await complete(request)
+        if cache_key and result.error is None:
+            await asyncio.to_thread(
+                self.completion_cache.set, cache_key, result.content
+            )
+        return result
+
+    async def agenerate_batch(
+        self,
+        requests: Iterable[BatchRequest],
+        max_concurrency: int | None = None,
+        max_retries: int | None = None,
+    ) -> AsyncGenerator[BatchResult, None]:
+        """
+        여러 요청을 LLM 모델의 배치 API로 실행하고 완료되는 순서대로 결과를 반환합니다.
+        requests는 배치 API가 필요한 만큼만 읽으며,
+        캐시 조회와 저장은 요청마다 배치 작업 안에서 처리합니다.
+        """
+        async for result in self.llm_model.agenerate_batch(
+            map(self._prepare_batch_request, requests),
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            wrap_request=self._complete_with_cache,
+        ):
+            yield result
+
+    def generate_batch(
+        self,
+        requests: Iterable[BatchRequest],
+        max_concurrency: int | None = None,
+        max_retries: int | None = None,
+    ) -> Generator[BatchResult, None, None]:
+        """agenerate_batch의 동기 버전. 실행 중인 이벤트 루프 밖에서 호출해야 합니다."""
+        yield from iterate_in_background_loop(
+            self.agenerate_batch(
+                requests, max_concurrency=max_concurrency, max_retries=max_retries
+            )
+        )
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
+from pathlib import Path
+
+from app.src.core.logger import logger
+from app.src.models.message import Message
+from app.src.models.message_list import BaseMessageList, MessageSource, MessageWindow
+
+# 이 시간(초)보다 오래된 임시 파일은 쓰다가 중단된 것으로 보고 삭제
+STALE_TMP_FILE_SECONDS = 60
+
+
+def _normalize_message(msg: Message) -> tuple[str, str]:
+    return msg.role.value, msg.content.strip()
+
+
+def make_cache_key(
+    provider: str,
+    model_name: str,
+    messages: MessageSource,
+    temperature: float,
+    top_p: float,
+    max_tokens: int,
+) -> str:
+    """
+    요청 파라미터를 정규화한 해시 키를 생성합니다.
+    메시지 내용의 앞뒤 공백과 실수 파라미터의 미세한 차이는 같은 요청으로 취급합니다.
+    """
+    if isinstance(messages, BaseMessageList | MessageWindow):
+        normalized = messages.get_formatted("cache_key", _normalize_message)
+    else:
+        normalized = [_normalize_message(msg) for msg in messages]
+    payload = json.dumps(
+        {
+            "provider": provider,
+            "model_name": model_name,
+            "messages": normalized,
+            "temperature": round(temperature, 4),
+            "top_p": round(top_p, 4),
+            "max_tokens": max_tokens,
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def replay_stream(text: str, chunk_size: int = 256) -> Iterator[str]:
+    """캐시된 응답을 스트림처럼 나누어 반환합니다."""
+    for start in range(0, len(text), chunk_size):
+        yield text[start : start + chunk_size]
+
+
+class CompletionCache(ABC):
+    """완성된 LLM 응답을 저장하는 캐시 인터페이스."""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: str) -> None:
+        pass
+
+
+class MemoryCompletionCache(CompletionCache):
+    """TTL이 있는 인메모리 LRU 캐시."""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DiskCompletionCache(CompletionCache):
+    """
+    응답을 JSON 파일로 저장하는 디스크 캐시.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 100 * 1024 * 1024,
+        ttl: float = 24 * 3600,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # 파일 크기 인덱스 (오래 사용하지 않은 순서)
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        self._load_index()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _sweep_tmp_files(self) -> None:
+        """
+        쓰는 도중 중단되어 남은 임시 파일을 삭제합니다.
+        다른 프로세스가 쓰고 있을 수 있는 최근 파일은 남깁니다.
+        """
+        stale_before = time.time() - STALE_TMP_FILE_SECONDS
+        for path in self.directory.glob("*.tmp"):
+            try:
+                if path.stat().st_mtime < stale_before:
+                    path.unlink()
+            except OSError:
+                continue
+
+    def _load_index(self) -> None:
+        self._sweep_tmp_files()
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in files:
+            size = path.stat().st_size
+            self._index[path.stem] = size
+            self._total_bytes += size
+
+    def _remove(self, key: str) -> None:
+        size = self._index.pop(key, 0)
+        self._total_bytes -= size
+        self._path(key).unlink(missing_ok=True)
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            if key not in self._index:
+                return None
+            path = self._path(key)
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+                created_at, value = entry["created_at"], entry["value"]
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # 읽을 수 없거나 형식이 맞지 않는 항목은 캐시 미스로 처리
+                logger.warning(f"디스크 캐시 읽기 실패 {key}: {e!r}")
+                self._remove(key)
+                return None
+            if created_at + self.ttl < time.time():
+                self._remove(key)
+                return None
+            self._index.move_to_end(key)
+            os.utime(path)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        data = json.dumps(
+            {"created_at": time.time(), "value": value}, ensure_ascii=False
+        ).encode("utf-8")
+        with self._lock:
+            # 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+            self._total_bytes -= self._index.pop(key, 0)
+            self._index[key] = len(data)
+            self._total_bytes += len(data)
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                oldest_key = next(iter(self._index))
+                self._remove(oldest_key)
+
+
+class TieredCompletionCache(CompletionCache):
+    """
+    여러 캐시를 순서대로 조회합니다. (예: 메모리 -> 디스크)
+    하위 계층에서 찾은 값은 상위 계층에도 채워 넣습니다.
+    """
+
+    def __init__(self, *tiers: CompletionCache):
+        self.tiers = tiers
+
+    def get(self, key: str) -> str | None:
+        for index, tier in enumerate(self.tiers):
+            value = tier.get(key)
+            if value is not None:
+                for upper_tier in self.tiers[:index]:
+                    upper_tier.set(key, value)
+                return value
+        return None
+
+    def set(self, key: str, value: str) -> None:
+        for tier in self.tiers:
+            tier.set(key, value)
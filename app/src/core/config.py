@@ -9,13 +9,87 @@ class Settings(BaseSettings):
     GROK_API_KEY: str | None = None
     GOOGLE_API_KEY: str | None = None
 
+    # LLM 제공자 HTTP 커넥션 풀 설정 (프로세스 전역에서 공유)
+    LLM_HTTP2: bool = True
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_HTTP_TIMEOUT: float = 60.0
+
+    # 채팅 스트리밍 설정 (토큰을 모아 프레임 단위로 전송)
+    CHAT_STREAM_FLUSH_INTERVAL_MS: int = 50
+    CHAT_STREAM_MAX_FRAME_CHARS: int = 1024
+    # 채팅 요청 한 번에 허용하는 최대 출력 토큰 수
+    CHAT_MAX_TOKENS: int = 8192
+
+    # 채팅 응답 캐시 설정 (동일 요청의 응답 재사용, 디렉터리 설정 시 디스크 계층 사용)
+    CHAT_COMPLETION_CACHE_ENABLED: bool = False
+    CHAT_COMPLETION_CACHE_MAX_ENTRIES: int = 1024
+    CHAT_COMPLETION_CACHE_TTL_SECONDS: int = 3600
+    CHAT_COMPLETION_CACHE_DIR: str | None = None
+    CHAT_COMPLETION_CACHE_MAX_BYTES: int = 100 * 1024 * 1024
+
+    # 모델 이름 "auto" 요청 시 제공자 라우팅 설정
+    # (hedge: 첫 토큰이 늦으면 다른 제공자에 동시 요청)
+    CHAT_ROUTER_HEDGE_ENABLED: bool = False
+    CHAT_ROUTER_FAILURE_COOLDOWN_SECONDS: float = 30.0
+
+    # LLM 배치 실행 설정 (제공자별 제한은 JSON으로 지정, 예: {"grok": 60})
+    LLM_BATCH_MAX_CONCURRENCY: int = 8
+    LLM_BATCH_MAX_RETRIES: int = 3
+    LLM_RATE_LIMIT_RPM: dict[str, int] = {}
+    LLM_RATE_LIMIT_TPM: dict[str, int] = {}
+
+    # 모델별 토큰 단가 (USD / 100만 토큰, [입력, 출력]) - 지표의 예상 비용 계산에 사용
+    LLM_TOKEN_PRICES_PER_MILLION: dict[str, tuple[float, float]] = {}
+
     # JWT 비밀 키 (나중에 인증 추가 시 사용)
     SECRET_KEY: str = "a_very_secret_key_that_should_be_changed"
     REFRESH_TOKEN_SECRET_KEY: str
     EMAIL_SECRET_KEY: str
     PASSWORD_SECRET_KEY: str
     ALGORITHM: str = "HS256"
+
+    # bcrypt 해싱/검증 전용 스레드 수 (None이면 min(4, CPU 수))
+    PASSWORD_HASH_MAX_WORKERS: int | None = None
+    # bcrypt 작업 비용. app/calibrate_password_hash.py로 한 번 측정한 값을 저장해
+    # 모든 워커가 같은 비용 사용
+    PASSWORD_HASH_ROUNDS: int = 12
+    # 작업 비용 보정 시 목표 검증 시간 (ms)
+    PASSWORD_HASH_TARGET_MS: float = 250.0
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 리프레시 토큰 저장소
+    # ("database": refresh_tokens 테이블, "memory": 프로세스 메모리)
+    REFRESH_TOKEN_STORE_BACKEND: str = "database"
+    # 사용자당 유지하는 로그인 세션(기기) 수
+    REFRESH_TOKEN_MAX_SESSIONS: int = 10
+    # 만료된 리프레시 토큰 정리 주기 (0 이하면 정리하지 않음)
+    REFRESH_TOKEN_SWEEP_INTERVAL_SECONDS: float = 3600.0
+    # JWT 인코딩/디코딩 구현 ("jose": python-jose, "hmac": 표준 라이브러리 HS256 (선택))
+    JWT_BACKEND: str = "jose"
+    # 검증된 액세스 토큰 캐시 (같은 토큰의 JWT 디코딩 생략)
+    ACCESS_TOKEN_CACHE_ENABLED: bool = True
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES: int = 10_000
+    # 사용자 활성 상태 캐시
+    # (인증 요청마다의 DB 조회 생략, 다른 프로세스의 변경은 TTL 안에 반영)
+    USER_STATUS_CACHE_TTL_SECONDS: float = 30.0
+    USER_STATUS_CACHE_MAX_ENTRIES: int = 10_000
+    # 내 키워드 리스트 응답 캐시
+    # (ETag 조건부 요청 지원, 다른 프로세스의 변경은 TTL 안에 반영)
+    KEYWORD_LIST_CACHE_TTL_SECONDS: float = 30.0
+    KEYWORD_LIST_CACHE_MAX_ENTRIES: int = 10_000
+
+    # 핫딜 크롤링 호스트별 요청 제한
+    # (호스트별 초당 요청 수는 JSON으로 지정, 예: {"www.algumon.com": 1.0})
+    # 403/429/430 응답을 받으면 동시 요청 수와 속도를 줄이고, 성공이 이어지면 다시 늘림
+    CRAWL_RATE_PER_SECOND: float = 2.0
+    CRAWL_BURST: int = 2
+    CRAWL_MAX_CONCURRENCY: int = 5
+    CRAWL_THROTTLE_COOLDOWN_SECONDS: float = 5.0
+    CRAWL_HOST_RATE_LIMITS: dict[str, float] = {}
+    # 크롤링 HTML 파서
+    # ("stream": 상품 리스트만 읽는 표준 라이브러리 파서, "bs4": BeautifulSoup)
+    CRAWL_PARSER_BACKEND: str = "stream"
 
     # 개발/운영 환경 구분 (선택 사항)
     ENVIRONMENT: str = "local"
@@ -1,3 +1,4 @@
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
@@ -24,3 +25,14 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 Base = declarative_base()
+
+
+def dialect_insert(db: AsyncSession, table):
+    """
+    세션이 연결된 DB 방언의 INSERT 구문을 반환합니다.
+    ON CONFLICT(on_conflict_do_nothing/on_conflict_do_update)를 사용할 때 필요하며,
+    운영(PostgreSQL)과 테스트(SQLite) 모두 같은 코드로 동작합니다.
+    """
+    if db.bind.dialect.name == "postgresql":
+        return postgresql.insert(table)
+    return sqlite.insert(table)
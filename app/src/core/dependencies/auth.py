@@ -1,28 +1,42 @@
+import hashlib
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from fastapi import Cookie, Depends, Header, Response
-from jose import ExpiredSignatureError, JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.core.config import settings
 from app.src.core.dependencies.db_session import get_db
 from app.src.core.exceptions.auth_excptions import AuthErrors
+from app.src.core.token_codec import (
+    TokenError,
+    TokenExpiredError,
+    access_token_codec,
+    password_reset_token_codec,
+    refresh_token_codec,
+)
+from app.src.core.ttl_cache import TTLCache
+from app.src.domain.user.cache import user_status_cache
 from app.src.domain.user.enums import AuthLevel
 from app.src.domain.user.repositories import (
     check_user_active,
+    get_user_by_id,
     init_refresh_token,
+    revoke_refresh_token,
     save_refresh_token,
     verify_refresh_token,
 )
 from app.src.domain.user.schemas import AuthenticatedUser
 
-ALGORITHM = "HS256"
-
 # Annotated를 사용하여 DB 세션 의존성 타입 정의
 DBSession = Annotated[AsyncSession, Depends(get_db)]
 
+# 검증된 액세스 토큰 캐시 (토큰 SHA-256 -> AuthenticatedUser, 토큰 exp까지 유효)
+access_token_cache: TTLCache[bytes, AuthenticatedUser] = TTLCache(
+    max_entries=settings.ACCESS_TOKEN_CACHE_MAX_ENTRIES
+)
+
 
 async def create_access_token(
     user_id: UUID,
@@ -48,7 +62,7 @@ async def create_access_token(
         "auth_level": auth_level,
         "exp": expire,
     }
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=ALGORITHM)
+    return access_token_codec.encode(payload)
 
 
 async def create_refresh_token(
@@ -62,16 +76,17 @@ async def create_refresh_token(
     Refresh Token 생성 함수
     """
     user_id_str = str(user_id)
+    expires_at = datetime.now(UTC) + expires_delta
 
     payload = {
         "user_id": user_id_str,
         "email": email,
-        "exp": datetime.now(UTC) + expires_delta,
+        "exp": expires_at,
+        # 같은 시각에 발급된 토큰도 기기(세션)마다 구분되도록 고유 ID 포함
+        "jti": uuid4().hex,
     }
-    refresh_token = jwt.encode(
-        payload, settings.REFRESH_TOKEN_SECRET_KEY, algorithm=ALGORITHM
-    )
-    await save_refresh_token(db, user_id, refresh_token)
+    refresh_token = refresh_token_codec.encode(payload)
+    await save_refresh_token(db, user_id, refresh_token, expires_at)
 
     # 환경에 따라 secure, domain, samesite 속성 결정
     environment = settings.ENVIRONMENT
@@ -101,8 +116,16 @@ async def delete_refresh_token(
     db: AsyncSession,
     response: Response,
     user_id: UUID,
+    refresh_token: str | None = None,
 ) -> None:
-    await init_refresh_token(db, user_id)
+    """
+    리프레시 토큰 폐기 및 쿠키 삭제.
+    refresh_token이 주어지면 해당 기기의 세션만, 없으면 사용자의 모든 세션을 폐기합니다.
+    """
+    if refresh_token:
+        await revoke_refresh_token(db, user_id, refresh_token)
+    else:
+        await init_refresh_token(db, user_id)
 
     # 환경에 따라 secure, domain, samesite 속성 결정 (쿠키 생성 시와 동일한 로직 사용)
     environment = getattr(settings, "ENVIRONMENT", "development")
@@ -130,9 +153,30 @@ async def delete_refresh_token(
 
 
 async def _get_authenticated_user_from_token(token: str) -> AuthenticatedUser:
-    """Helper to decode and validate the access token payload."""
+    """
+    Helper to decode and validate the access token payload.
+    검증에 성공한 토큰은 exp까지 캐시해 같은 토큰의 재검증을 생략합니다.
+    반환된 AuthenticatedUser는 요청 간에 공유되므로 수정하지 않아야 합니다.
+    """
+    if not settings.ACCESS_TOKEN_CACHE_ENABLED:
+        return _decode_access_token(token)[0]
+
+    token_digest = hashlib.sha256(token.encode("utf-8")).digest()
+    cached_user = access_token_cache.get(token_digest)
+    if cached_user is not None:
+        return cached_user
+
+    authenticated_user, expires_at = _decode_access_token(token)
+    # exp가 없는 토큰은 유효 기간을 알 수 없으므로 캐시하지 않음
+    if expires_at is not None:
+        access_token_cache.set(token_digest, authenticated_user, expires_at=expires_at)
+    return authenticated_user
+
+
+def _decode_access_token(token: str) -> tuple[AuthenticatedUser, float | None]:
+    """액세스 토큰을 검증해 (사용자 정보, 만료 시각 timestamp)를 반환합니다."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        payload = access_token_codec.decode(token)
         user_id_str: str = payload.get("user_id")
         email: str = payload.get("email")
         nickname: str = payload.get("nickname")
@@ -157,22 +201,33 @@ async def _get_authenticated_user_from_token(token: str) -> AuthenticatedUser:
         except ValueError as e:
             raise AuthErrors.INVALID_TOKEN_PAYLOAD from e
 
-        return AuthenticatedUser(
+        authenticated_user = AuthenticatedUser(
             user_id=user_id_str, email=email, nickname=nickname, auth_level=auth_level
         )
-    except ExpiredSignatureError as e:
+        expires_at = payload.get("exp")
+        return authenticated_user, float(expires_at) if expires_at else None
+    except TokenExpiredError as e:
         raise AuthErrors.ACCESS_TOKEN_EXPIRED from e
-    except JWTError as e:
+    except TokenError as e:
         raise AuthErrors.INVALID_TOKEN from e
 
 
+async def _is_user_active(db: AsyncSession, user_id: UUID) -> bool:
+    """활성 상태를 캐시에서 조회하고, 없으면 DB에서 읽어 캐시합니다."""
+    is_active = user_status_cache.get(user_id)
+    if is_active is None:
+        is_active = await check_user_active(db, user_id)
+        user_status_cache.set(user_id, is_active)
+    return is_active
+
+
 async def _validate_user_status_and_level(
     db: DBSession, user: AuthenticatedUser, required_level: AuthLevel
 ):
     """Helper to check if a user is active and has the required auth level."""
     user_uuid = user.user_id
 
-    is_active_user = await check_user_active(db, user_uuid)
+    is_active_user = await _is_user_active(db, user_uuid)
     if not is_active_user:
         raise AuthErrors.USER_NOT_ACTIVE
 
@@ -210,22 +265,24 @@ async def authenticate_refresh_token(
     token = refresh_token
     try:
         # 토큰 검증 및 디코딩
-        payload = jwt.decode(
-            token, settings.REFRESH_TOKEN_SECRET_KEY, algorithms=[ALGORITHM]
-        )
+        payload = refresh_token_codec.decode(token)
         user_id = payload.get("user_id")
         email: str = payload.get("email")
 
         if user_id is None or email is None:
             raise AuthErrors.INVALID_TOKEN_PAYLOAD
 
-        # db에 저장된 리프레시 토큰과 비교
         try:
-            user = await verify_refresh_token(db, user_id, token)
-            if not user:
-                raise AuthErrors.INVALID_TOKEN
+            user_uuid = UUID(user_id)
         except ValueError as e:
-            raise AuthErrors.INVALID_TOKEN from e
+            raise AuthErrors.INVALID_TOKEN_PAYLOAD from e
+
+        # 저장소의 리프레시 토큰과 비교
+        if not await verify_refresh_token(db, user_uuid, token):
+            raise AuthErrors.INVALID_TOKEN
+        user = await get_user_by_id(db, user_uuid)
+        if not user:
+            raise AuthErrors.USER_NOT_FOUND
 
         # 인증된 사용자 정보 반환
         return AuthenticatedUser(
@@ -235,9 +292,9 @@ async def authenticate_refresh_token(
             auth_level=AuthLevel.USER,
         )
 
-    except ExpiredSignatureError as e:
+    except TokenExpiredError as e:
         raise AuthErrors.REFRESH_TOKEN_EXPIRED from e
-    except JWTError as e:
+    except TokenError as e:
         raise AuthErrors.INVALID_TOKEN from e
 
 
@@ -289,7 +346,7 @@ async def create_password_reset_token(
         "exp": datetime.now(UTC) + timedelta(minutes=5),
         "purpose": "password_reset",
     }
-    return jwt.encode(payload, settings.PASSWORD_SECRET_KEY, algorithm=ALGORITHM)
+    return password_reset_token_codec.encode(payload)
 
 
 async def verify_password_reset_token(
@@ -299,9 +356,7 @@ async def verify_password_reset_token(
     비밀번호 재설정 JWT 검증
     """
     try:
-        payload = jwt.decode(
-            token, settings.PASSWORD_SECRET_KEY, algorithms=[ALGORITHM]
-        )
+        payload = password_reset_token_codec.decode(token)
         user_id: int = payload.get("user_id")
         purpose: str = payload.get("purpose")
 
@@ -309,7 +364,7 @@ async def verify_password_reset_token(
             raise AuthErrors.INVALID_TOKEN
 
         return user_id
-    except ExpiredSignatureError as e:
+    except TokenExpiredError as e:
         raise AuthErrors.ACCESS_TOKEN_EXPIRED from e
-    except JWTError as e:
+    except TokenError as e:
         raise AuthErrors.INVALID_TOKEN from e
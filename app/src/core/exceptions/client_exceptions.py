@@ -31,3 +31,10 @@ class ClientErrors:
         detail="Invalid keyword title",
         description="INVALID KEYWORD TITLE",
     )
+
+    # 지원하지 않는 LLM 모델
+    UNSUPPORTED_LLM_MODEL = BaseHTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Unsupported LLM model",
+        description="UNSUPPORTED LLM MODEL",
+    )
@@ -32,6 +32,13 @@ class ServerErrors:
         description="INTERNAL SERVER ERROR",
     )
 
+    # 사용 가능한 LLM 제공자 없음 (API 키 미설정)
+    LLM_PROVIDER_UNAVAILABLE = BaseHTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="No LLM provider is configured",
+        description="Unavailable LLM Provider",
+    )
+
     # 알 수 없는 서버 오류
     UNKNOWN_SERVER_ERROR = BaseHTTPException(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,5 +1,20 @@
+import asyncio
+import math
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
 import bcrypt
 
+from app.src.core.config import settings
+from app.src.core.logger import logger
+
+T = TypeVar("T")
+
 
 def verify_password(
     plain_password: str,
@@ -13,9 +28,158 @@ def verify_password(
     )
 
 
-def hash_password(password: str) -> str:
+def hash_password(password: str, rounds: int | None = None) -> str:
     """
     비밀번호를 해싱하여 반환합니다.
+    작업 비용(rounds)을 지정하지 않으면 settings.PASSWORD_HASH_ROUNDS를 사용합니다.
     """
-    hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+    salt = bcrypt.gensalt(rounds=rounds or settings.PASSWORD_HASH_ROUNDS)
+    hashed = bcrypt.hashpw(password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
+
+
+def get_hash_rounds(hashed_password: str) -> int | None:
+    """bcrypt 해시("$2b$12$...")에 기록된 작업 비용을 반환합니다."""
+    try:
+        return int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    해시의 작업 비용이 현재 설정보다 낮으면 True를 반환합니다.
+    설정보다 높은 비용의 해시는 더 안전하므로 그대로 둡니다.
+    """
+    rounds = get_hash_rounds(hashed_password)
+    return rounds is None or rounds < settings.PASSWORD_HASH_ROUNDS
+
+
+def calibrate_bcrypt_rounds(
+    target_ms: float,
+    min_rounds: int = 10,
+    max_rounds: int = 16,
+    samples: int = 3,
+) -> int:
+    """
+    이 호스트에서 검증 시간이 target_ms를 넘지 않는 가장 큰 작업 비용을 찾습니다.
+    워커마다 다른 비용을 쓰지 않도록 배포 전에 한 번만 실행하고
+    (app/calibrate_password_hash.py), 결과는 PASSWORD_HASH_ROUNDS 설정에 저장합니다.
+    min_rounds로 측정한 시간에서
+    비용이 1 늘 때마다 시간이 두 배가 되는 것을 이용해 추정합니다.
+    """
+    hashed = bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=min_rounds))
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        bcrypt.checkpw(b"calibration", hashed)
+        timings.append((time.perf_counter() - started) * 1000)
+    base_ms = sorted(timings)[len(timings) // 2]
+
+    rounds = min_rounds + math.floor(math.log2(max(target_ms / base_ms, 1)))
+    rounds = max(min_rounds, min(max_rounds, rounds))
+    expected_ms = base_ms * 2 ** (rounds - min_rounds)
+    logger.info(
+        f"bcrypt 작업 비용 보정: 비용 {min_rounds}에서 {base_ms:.1f}ms, "
+        f"목표 {target_ms:.0f}ms -> 비용 {rounds} (예상 {expected_ms:.0f}ms)"
+    )
+    return rounds
+
+
+class PasswordHashExecutor:
+    """
+    bcrypt 연산 전용 스레드 풀.
+    bcrypt는 해싱 중 GIL을 해제하므로 스레드로도 병렬 처리되며,
+    작업자 수를 제한해 로그인 폭주 시에도 CPU를 모두 점유하지 않도록 합니다.
+    """
+
+    def __init__(self, max_workers: int | None = None, wait_window: int = 1000):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # 대기열 지표
+        self.pending = 0
+        self.running = 0
+        self.max_pending = 0
+        self.completed = 0
+        self._wait_seconds: deque[float] = deque(maxlen=wait_window)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="password-hash"
+                )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        submitted_at = time.monotonic()
+
+        def task() -> T:
+            with self._lock:
+                self.pending -= 1
+                self.running += 1
+                self._wait_seconds.append(time.monotonic() - submitted_at)
+            try:
+                return func(*args)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        executor = self._get_executor()
+        with self._lock:
+            self.pending += 1
+            self.max_pending = max(self.max_pending, self.pending)
+        future = executor.submit(task)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 아직 시작하지 않은 작업은 취소하고 대기열에서 제외
+            if future.cancel():
+                with self._lock:
+                    self.pending -= 1
+            raise
+
+    def stats(self) -> dict:
+        with self._lock:
+            waits = sorted(self._wait_seconds)
+        return {
+            "max_workers": self.max_workers,
+            "pending": self.pending,
+            "running": self.running,
+            "max_pending": self.max_pending,
+            "completed": self.completed,
+            "queue_wait_p50": waits[len(waits) // 2] if waits else None,
+            "queue_wait_p99": (
+                waits[min(len(waits) - 1, int(len(waits) * 0.99))] if waits else None
+            ),
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hash_executor = PasswordHashExecutor(settings.PASSWORD_HASH_MAX_WORKERS)
+
+
+async def verify_password_async(
+    plain_password: str,
+    hashed_password: str,
+) -> bool:
+    """
+    verify_password를 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+    return await password_hash_executor.run(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    hash_password를 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+    return await password_hash_executor.run(hash_password, password)
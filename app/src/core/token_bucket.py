@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    초당 refill_rate만큼 채워지는 토큰 버킷 (최대 capacity개).
+    - set_rate로 채우는 속도를 바꿀 수 있음 (이미 채워진 토큰은 이전 속도로 계산)
+    - pause 동안은 토큰을 채우지 않으며, 멈춤이 끝난 시점부터 다시 채움
+    상태는 스레드 락으로 보호해
+    여러 이벤트 루프(동기 배치 호출 등)에서 공유할 수 있습니다.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        # 멈춘 동안의 시간은 채우지 않음
+        # (멈춤이 끝나자마자 한꺼번에 요청이 나가지 않도록)
+        started_at = max(self._updated_at, self._paused_until)
+        if now > started_at:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - started_at) * self.refill_rate
+            )
+        self._updated_at = now
+
+    def try_acquire(self, amount: float = 1) -> float:
+        """
+        토큰을 차감하고 0을 반환합니다.
+        부족하면 차감하지 않고 기다려야 할 시간(초)을 반환합니다.
+        """
+        # 용량보다 큰 요청은 영원히 기다리지 않도록 용량만큼만 차감
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self._tokens >= amount:
+                self._tokens -= amount
+                return 0.0
+            return (amount - self._tokens) / self.refill_rate
+
+    async def acquire(self, amount: float = 1) -> None:
+        while (wait := self.try_acquire(amount)) > 0:
+            await asyncio.sleep(wait)
+
+    def set_rate(self, refill_rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.refill_rate = refill_rate
+
+    def pause(self, seconds: float) -> None:
+        """남은 토큰을 비우고 seconds초 동안 토큰을 내주지 않습니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._paused_until = max(self._paused_until, now + seconds)
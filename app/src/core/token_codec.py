@@ -0,0 +1,169 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import time
+from abc import ABC, abstractmethod
+from calendar import timegm
+from datetime import datetime
+from typing import Any
+
+from jose import ExpiredSignatureError, JWTError, jwt
+
+from app.src.core.config import settings
+
+ALGORITHM = "HS256"
+
+# 숫자 타임스탬프로 변환해 저장하는 시간 클레임 (python-jose와 동일)
+_TIME_CLAIMS = ("exp", "iat", "nbf")
+
+
+class TokenError(Exception):
+    """토큰이 유효하지 않을 때 발생하는 예외"""
+
+
+class TokenExpiredError(TokenError):
+    """토큰의 exp가 지났을 때 발생하는 예외"""
+
+
+class TokenCodec(ABC):
+    """
+    JWT 인코딩/디코딩 인터페이스.
+    구현체와 관계없이 같은 페이로드 형식을 사용합니다.
+    """
+
+    # 설정 및 벤치마크 출력에 사용하는 이름
+    name: str
+
+    @abstractmethod
+    def encode(self, payload: dict[str, Any]) -> str:
+        pass
+
+    @abstractmethod
+    def decode(self, token: str) -> dict[str, Any]:
+        """서명과 만료 시간을 검증하고 페이로드를 반환합니다. 실패 시 TokenError 발생"""
+        pass
+
+
+class JoseTokenCodec(TokenCodec):
+    """python-jose 기반 구현"""
+
+    name = "jose"
+
+    def __init__(self, secret_key: str, algorithm: str = ALGORITHM):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        # python-jose는 전달된 dict의 시간 클레임을 직접 변환하므로 복사본 전달
+        return jwt.encode(dict(payload), self.secret_key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except ExpiredSignatureError as e:
+            raise TokenExpiredError(str(e)) from e
+        except JWTError as e:
+            raise TokenError(str(e)) from e
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+class HmacTokenCodec(TokenCodec):
+    """
+    표준 라이브러리만 사용하는 HS256 전용 구현.
+    - 비밀 키로 초기화한 HMAC 객체를 미리 만들어 두고 호출마다 복사해 사용
+    - 헤더는 고정값이므로 인코딩 결과를 재사용
+    python-jose와 같은 형식의 토큰을 만들고 서로의 토큰을 검증할 수 있습니다.
+    기본값은 python-jose이며, 이 구현은 JWT_BACKEND="hmac"으로 지정할 때만 사용합니다.
+    """
+
+    name = "hmac"
+
+    def __init__(self, secret_key: str):
+        self._hmac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+        self._header = _b64encode(
+            json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode(
+                "utf-8"
+            )
+        )
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, payload: dict[str, Any]) -> str:
+        claims = dict(payload)
+        for claim in _TIME_CLAIMS:
+            if isinstance(claims.get(claim), datetime):
+                claims[claim] = timegm(claims[claim].utctimetuple())
+        body = _b64encode(
+            json.dumps(claims, separators=(",", ":"), default=str).encode("utf-8")
+        )
+        signing_input = self._header + b"." + body
+        signature = _b64encode(self._sign(signing_input))
+        return (signing_input + b"." + signature).decode("ascii")
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            token_bytes = token.encode("ascii")
+            signing_input, signature = token_bytes.rsplit(b".", 1)
+            header_segment, payload_segment = signing_input.split(b".")
+            if not hmac.compare_digest(
+                self._sign(signing_input), _b64decode(signature)
+            ):
+                raise TokenError("Signature verification failed.")
+            header = json.loads(_b64decode(header_segment))
+            payload = json.loads(_b64decode(payload_segment))
+        except (ValueError, UnicodeError, binascii.Error) as e:
+            raise TokenError("Invalid token.") from e
+
+        if not isinstance(header, dict) or header.get("alg") != ALGORITHM:
+            raise TokenError("The specified alg value is not allowed")
+        if not isinstance(payload, dict):
+            raise TokenError("Invalid payload.")
+
+        now = time.time()
+        exp = payload.get("exp")
+        if exp is not None:
+            if not isinstance(exp, int | float):
+                raise TokenError("Expiration Time claim (exp) must be an integer.")
+            if exp < now:
+                raise TokenExpiredError("Signature has expired.")
+        nbf = payload.get("nbf")
+        if nbf is not None:
+            if not isinstance(nbf, int | float):
+                raise TokenError("Not Before claim (nbf) must be an integer.")
+            if nbf > now:
+                raise TokenError("The token is not yet valid (nbf)")
+        return payload
+
+
+TOKEN_CODECS: dict[str, type[TokenCodec]] = {
+    JoseTokenCodec.name: JoseTokenCodec,
+    HmacTokenCodec.name: HmacTokenCodec,
+}
+
+
+def create_token_codec(secret_key: str, backend: str | None = None) -> TokenCodec:
+    """settings.JWT_BACKEND(기본 jose)에 해당하는 코덱을 생성합니다."""
+    backend = backend or settings.JWT_BACKEND
+    try:
+        codec_class = TOKEN_CODECS[backend]
+    except KeyError as e:
+        raise ValueError(f"Unknown JWT backend: {backend}") from e
+    return codec_class(secret_key)
+
+
+# 시작 시 한 번만 키를 준비해 두는 용도별 코덱
+access_token_codec = create_token_codec(settings.SECRET_KEY)
+refresh_token_codec = create_token_codec(settings.REFRESH_TOKEN_SECRET_KEY)
+password_reset_token_codec = create_token_codec(settings.PASSWORD_SECRET_KEY)
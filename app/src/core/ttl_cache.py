@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache[K, V]:
+    """
+    항목별 만료 시각이 있는 LRU 캐시.
+    - 만료 시각은 time.time() 기준 (JWT exp 등 절대 시각을 그대로 사용하기 위함)
+    - max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 조회 적중/실패 횟수를 기록
+    """
+
+    def __init__(self, max_entries: int = 10_000, ttl: float | None = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V, expires_at: float | None = None) -> None:
+        """expires_at을 지정하지 않으면 기본 ttl만큼 보관합니다."""
+        if expires_at is None:
+            if self.ttl is None:
+                raise ValueError("expires_at or ttl is required")
+            expires_at = time.time() + self.ttl
+        elif self.ttl is not None:
+            expires_at = min(expires_at, time.time() + self.ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else None,
+            }
@@ -1,7 +1,12 @@
+from typing import Annotated
+
 from fastapi import APIRouter, BackgroundTasks, Depends, status
 
-from app.src.core.dependencies.auth import authenticate_admin_user
+from app.src.core.dependencies.auth import access_token_cache, authenticate_admin_user
+from app.src.core.security import password_hash_executor
+from app.src.domain.user.cache import user_status_cache
 from app.src.domain.user.schemas import AuthenticatedUser
+from app.src.llm.metrics import llm_metrics
 from app.worker_main import job
 
 router = APIRouter(
@@ -26,3 +31,46 @@ async def trigger_hotdeal_search(
     """
     background_tasks.add_task(job)
     return {"message": "핫딜 검색 작업이 백그라운드에서 시작되었습니다."}
+
+
+@router.get(
+    "/llm/metrics",
+    summary="LLM 호출 지표를 조회합니다. (관리자 권한 필요)",
+)
+async def get_llm_metrics(
+    _: Annotated[AuthenticatedUser, Depends(authenticate_admin_user)],
+):
+    """
+    제공자/모델별 호출 수, 종료 사유, TTFT·토큰 간 지연·전체 소요 시간 백분위,
+    입력/출력 토큰 수, 초당 출력 토큰 수, 예상 비용을 반환합니다.
+    """
+    return {"models": llm_metrics.snapshot()}
+
+
+@router.get(
+    "/security/password-hash/metrics",
+    summary="비밀번호 해싱 스레드 풀의 대기열 지표를 조회합니다. (관리자 권한 필요)",
+)
+async def get_password_hash_metrics(
+    _: Annotated[AuthenticatedUser, Depends(authenticate_admin_user)],
+):
+    """
+    대기/실행 중인 bcrypt 작업 수, 최대 대기열 길이, 대기 시간 백분위를 반환합니다.
+    """
+    return password_hash_executor.stats()
+
+
+@router.get(
+    "/auth/cache/metrics",
+    summary="인증 캐시의 적중률을 조회합니다. (관리자 권한 필요)",
+)
+async def get_auth_cache_metrics(
+    _: Annotated[AuthenticatedUser, Depends(authenticate_admin_user)],
+):
+    """
+    캐시별 항목 수, 적중/실패 횟수, 적중률을 반환합니다.
+    """
+    return {
+        "access_token": access_token_cache.stats(),
+        "user_status": user_status_cache.stats(),
+    }
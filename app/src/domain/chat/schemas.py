@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+from app.src.core.config import settings
+from app.src.models.message import Message
+
+
+class ChatCompletionRequest(BaseModel):
+    messages: list[Message] = Field(min_length=1)
+    model_name: str | None = None
+    temperature: float = Field(default=1.2, ge=0, le=2)
+    max_tokens: int = Field(default=2500, gt=0, le=settings.CHAT_MAX_TOKENS)
+    top_p: float = Field(default=0.95, gt=0, le=1)
+
+
+class ChatCompletionChunk(BaseModel):
+    content: str
@@ -0,0 +1,144 @@
+import json
+from collections.abc import AsyncGenerator
+
+from app.src.clients.chat_client import ChatClient
+from app.src.clients.completion_cache import (
+    CompletionCache,
+    DiskCompletionCache,
+    MemoryCompletionCache,
+    TieredCompletionCache,
+)
+from app.src.core.config import settings
+from app.src.core.exceptions.client_exceptions import ClientErrors
+from app.src.core.exceptions.server_exceptions import ServerErrors
+from app.src.core.logger import logger
+from app.src.domain.chat.schemas import ChatCompletionChunk, ChatCompletionRequest
+from app.src.domain.chat.utils import coalesce_tokens, format_sse
+from app.src.llm import GeminiModels, GrokModels, LlmModels, RouterModels
+from app.src.llm.router import AUTO_MODEL_NAME
+
+# 모델 이름 조회 순서대로 나열
+LLM_MODEL_CLASSES: tuple[type[LlmModels], ...] = (GrokModels, GeminiModels)
+
+_completion_cache: CompletionCache | None = None
+_router_models: RouterModels | None = None
+
+
+def get_completion_cache() -> CompletionCache | None:
+    """설정에 따라 프로세스 전역 응답 캐시를 생성해 반환합니다."""
+    global _completion_cache
+    if not settings.CHAT_COMPLETION_CACHE_ENABLED:
+        return None
+    if _completion_cache is None:
+        memory_cache = MemoryCompletionCache(
+            max_entries=settings.CHAT_COMPLETION_CACHE_MAX_ENTRIES,
+            ttl=settings.CHAT_COMPLETION_CACHE_TTL_SECONDS,
+        )
+        if settings.CHAT_COMPLETION_CACHE_DIR:
+            _completion_cache = TieredCompletionCache(
+                memory_cache,
+                DiskCompletionCache(
+                    directory=settings.CHAT_COMPLETION_CACHE_DIR,
+                    max_bytes=settings.CHAT_COMPLETION_CACHE_MAX_BYTES,
+                    ttl=settings.CHAT_COMPLETION_CACHE_TTL_SECONDS,
+                ),
+            )
+        else:
+            _completion_cache = memory_cache
+    return _completion_cache
+
+
+def _get_configured_models() -> list[LlmModels]:
+    """API 키가 설정된 제공자만 생성해 반환합니다."""
+    llm_models = []
+    for model_class in LLM_MODEL_CLASSES:
+        try:
+            llm_models.append(model_class())
+        except ValueError:
+            # API 키가 설정되지 않은 제공자는 건너뜀
+            continue
+    return llm_models
+
+
+def get_router_models() -> RouterModels:
+    """
+    설정된 제공자의 기본 모델을 묶은 프로세스 전역 라우터를 반환합니다.
+    지연 시간/오류율 통계를 요청 간에 유지하기 위해 한 번만 생성합니다.
+    """
+    global _router_models
+    if _router_models is None:
+        llm_models = _get_configured_models()
+        if not llm_models:
+            raise ServerErrors.LLM_PROVIDER_UNAVAILABLE
+        _router_models = RouterModels(
+            routes=[(llm_model, None) for llm_model in llm_models],
+            hedge=settings.CHAT_ROUTER_HEDGE_ENABLED,
+            failure_cooldown=settings.CHAT_ROUTER_FAILURE_COOLDOWN_SECONDS,
+        )
+    return _router_models
+
+
+def get_llm_model(model_name: str | None) -> tuple[LlmModels, str]:
+    """
+    모델 이름을 지원하는 LLM 제공자를 찾아 (제공자, 모델 이름)을 반환합니다.
+    모델 이름이 없으면 설정된 첫 번째 제공자의 기본 모델을 사용하고,
+    "auto"이면 가장 빠르고 정상인 제공자를 고르는 라우터를 사용합니다.
+    """
+    if model_name == AUTO_MODEL_NAME:
+        return get_router_models(), AUTO_MODEL_NAME
+
+    llm_models = _get_configured_models()
+    for llm_model in llm_models:
+        if model_name is None:
+            return llm_model, llm_model.get_default_model_name()
+        if model_name in llm_model.get_supported_models():
+            return llm_model, model_name
+
+    if not llm_models:
+        raise ServerErrors.LLM_PROVIDER_UNAVAILABLE
+    raise ClientErrors.UNSUPPORTED_LLM_MODEL
+
+
+async def create_completion_stream(
+    request: ChatCompletionRequest,
+) -> AsyncGenerator[str, None]:
+    """
+    요청을 검증하고 SSE 프레임을 생성하는 스트림을 반환합니다.
+    스트리밍 응답이 시작되기 전에 오류가 발생하도록 제공자 조회는 여기서 수행합니다.
+    """
+    llm_model, model_name = get_llm_model(request.model_name)
+    chat_client = ChatClient(
+        llm_model=llm_model,
+        messages=request.messages,
+        model_name=model_name,
+        completion_cache=get_completion_cache(),
+    )
+    return _stream_sse_frames(chat_client, request)
+
+
+async def _stream_sse_frames(
+    chat_client: ChatClient,
+    request: ChatCompletionRequest,
+) -> AsyncGenerator[str, None]:
+    token_stream = chat_client.aget_completion_stream(
+        temperature=request.temperature,
+        max_tokens=request.max_tokens,
+        top_p=request.top_p,
+    )
+    try:
+        async for frame in coalesce_tokens(
+            token_stream,
+            flush_interval=settings.CHAT_STREAM_FLUSH_INTERVAL_MS / 1000,
+            max_chars=settings.CHAT_STREAM_MAX_FRAME_CHARS,
+        ):
+            yield format_sse(ChatCompletionChunk(content=frame).model_dump_json())
+    except Exception as e:
+        # 응답 헤더가 이미 전송되었으므로 오류를 이벤트로 알림
+        logger.error(f"채팅 스트림 처리 중 오류 발생: {e}")
+        yield format_sse(
+            json.dumps({"detail": "LLM stream failed"}),
+            event="error",
+        )
+        return
+
+    yield format_sse("[DONE]")
@@ -0,0 +1,82 @@
+import asyncio
+import contextlib
+from collections.abc import AsyncGenerator, AsyncIterable
+
+
+def format_sse(data: str, event: str | None = None) -> str:
+    """Server-Sent Events 프레임 문자열을 생성합니다."""
+    frame = f"event: {event}\n" if event else ""
+    # 여러 줄 데이터는 줄마다 data: 접두사를 붙여야 함
+    frame += "".join(f"data: {line}\n" for line in data.split("\n"))
+    return frame + "\n"
+
+
+async def coalesce_tokens(
+    stream: AsyncIterable[str],
+    flush_interval: float,
+    max_chars: int,
+) -> AsyncGenerator[str, None]:
+    """
+    잘게 쪼개진 토큰을 모아 flush_interval(초) 단위의 프레임으로 합칩니다.
+    - 첫 토큰은 지연 없이 바로 내보냄 (첫 토큰 지연 최소화)
+    - 버퍼가 max_chars 이상이면 즉시 내보냄
+    - 다음 토큰이 늦어지더라도 interval이 지나면 모인 내용을 내보냄
+    소비자가 프레임을 가져가야 다음 토큰을 읽으므로
+    느린 클라이언트에 자연스럽게 backpressure가 걸립니다.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = aiter(stream)
+    buffer: list[str] = []
+    buffered_chars = 0
+    first_token = True
+    last_flush = loop.time()
+    pending: asyncio.Future | None = None
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(anext(iterator))
+
+            timeout = None
+            if buffer:
+                timeout = max(0.0, last_flush + flush_interval - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+            if not done:
+                # interval이 지났지만 다음 토큰이 아직 오지 않음 -> 모인 내용 flush
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                last_flush = loop.time()
+                continue
+
+            future, pending = pending, None
+            try:
+                token = future.result()
+            except StopAsyncIteration:
+                break
+
+            buffer.append(token)
+            buffered_chars += len(token)
+            if (
+                first_token
+                or buffered_chars >= max_chars
+                or loop.time() - last_flush >= flush_interval
+            ):
+                first_token = False
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+                last_flush = loop.time()
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        # 클라이언트 연결이 끊긴 경우 진행 중인 upstream 읽기를 정리
+        if pending is not None:
+            pending.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await pending
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -0,0 +1,51 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
+
+from app.src.core.dependencies.auth import registered_user
+from app.src.core.exceptions.auth_excptions import AuthErrors
+from app.src.core.exceptions.client_exceptions import ClientErrors
+from app.src.core.exceptions.server_exceptions import ServerErrors
+from app.src.domain.chat.schemas import ChatCompletionRequest
+from app.src.domain.chat.services import create_completion_stream
+from app.src.domain.user.schemas import AuthenticatedUser
+from app.src.utils.swsagger_helper import create_responses
+
+router = APIRouter(prefix="/v1", tags=["chat"])
+
+
+# 채팅 응답 스트리밍
+@router.post(
+    "/completions",
+    status_code=status.HTTP_200_OK,
+    summary="채팅 응답 스트리밍 (SSE)",
+    response_class=StreamingResponse,
+    responses=create_responses(
+        AuthErrors.INVALID_TOKEN,
+        AuthErrors.INVALID_TOKEN_PAYLOAD,
+        ClientErrors.UNSUPPORTED_LLM_MODEL,
+        ServerErrors.LLM_PROVIDER_UNAVAILABLE,
+    ),
+)
+async def post_completions(
+    request: ChatCompletionRequest,
+    login_user: Annotated[AuthenticatedUser, Depends(registered_user)],
+) -> StreamingResponse:
+    """
+    LLM 응답을 Server-Sent Events로 스트리밍합니다.
+
+    - 각 프레임: `data: {"content": "..."}`
+    - 종료: `data: [DONE]`
+    - 스트리밍 중 오류: `event: error`
+    """
+    stream = await create_completion_stream(request)
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            # 리버스 프록시의 응답 버퍼링 비활성화
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -0,0 +1,32 @@
+import hashlib
+from typing import NamedTuple
+from uuid import UUID
+
+from app.src.core.config import settings
+from app.src.core.ttl_cache import TTLCache
+
+
+class KeywordListSnapshot(NamedTuple):
+    """직렬화된 내 키워드 리스트와 그 내용 해시(ETag)"""
+
+    etag: str
+    body: bytes
+
+
+def make_keyword_list_snapshot(body: bytes) -> KeywordListSnapshot:
+    # 내용 해시를 ETag로 사용하므로 프로세스가 달라도 같은 리스트면 같은 ETag
+    return KeywordListSnapshot(f'"{hashlib.sha256(body).hexdigest()[:32]}"', body)
+
+
+# 사용자별 키워드 리스트 캐시 (user_id -> KeywordListSnapshot)
+# 등록/해제 시 invalidate_keyword_list로 즉시 제거하고,
+# 다른 프로세스의 변경은 TTL 안에 반영됨
+keyword_list_cache: TTLCache[UUID, KeywordListSnapshot] = TTLCache(
+    max_entries=settings.KEYWORD_LIST_CACHE_MAX_ENTRIES,
+    ttl=settings.KEYWORD_LIST_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_keyword_list(user_id: UUID) -> None:
+    """사용자의 키워드 구독이 바뀌었을 때 캐시된 리스트를 제거합니다."""
+    keyword_list_cache.delete(user_id)
@@ -0,0 +1,142 @@
+import json
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.repositories import (
+    select_keyword_sites,
+    upsert_keyword_sites,
+)
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+
+# 키워드별로 기억하는 최근 핫딜 ID 수 (검색 결과 한 페이지보다 넉넉하게)
+SEEN_IDS_MAX_ENTRIES = 200
+
+
+class KeywordCrawlState(NamedTuple):
+    """키워드의 사이트별 크롤링 상태"""
+
+    # 가장 최근에 확인한 핫딜 ID
+    external_id: str
+    # 최근에 확인한 핫딜 ID (최신순). seen_ids 컬럼 추가 전에 저장된 행이면 None
+    seen_ids: list[str] | None
+    # 이번 주기에 발견한 가장 최신 핫딜 (저장 대기)
+    newest_product: CrawledKeyword | None = None
+
+
+def _find_new_deals_by_cursor(
+    external_id: str,
+    latest_products: list[CrawledKeyword],
+) -> list[CrawledKeyword]:
+    """
+    마지막으로 확인한 핫딜보다 앞에 있는 핫딜을 반환합니다.
+    (seen_ids가 없는 기존 행용)
+    """
+    try:
+        last_crawled_index = [p.id for p in latest_products].index(external_id)
+        return latest_products[:last_crawled_index]
+    except ValueError:
+        # 마지막으로 크롤링된 핫딜이 목록에 없으면 전부 새로운 핫딜로 간주
+        return latest_products
+
+
+class CrawlStateManager:
+    """
+    한 크롤링 주기 동안의 키워드별 크롤링 상태(KeywordSite).
+    주기 시작 시 한 번의 쿼리로 불러와 메모리에서 비교하고,
+    바뀐 상태는 flush()에서 한 번의 일괄 upsert로 저장합니다.
+    """
+
+    def __init__(self, states: dict[tuple[int, SiteName], KeywordCrawlState]):
+        # (keyword_id, site_name) -> 크롤링 상태
+        self._states = states
+        # 이번 주기에 바뀐 상태 (저장 대기)
+        self._changed: set[tuple[int, SiteName]] = set()
+
+    @classmethod
+    async def load(
+        cls,
+        db: AsyncSession,
+        keyword_ids: list[int],
+    ) -> "CrawlStateManager":
+        keyword_sites = await select_keyword_sites(db, keyword_ids)
+        return cls(
+            {
+                (site.keyword_id, site.site_name): KeywordCrawlState(
+                    external_id=site.external_id,
+                    seen_ids=json.loads(site.seen_ids) if site.seen_ids else None,
+                )
+                for site in keyword_sites
+            }
+        )
+
+    def find_new_deals(
+        self,
+        keyword_id: int,
+        site_name: SiteName,
+        latest_products: list[CrawledKeyword],
+    ) -> list[CrawledKeyword]:
+        """
+        최신 핫딜 목록에서 최근에 확인한 적 없는 핫딜만 반환합니다.
+        확인한 ID 목록과 비교하므로,
+        이전에 본 글 하나가 삭제되어도 나머지를 다시 알리지 않습니다.
+        새로운 핫딜이 있으면 최신 목록의 ID를 확인한 ID로 기록합니다. (저장은 flush에서)
+        """
+        if not latest_products:
+            return []
+
+        key = (keyword_id, site_name)
+        state = self._states.get(key)
+        if state is None:
+            # 첫 크롤링인 경우, 최신 1개만 새로운 핫딜로 간주
+            new_deals = latest_products[:1]
+            previous_seen_ids: list[str] = []
+        elif state.seen_ids is None:
+            new_deals = _find_new_deals_by_cursor(state.external_id, latest_products)
+            previous_seen_ids = [state.external_id]
+        else:
+            seen = set(state.seen_ids)
+            new_deals = [p for p in latest_products if p.id not in seen]
+            previous_seen_ids = state.seen_ids
+
+        if new_deals:
+            # 최신 목록의 ID를 앞에 두고, 그 외의 이전 ID는 최근 것부터 남김
+            latest_ids = [p.id for p in latest_products]
+            latest_id_set = set(latest_ids)
+            seen_ids = latest_ids + [
+                seen_id for seen_id in previous_seen_ids if seen_id not in latest_id_set
+            ]
+            self._states[key] = KeywordCrawlState(
+                external_id=new_deals[0].id,
+                seen_ids=seen_ids[:SEEN_IDS_MAX_ENTRIES],
+                newest_product=new_deals[0],
+            )
+            self._changed.add(key)
+        return new_deals
+
+    async def flush(self, db: AsyncSession) -> int:
+        """바뀐 상태를 일괄 저장하고 저장한 행 수를 반환합니다."""
+        if not self._changed:
+            return 0
+        now = datetime.now()
+        rows = []
+        for keyword_id, site_name in self._changed:
+            state = self._states[(keyword_id, site_name)]
+            newest_product = state.newest_product
+            rows.append(
+                {
+                    "keyword_id": keyword_id,
+                    "site_name": site_name,
+                    "external_id": newest_product.id,
+                    "link": newest_product.link,
+                    "price": newest_product.price,
+                    "meta_data": newest_product.meta_data,
+                    "seen_ids": json.dumps(state.seen_ids),
+                    "wdate": now,
+                }
+            )
+        saved = await upsert_keyword_sites(db, rows)
+        self._changed.clear()
+        return saved
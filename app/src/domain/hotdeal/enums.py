@@ -4,3 +4,14 @@ from enum import Enum
 class SiteName(Enum):
     ALGUMON = "algumon"
     FMKOREA = "fmKorea"
+
+
+class KeywordLinkStatus(Enum):
+    """내 키워드 등록/해제 결과"""
+
+    LINKED = "linked"
+    DUPLICATE = "duplicate"
+    LIMIT_EXCEEDED = "limit_exceeded"
+    UNLINKED = "unlinked"
+    NOT_FOUND = "not_found"
+    INVALID_TITLE = "invalid_title"
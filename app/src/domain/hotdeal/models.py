@@ -44,6 +44,8 @@ class KeywordSite(Base):
     link = Column(String, nullable=True)
     price = Column(String, nullable=True)
     meta_data = Column(Text, nullable=True)
+    # 최근에 확인한 핫딜 ID 목록 (JSON 배열, 최신순, 최대 SEEN_IDS_MAX_ENTRIES개)
+    seen_ids = Column(Text, nullable=True)
     wdate = Column(DateTime, default=lambda: datetime.now(), nullable=False)
 
     keyword = relationship("Keyword", back_populates="sites")
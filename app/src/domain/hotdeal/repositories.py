@@ -1,59 +1,79 @@
 from uuid import UUID
 
-from sqlalchemy import delete, func, insert, select
+from sqlalchemy import delete, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import exists
 
-from app.src.domain.hotdeal.models import Keyword
+from app.src.core.database import dialect_insert
+from app.src.domain.hotdeal.cache import invalidate_keyword_list
+from app.src.domain.hotdeal.enums import KeywordLinkStatus
+from app.src.domain.hotdeal.models import Keyword, KeywordSite
 from app.src.domain.user.models import User, user_keywords
 
 
-# 새로운 키워드 등록
-async def create_keyword(
+# 같은 사용자의 키워드 변경 요청을 직렬화
+# (개수 제한을 정확히 지키기 위함, SQLite에서는 무시됨)
+async def _lock_user_keywords(
     db: AsyncSession,
-    title: str,
-) -> Keyword:
-    new_keyword = Keyword(title=title)
-    db.add(new_keyword)
-    await db.commit()
-    await db.refresh(new_keyword)
-    return new_keyword
+    user_id: UUID,
+) -> None:
+    await db.execute(select(User.id).where(User.id == user_id).with_for_update())
 
 
-# title을 받아서 키워드 조회
-async def get_keyword_by_title(
+# 키워드 등록(없으면 생성)과 내 키워드 연결을 한 트랜잭션으로 처리
+async def upsert_and_link_keyword(
     db: AsyncSession,
+    user_id: UUID,
     title: str,
-) -> Keyword | None:
-    result = await db.execute(select(Keyword).filter(Keyword.title == title))
-    return result.scalar_one_or_none()
-
+    max_keywords: int,
+) -> tuple[int, KeywordLinkStatus]:
+    """
+    1. 일괄 등록과 같은 사용자 행 잠금으로 같은 사용자의 키워드 변경을 직렬화
+    2. INSERT ... ON CONFLICT (title) DO UPDATE ... RETURNING id 로 키워드 id 확보
+       (동시에 같은 키워드를 만들어도 한 행만 생성됨)
+    3. 내 키워드 수를 CTE로 계산해 max_keywords 미만일 때만 연결
+       (INSERT ... SELECT ... ON CONFLICT DO NOTHING RETURNING)
+    연결하지 못하면 롤백하므로 새로 만든 키워드가 남지 않습니다.
+    """
+    await _lock_user_keywords(db, user_id)
+    upsert_query = dialect_insert(db, Keyword).values(title=title)
+    upsert_query = upsert_query.on_conflict_do_update(
+        index_elements=[Keyword.title],
+        set_={"title": upsert_query.excluded.title},
+    ).returning(Keyword.id)
+    keyword_id: int = (await db.execute(upsert_query)).scalar_one()
 
-# 내 키워드 갯수 확인
-async def get_my_keyword_count(
-    db: AsyncSession,
-    user_id: UUID,
-) -> int:
-    result = await db.execute(
-        select(func.count(Keyword.id)).filter(Keyword.users.any(User.id == user_id))
+    my_keyword_count = (
+        select(func.count().label("count"))
+        .where(user_keywords.c.user_id == user_id)
+        .cte("my_keyword_count")
     )
-    return result.scalar_one_or_none()
-
-
-# 내 키워드 추가
-async def add_my_keyword(
-    db: AsyncSession,
-    user_id: UUID,
-    keyword_id: int,
-) -> None:
-    # 해당 키워드가 사용자의 키워드인지 먼저 확인
-    is_already_added = await is_my_keyword(db, user_id, keyword_id)
-    if is_already_added:
-        raise ValueError("이미 등록된 키워드입니다.")
+    link_query = (
+        dialect_insert(db, user_keywords)
+        .from_select(
+            ["user_id", "keyword_id"],
+            select(
+                literal(user_id, user_keywords.c.user_id.type),
+                literal(keyword_id, user_keywords.c.keyword_id.type),
+            ).where(my_keyword_count.c.count < max_keywords),
+        )
+        .on_conflict_do_nothing()
+        .returning(user_keywords.c.keyword_id)
+    )
+    linked = (await db.execute(link_query)).scalar_one_or_none()
+    if linked is not None:
+        await db.commit()
+        invalidate_keyword_list(user_id)
+        return keyword_id, KeywordLinkStatus.LINKED
 
-    insert_query = insert(user_keywords).values(user_id=user_id, keyword_id=keyword_id)
-    await db.execute(insert_query)
-    await db.commit()
+    # 연결 실패 시에만 원인 확인
+    status = (
+        KeywordLinkStatus.DUPLICATE
+        if await is_my_keyword(db, user_id, keyword_id)
+        else KeywordLinkStatus.LIMIT_EXCEEDED
+    )
+    await db.rollback()
+    return keyword_id, status
 
 
 # 내가 가지고 있는 키워드인지 조회
@@ -72,38 +92,207 @@ async def is_my_keyword(
     return result.scalar()
 
 
-# 내 키워드 연결 끊기
-async def unlink_user_keyword(
+# 구독자가 없는 키워드 조건 (keyword_ids를 주면 해당 키워드로 한정)
+def _orphan_keyword_ids(keyword_ids: list[int] | None = None):
+    query = select(Keyword.id).where(
+        ~exists().where(user_keywords.c.keyword_id == Keyword.id)
+    )
+    if keyword_ids is not None:
+        query = query.where(Keyword.id.in_(keyword_ids))
+    return query
+
+
+# 구독자가 없는 키워드와 크롤링 기록(KeywordSite) 삭제, 삭제한 키워드 수 반환
+async def _delete_orphan_keywords(
+    db: AsyncSession,
+    keyword_ids: list[int] | None = None,
+) -> int:
+    orphan_ids = _orphan_keyword_ids(keyword_ids)
+    # SQLite는 외래 키 CASCADE를 강제하지 않으므로 KeywordSite를 먼저 직접 삭제
+    await db.execute(delete(KeywordSite).where(KeywordSite.keyword_id.in_(orphan_ids)))
+    result = await db.execute(delete(Keyword).where(Keyword.id.in_(orphan_ids)))
+    return result.rowcount
+
+
+# 내 키워드 연결 끊기 + 구독자가 없어진 키워드 정리를 한 트랜잭션으로 처리
+async def unlink_and_delete_orphan_keyword(
     db: AsyncSession,
     user_id: UUID,
     keyword_id: int,
-) -> None:
-    delete_query = delete(user_keywords).where(
-        (user_keywords.c.user_id == user_id)
-        & (user_keywords.c.keyword_id == keyword_id)
+) -> bool:
+    """
+    DELETE ... RETURNING 으로 연결을 끊고,
+    다른 구독자가 없으면 키워드와 KeywordSite를 삭제합니다.
+    내 키워드가 아니었으면 False를 반환합니다.
+    """
+    unlinked = await db.execute(
+        delete(user_keywords)
+        .where(
+            (user_keywords.c.user_id == user_id)
+            & (user_keywords.c.keyword_id == keyword_id)
+        )
+        .returning(user_keywords.c.keyword_id)
     )
-    await db.execute(delete_query)
+    if unlinked.scalar_one_or_none() is None:
+        await db.rollback()
+        return False
+    await _delete_orphan_keywords(db, [keyword_id])
     await db.commit()
+    invalidate_keyword_list(user_id)
+    return True
 
 
-# 키워드가 사용중인지 확인
-async def is_keyword_used(
+# 구독자가 없는 키워드 일괄 정리 (주기 작업용)
+async def delete_orphan_keywords(
     db: AsyncSession,
-    keyword_id: int,
-) -> bool:
-    exists_query = select(exists().where(user_keywords.c.keyword_id == keyword_id))
-    result = await db.execute(exists_query)
-    return result.scalar()
+) -> int:
+    deleted = await _delete_orphan_keywords(db)
+    await db.commit()
+    return deleted
 
 
-# 키워드 삭제
-async def delete_keyword(
+# 여러 키워드를 등록(없으면 생성)하고 내 키워드로 연결 (커밋하지 않음)
+async def _link_keywords_by_titles(
     db: AsyncSession,
-    keyword_id: int,
-) -> None:
-    delete_query = delete(Keyword).where(Keyword.id == keyword_id)
-    await db.execute(delete_query)
+    user_id: UUID,
+    titles: list[str],
+    max_keywords: int,
+) -> dict[str, tuple[int, KeywordLinkStatus]]:
+    if not titles:
+        return {}
+    # 1. 키워드 일괄 upsert (정렬해 동시 요청 간 잠금 순서를 맞춤)
+    upsert_query = dialect_insert(db, Keyword).values(
+        [{"title": title} for title in sorted(titles)]
+    )
+    upsert_query = upsert_query.on_conflict_do_update(
+        index_elements=[Keyword.title],
+        set_={"title": upsert_query.excluded.title},
+    ).returning(Keyword.id, Keyword.title)
+    title_to_id: dict[str, int] = {
+        title: keyword_id for keyword_id, title in await db.execute(upsert_query)
+    }
+
+    # 2. 이미 연결된 키워드 조회 후 남은 자리만큼 요청 순서대로 연결
+    linked_query = select(user_keywords.c.keyword_id).where(
+        user_keywords.c.user_id == user_id
+    )
+    linked_ids = set((await db.execute(linked_query)).scalars().all())
+    available = max_keywords - len(linked_ids)
+
+    results: dict[str, tuple[int, KeywordLinkStatus]] = {}
+    to_link: list[int] = []
+    rejected: list[int] = []
+    for title in titles:
+        keyword_id = title_to_id[title]
+        if keyword_id in linked_ids:
+            results[title] = (keyword_id, KeywordLinkStatus.DUPLICATE)
+        elif len(to_link) < available:
+            to_link.append(keyword_id)
+            results[title] = (keyword_id, KeywordLinkStatus.LINKED)
+        else:
+            rejected.append(keyword_id)
+            results[title] = (keyword_id, KeywordLinkStatus.LIMIT_EXCEEDED)
+
+    if to_link:
+        await db.execute(
+            dialect_insert(db, user_keywords)
+            .values(
+                [
+                    {"user_id": user_id, "keyword_id": keyword_id}
+                    for keyword_id in to_link
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+    # 개수 초과로 연결하지 못한 키워드 중 이번에 새로 만든 것은 삭제
+    if rejected:
+        await _delete_orphan_keywords(db, rejected)
+    return results
+
+
+# 여러 키워드의 내 키워드 연결 해제 및 구독자가 없어진 키워드 정리 (커밋하지 않음)
+async def _unlink_keywords_by_titles(
+    db: AsyncSession,
+    user_id: UUID,
+    titles: list[str],
+) -> dict[str, tuple[int | None, KeywordLinkStatus]]:
+    if not titles:
+        return {}
+    keyword_rows = await db.execute(
+        select(Keyword.id, Keyword.title).where(Keyword.title.in_(titles))
+    )
+    title_to_id: dict[str, int] = {
+        title: keyword_id for keyword_id, title in keyword_rows
+    }
+    unlinked = await db.execute(
+        delete(user_keywords)
+        .where(
+            (user_keywords.c.user_id == user_id)
+            & (user_keywords.c.keyword_id.in_(title_to_id.values()))
+        )
+        .returning(user_keywords.c.keyword_id)
+    )
+    unlinked_ids = set(unlinked.scalars().all())
+    if unlinked_ids:
+        await _delete_orphan_keywords(db, list(unlinked_ids))
+
+    results: dict[str, tuple[int | None, KeywordLinkStatus]] = {}
+    for title in titles:
+        keyword_id = title_to_id.get(title)
+        status = (
+            KeywordLinkStatus.UNLINKED
+            if keyword_id in unlinked_ids
+            else KeywordLinkStatus.NOT_FOUND
+        )
+        results[title] = (keyword_id, status)
+    return results
+
+
+# 여러 키워드를 한 트랜잭션으로 내 키워드에 추가
+async def link_keywords_by_titles(
+    db: AsyncSession,
+    user_id: UUID,
+    titles: list[str],
+    max_keywords: int,
+) -> dict[str, tuple[int, KeywordLinkStatus]]:
+    await _lock_user_keywords(db, user_id)
+    results = await _link_keywords_by_titles(db, user_id, titles, max_keywords)
+    await db.commit()
+    invalidate_keyword_list(user_id)
+    return results
+
+
+# 여러 키워드를 한 트랜잭션으로 내 키워드에서 제거
+async def unlink_keywords_by_titles(
+    db: AsyncSession,
+    user_id: UUID,
+    titles: list[str],
+) -> dict[str, tuple[int | None, KeywordLinkStatus]]:
+    results = await _unlink_keywords_by_titles(db, user_id, titles)
     await db.commit()
+    invalidate_keyword_list(user_id)
+    return results
+
+
+# 내 키워드를 titles로 교체 (없는 것은 제거, 새로운 것은 추가)
+async def replace_keywords_by_titles(
+    db: AsyncSession,
+    user_id: UUID,
+    titles: list[str],
+    max_keywords: int,
+) -> dict[str, tuple[int | None, KeywordLinkStatus]]:
+    await _lock_user_keywords(db, user_id)
+    current_rows = await db.execute(
+        select(Keyword.title).where(Keyword.users.any(User.id == user_id))
+    )
+    desired = set(titles)
+    to_remove = [title for title in current_rows.scalars() if title not in desired]
+    results: dict[str, tuple[int | None, KeywordLinkStatus]] = {}
+    results.update(await _unlink_keywords_by_titles(db, user_id, to_remove))
+    results.update(await _link_keywords_by_titles(db, user_id, titles, max_keywords))
+    await db.commit()
+    invalidate_keyword_list(user_id)
+    return results
 
 
 # 유저의 키워드 리스트 조회 (이름으로 정렬)
@@ -118,3 +307,64 @@ async def select_users_keywords(
     )
     result = await db.execute(select_query)
     return result.scalars().all()
+
+
+# 키워드들의 사이트별 크롤링 상태 조회 (한 번의 쿼리)
+async def select_keyword_sites(
+    db: AsyncSession,
+    keyword_ids: list[int],
+) -> list[KeywordSite]:
+    if not keyword_ids:
+        return []
+    result = await db.execute(
+        select(KeywordSite).where(KeywordSite.keyword_id.in_(keyword_ids))
+    )
+    return result.scalars().all()
+
+
+# 크롤링 상태 일괄 저장 (INSERT ... ON CONFLICT DO UPDATE, chunk_size개씩)
+async def upsert_keyword_sites(
+    db: AsyncSession,
+    rows: list[dict],
+    chunk_size: int = 500,
+) -> int:
+    """
+    KeywordSite 행을 (keyword_id, site_name) 기준으로 일괄 저장하고
+    저장한 행 수를 반환합니다.
+    크롤링 도중 삭제된 키워드의 행은 외래 키 오류로 전체가 실패하지 않도록 제외합니다.
+    """
+    if not rows:
+        return 0
+    existing_ids = set(
+        (
+            await db.execute(
+                select(Keyword.id).where(
+                    Keyword.id.in_({row["keyword_id"] for row in rows})
+                )
+            )
+        )
+        .scalars()
+        .all()
+    )
+    rows = [row for row in rows if row["keyword_id"] in existing_ids]
+    for start in range(0, len(rows), chunk_size):
+        upsert_query = dialect_insert(db, KeywordSite).values(
+            rows[start : start + chunk_size]
+        )
+        upsert_query = upsert_query.on_conflict_do_update(
+            index_elements=[KeywordSite.keyword_id, KeywordSite.site_name],
+            set_={
+                column: upsert_query.excluded[column]
+                for column in (
+                    "external_id",
+                    "link",
+                    "price",
+                    "meta_data",
+                    "seen_ids",
+                    "wdate",
+                )
+            },
+        )
+        await db.execute(upsert_query)
+    await db.commit()
+    return len(rows)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.src.domain.hotdeal.enums import KeywordLinkStatus
 
 
 class CrawledKeyword(BaseModel):
@@ -16,3 +18,18 @@ class KeywordCreateRequest(BaseModel):
 class KeywordResponse(BaseModel):
     id: int
     title: str
+
+
+class KeywordBulkRequest(BaseModel):
+    titles: list[str] = Field(max_length=100)
+
+
+class KeywordBulkItemResult(BaseModel):
+    # 정규화된 키워드 (정규화 후 빈 문자열이면 입력값 그대로)
+    title: str
+    status: KeywordLinkStatus
+    id: int | None = None
+
+
+class KeywordBulkResponse(BaseModel):
+    results: list[KeywordBulkItemResult]
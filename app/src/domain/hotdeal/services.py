@@ -1,57 +1,54 @@
-import asyncio
 from uuid import UUID
 
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.src.core.database import AsyncSessionLocal
 from app.src.core.exceptions.client_exceptions import ClientErrors
+from app.src.core.logger import logger
+from app.src.domain.hotdeal.cache import (
+    KeywordListSnapshot,
+    keyword_list_cache,
+    make_keyword_list_snapshot,
+)
+from app.src.domain.hotdeal.enums import KeywordLinkStatus
 from app.src.domain.hotdeal.models import Keyword
 from app.src.domain.hotdeal.repositories import (
-    add_my_keyword,
-    create_keyword,
-    delete_keyword,
-    get_keyword_by_title,
-    get_my_keyword_count,
-    is_keyword_used,
-    is_my_keyword,
+    link_keywords_by_titles,
+    replace_keywords_by_titles,
     select_users_keywords,
-    unlink_user_keyword,
+    unlink_and_delete_orphan_keyword,
+    unlink_keywords_by_titles,
+    upsert_and_link_keyword,
+)
+from app.src.domain.hotdeal.schemas import (
+    KeywordBulkItemResult,
+    KeywordBulkResponse,
+    KeywordResponse,
 )
-from app.src.domain.hotdeal.schemas import KeywordResponse
 from app.src.domain.hotdeal.utils import normalize_keyword
 from app.src.domain.user.repositories import get_user_by_id
 from app.src.Infrastructure.mail.mail_manager import send_email
 
 router = APIRouter(prefix="/v1", tags=["hotdeal"])
 
+# 사용자당 등록 가능한 키워드 수
+MAX_KEYWORDS_PER_USER = 10
 
-async def register_keyword(
-    db: AsyncSession,
-    title: str,
-    user_id: UUID,
-) -> KeywordResponse:
-    # 키워드에서 공백 제거하고 소문자로 변환
-    title = normalize_keyword(title)
-    if len(title) == 0:
-        raise ClientErrors.INVALID_KEYWORD_TITLE
-    # 이미 존재하는 키워드인지 확인
-    keyword: Keyword | None = await get_keyword_by_title(db, title)
-    # 존재하지 않을 경우 키워드 등록
-    if keyword is None:
-        keyword = await create_keyword(db, title)
-    # 내 키워드 갯수 확인, 지금 이미 10개라면 추가 불가
-    my_keyword_count: int = await get_my_keyword_count(db, user_id)
-    if my_keyword_count >= 10:
-        raise ClientErrors.KEYWORD_COUNT_OVERFLOW
-    # 내 키워드로 등록
-    try:
-        await add_my_keyword(db, user_id, keyword.id)
-    except:
-        raise ClientErrors.DUPLICATE_KEYWORD_REGISTRATION
+_keyword_list_adapter = TypeAdapter(list[KeywordResponse])
 
-    # --- 백그라운드에서 이메일 발송 ---
-    user = await get_user_by_id(db, user_id)
-    if user:
+
+async def _send_keyword_registered_email(user_id: UUID, title: str) -> None:
+    """
+    키워드 등록 안내 메일 발송.
+    요청 세션은 응답 후 닫히므로 별도 세션으로 사용자를 조회합니다.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            user = await get_user_by_id(db, user_id)
+        if not user:
+            return
         subject = f"'{title}' 키워드가 등록되었습니다."
         body = f"""
         <html>
@@ -66,13 +63,36 @@ async def register_keyword(
         </body>
         </html>
         """
-        asyncio.create_task(
-            send_email(subject=subject, to=user.email, body=body, is_html=True)
-        )
+        await send_email(subject=subject, to=user.email, body=body, is_html=True)
+    except Exception as e:
+        logger.error(f"키워드 등록 메일 발송 실패 (user_id={user_id}): {e}")
+
+
+async def register_keyword(
+    db: AsyncSession,
+    title: str,
+    user_id: UUID,
+    background_tasks: BackgroundTasks,
+) -> KeywordResponse:
+    # 키워드에서 공백 제거하고 소문자로 변환
+    title = normalize_keyword(title)
+    if len(title) == 0:
+        raise ClientErrors.INVALID_KEYWORD_TITLE
+    # 키워드 등록(없으면 생성), 개수 확인, 내 키워드 연결을 한 번에 처리
+    keyword_id, status = await upsert_and_link_keyword(
+        db, user_id, title, MAX_KEYWORDS_PER_USER
+    )
+    if status is KeywordLinkStatus.LIMIT_EXCEEDED:
+        raise ClientErrors.KEYWORD_COUNT_OVERFLOW
+    if status is KeywordLinkStatus.DUPLICATE:
+        raise ClientErrors.DUPLICATE_KEYWORD_REGISTRATION
+
+    # --- 응답 후 백그라운드에서 이메일 발송 ---
+    background_tasks.add_task(_send_keyword_registered_email, user_id, title)
 
     return KeywordResponse(
-        id=keyword.id,
-        title=keyword.title,
+        id=keyword_id,
+        title=title,
     )
 
 
@@ -81,20 +101,117 @@ async def unlink_keyword(
     keyword_id: int,
     user_id: UUID,
 ) -> None:
-    # 내가 해당 키워드를 가지고 있는지 확인
-    has_keyword: bool = await is_my_keyword(db, user_id, keyword_id)
-    if not has_keyword:
+    # 연결을 끊고, 해당 키워드를 가진 사람이 없으면 키워드도 삭제한다.
+    unlinked: bool = await unlink_and_delete_orphan_keyword(db, user_id, keyword_id)
+    if not unlinked:
         raise ClientErrors.KEYWORD_NOT_FOUND
-    # 가지고 있다면 연결을 끊는다.
-    await unlink_user_keyword(db, user_id, keyword_id)
-    # 연결을 끊은 후 해당 키워드를 가지고 있는 사람이 있는지 확인
-    is_used: bool = await is_keyword_used(db, keyword_id)
-    # 사람이 없다면 키워드를 삭제한다.
-    if not is_used:
-        await delete_keyword(db, keyword_id)
     return
 
 
+def _normalize_titles(titles: list[str]) -> tuple[list[str], list[str]]:
+    """
+    (입력 순서를 유지한 정규화 키워드 목록(중복 제거), 결과 표시용 키워드 목록)을
+    반환합니다.
+    정규화 후 빈 문자열이 되는 입력은 결과 표시용 목록에만 원래 값으로 남습니다.
+    """
+    normalized_titles: list[str] = []
+    display_titles: list[str] = []
+    for raw_title in titles:
+        title = normalize_keyword(raw_title)
+        display_title = title or raw_title
+        if display_title in display_titles:
+            continue
+        display_titles.append(display_title)
+        if title:
+            normalized_titles.append(title)
+    return normalized_titles, display_titles
+
+
+def _make_bulk_response(
+    display_titles: list[str],
+    results: dict[str, tuple[int | None, KeywordLinkStatus]],
+) -> KeywordBulkResponse:
+    items = [
+        KeywordBulkItemResult(
+            title=title,
+            id=results[title][0] if title in results else None,
+            status=(
+                results[title][1]
+                if title in results
+                else KeywordLinkStatus.INVALID_TITLE
+            ),
+        )
+        for title in display_titles
+    ]
+    # 교체 시 제거된 키워드처럼 요청에 없던 항목은 뒤에 추가
+    items.extend(
+        KeywordBulkItemResult(title=title, id=keyword_id, status=status)
+        for title, (keyword_id, status) in results.items()
+        if title not in display_titles
+    )
+    return KeywordBulkResponse(results=items)
+
+
+def _notify_linked_keywords(
+    background_tasks: BackgroundTasks,
+    user_id: UUID,
+    results: dict[str, tuple[int | None, KeywordLinkStatus]],
+) -> None:
+    linked_titles = [
+        title
+        for title, (_, status) in results.items()
+        if status is KeywordLinkStatus.LINKED
+    ]
+    if linked_titles:
+        background_tasks.add_task(
+            _send_keyword_registered_email, user_id, ", ".join(linked_titles)
+        )
+
+
+async def register_keywords(
+    db: AsyncSession,
+    titles: list[str],
+    user_id: UUID,
+    background_tasks: BackgroundTasks,
+) -> KeywordBulkResponse:
+    """여러 키워드를 한 번에 등록하고 키워드별 결과를 반환합니다."""
+    normalized_titles, display_titles = _normalize_titles(titles)
+    results = await link_keywords_by_titles(
+        db, user_id, normalized_titles, MAX_KEYWORDS_PER_USER
+    )
+    _notify_linked_keywords(background_tasks, user_id, results)
+    return _make_bulk_response(display_titles, results)
+
+
+async def unlink_keywords(
+    db: AsyncSession,
+    titles: list[str],
+    user_id: UUID,
+) -> KeywordBulkResponse:
+    """여러 키워드를 한 번에 내 키워드에서 제거하고 키워드별 결과를 반환합니다."""
+    normalized_titles, display_titles = _normalize_titles(titles)
+    results = await unlink_keywords_by_titles(db, user_id, normalized_titles)
+    return _make_bulk_response(display_titles, results)
+
+
+async def replace_keywords(
+    db: AsyncSession,
+    titles: list[str],
+    user_id: UUID,
+    background_tasks: BackgroundTasks,
+) -> KeywordBulkResponse:
+    """
+    내 키워드 목록을 titles로 교체하고
+    키워드별 결과(제거된 키워드 포함)를 반환합니다.
+    """
+    normalized_titles, display_titles = _normalize_titles(titles)
+    results = await replace_keywords_by_titles(
+        db, user_id, normalized_titles, MAX_KEYWORDS_PER_USER
+    )
+    _notify_linked_keywords(background_tasks, user_id, results)
+    return _make_bulk_response(display_titles, results)
+
+
 async def view_users_keywords(
     db: AsyncSession,
     user_id: UUID,
@@ -102,3 +219,19 @@ async def view_users_keywords(
     # 유저의 키워드 리스트 조회
     keywords: list[Keyword] = await select_users_keywords(db, user_id)
     return [KeywordResponse(id=keyword.id, title=keyword.title) for keyword in keywords]
+
+
+async def view_users_keywords_snapshot(
+    db: AsyncSession,
+    user_id: UUID,
+) -> KeywordListSnapshot:
+    """
+    직렬화된 내 키워드 리스트와 ETag를 반환합니다.
+    캐시된 값이 있으면 DB 조회와 직렬화를 생략합니다.
+    """
+    snapshot = keyword_list_cache.get(user_id)
+    if snapshot is None:
+        keywords = await view_users_keywords(db, user_id)
+        snapshot = make_keyword_list_snapshot(_keyword_list_adapter.dump_json(keywords))
+        keyword_list_cache.set(user_id, snapshot)
+    return snapshot
@@ -1,17 +1,25 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.core.dependencies.auth import registered_user
 from app.src.core.dependencies.db_session import get_db
 from app.src.core.exceptions.auth_excptions import AuthErrors
 from app.src.core.exceptions.client_exceptions import ClientErrors
-from app.src.domain.hotdeal.schemas import KeywordCreateRequest, KeywordResponse
+from app.src.domain.hotdeal.schemas import (
+    KeywordBulkRequest,
+    KeywordBulkResponse,
+    KeywordCreateRequest,
+    KeywordResponse,
+)
 from app.src.domain.hotdeal.services import (
     register_keyword,
+    register_keywords,
+    replace_keywords,
     unlink_keyword,
-    view_users_keywords,
+    unlink_keywords,
+    view_users_keywords_snapshot,
 )
 from app.src.domain.user.schemas import (
     AuthenticatedUser,
@@ -38,15 +46,102 @@ async def post_keyword(
     request: KeywordCreateRequest,
     db: Annotated[AsyncSession, Depends(get_db)],
     login_user: Annotated[AuthenticatedUser, Depends(registered_user)],
+    background_tasks: BackgroundTasks,
 ) -> KeywordResponse:
     result: KeywordResponse = await register_keyword(
         db=db,
         title=request.title,
         user_id=login_user.user_id,
+        background_tasks=background_tasks,
     )
     return result
 
 
+# 키워드 여러 개 등록하기
+@router.post(
+    "/keywords/bulk",
+    status_code=status.HTTP_200_OK,
+    summary="키워드 여러 개 등록하기",
+    responses=create_responses(
+        AuthErrors.INVALID_TOKEN,
+        AuthErrors.INVALID_TOKEN_PAYLOAD,
+        AuthErrors.USER_NOT_ACTIVE,
+        AuthErrors.USER_NOT_FOUND,
+    ),
+)
+async def post_keywords_bulk(
+    request: KeywordBulkRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    login_user: Annotated[AuthenticatedUser, Depends(registered_user)],
+    background_tasks: BackgroundTasks,
+) -> KeywordBulkResponse:
+    """
+    키워드별 결과(linked, duplicate, limit_exceeded, invalid_title)를 반환합니다.
+    """
+    return await register_keywords(
+        db=db,
+        titles=request.titles,
+        user_id=login_user.user_id,
+        background_tasks=background_tasks,
+    )
+
+
+# 내 키워드 여러 개 삭제하기
+@router.post(
+    "/keywords/bulk/remove",
+    status_code=status.HTTP_200_OK,
+    summary="내 키워드 여러 개 삭제하기",
+    responses=create_responses(
+        AuthErrors.INVALID_TOKEN,
+        AuthErrors.INVALID_TOKEN_PAYLOAD,
+        AuthErrors.USER_NOT_ACTIVE,
+        AuthErrors.USER_NOT_FOUND,
+    ),
+)
+async def remove_keywords_bulk(
+    request: KeywordBulkRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    login_user: Annotated[AuthenticatedUser, Depends(registered_user)],
+) -> KeywordBulkResponse:
+    """
+    키워드별 결과(unlinked, not_found, invalid_title)를 반환합니다.
+    """
+    return await unlink_keywords(
+        db=db,
+        titles=request.titles,
+        user_id=login_user.user_id,
+    )
+
+
+# 내 키워드 목록 교체하기
+@router.put(
+    "/keywords",
+    status_code=status.HTTP_200_OK,
+    summary="내 키워드 목록 교체하기",
+    responses=create_responses(
+        AuthErrors.INVALID_TOKEN,
+        AuthErrors.INVALID_TOKEN_PAYLOAD,
+        AuthErrors.USER_NOT_ACTIVE,
+        AuthErrors.USER_NOT_FOUND,
+    ),
+)
+async def put_keywords(
+    request: KeywordBulkRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    login_user: Annotated[AuthenticatedUser, Depends(registered_user)],
+    background_tasks: BackgroundTasks,
+) -> KeywordBulkResponse:
+    """
+    요청에 없는 키워드는 제거(unlinked)하고 새로운 키워드는 추가합니다.
+    """
+    return await replace_keywords(
+        db=db,
+        titles=request.titles,
+        user_id=login_user.user_id,
+        background_tasks=background_tasks,
+    )
+
+
 # 내 키워드 삭제하기
 @router.delete(
     "/keywords/{keyword_id}",
@@ -72,6 +167,7 @@ async def delete_my_keyword(
 # 내 키워드 리스트 보기
 @router.get(
     "/keywords",
+    response_model=list[KeywordResponse],
     status_code=status.HTTP_200_OK,
     summary="내 키워드 리스트 보기",
     responses=create_responses(
@@ -84,9 +180,29 @@ async def delete_my_keyword(
 async def get_my_keywords_list(
     db: Annotated[AsyncSession, Depends(get_db)],
     login_user: Annotated[AuthenticatedUser, Depends(registered_user)],
-) -> list[KeywordResponse]:
-    result: list[KeywordResponse] = await view_users_keywords(
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    """
+    ETag를 함께 반환하며, If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환합니다.
+    """
+    snapshot = await view_users_keywords_snapshot(
         db=db,
         user_id=login_user.user_id,
     )
-    return result
+    # 브라우저가 매번 ETag로 재검증하도록 설정
+    headers = {"ETag": snapshot.etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and _etag_matches(if_none_match, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=snapshot.body, media_type="application/json", headers=headers
+    )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더("*" 또는 쉼표로 구분된 ETag 목록, 약한 비교)와 비교합니다."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (
+        value.strip().removeprefix("W/") for value in if_none_match.split(",")
+    )
+    return etag in candidates
@@ -0,0 +1,16 @@
+from uuid import UUID
+
+from app.src.core.config import settings
+from app.src.core.ttl_cache import TTLCache
+
+# 사용자 활성 상태 캐시 (user_id -> is_active)
+# 변경 시 invalidate_user_status로 즉시 제거하고, 다른 프로세스의 변경은 TTL 안에 반영됨
+user_status_cache: TTLCache[UUID, bool] = TTLCache(
+    max_entries=settings.USER_STATUS_CACHE_MAX_ENTRIES,
+    ttl=settings.USER_STATUS_CACHE_TTL_SECONDS,
+)
+
+
+def invalidate_user_status(user_id: UUID) -> None:
+    """사용자 상태가 바뀌었을 때 캐시된 값을 제거합니다."""
+    user_status_cache.delete(user_id)
@@ -37,7 +37,6 @@ class User(Base):
         Integer, nullable=False, server_default=text(str(AuthLevel.USER.value))
     )
     is_active = Column(Boolean, nullable=False, server_default=text("false"))
-    refresh_token = Column(String(255), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
@@ -45,3 +44,22 @@ class User(Base):
 
     keywords = relationship("Keyword", secondary=user_keywords, back_populates="users")
     mail_logs = relationship("MailLog", back_populates="user")
+
+
+class RefreshToken(Base):
+    """
+    기기(로그인 세션)별 리프레시 토큰.
+    토큰 원문 대신 SHA-256 해시를 저장하고, 해시로 조회합니다.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    token_hash = Column(String(64), primary_key=True)
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
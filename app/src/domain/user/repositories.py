@@ -1,10 +1,13 @@
+from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .cache import invalidate_user_status
 from .enums import AuthLevel
 from .models import User
+from .token_store import refresh_token_store
 
 
 async def create_user(
@@ -71,6 +74,7 @@ async def activate_user(
         )
         result = await db.execute(stmt)
         await db.commit()
+        invalidate_user_status(user_id)
         return result.scalar_one_or_none()
     return user
 
@@ -91,6 +95,7 @@ async def update_user_auth_level(
     updated_user = result.scalar_one_or_none()
     if updated_user:
         await db.commit()
+        invalidate_user_status(user_id)
         return updated_user
     return None
 
@@ -115,6 +120,26 @@ async def update_user_password(
     return None
 
 
+async def replace_password_hash(
+    db: AsyncSession,
+    user_id: UUID,
+    old_hashed_password: str,
+    new_hashed_password: str,
+) -> bool:
+    """
+    비밀번호 해시가 old_hashed_password일 때만 새 해시로 교체합니다.
+    그 사이 비밀번호가 변경되었다면 덮어쓰지 않고 False를 반환합니다.
+    """
+    stmt = (
+        update(User)
+        .where(User.id == user_id, User.hashed_password == old_hashed_password)
+        .values(hashed_password=new_hashed_password)
+    )
+    result = await db.execute(stmt)
+    await db.commit()
+    return result.rowcount > 0
+
+
 async def get_inactive_users(
     db: AsyncSession,
     skip: int = 0,
@@ -153,34 +178,36 @@ async def save_refresh_token(
     db: AsyncSession,
     user_id: UUID,
     token: str,
+    expires_at: datetime,
 ) -> None:
-    """사용자의 리프레시 토큰을 저장합니다."""
-    stmt = update(User).where(User.id == user_id).values(refresh_token=token)
-    await db.execute(stmt)
-    await db.commit()
+    """사용자의 리프레시 토큰을 새 로그인 세션으로 저장합니다."""
+    await refresh_token_store.save(db, user_id, token, expires_at)
 
 
 async def verify_refresh_token(
     db: AsyncSession,
     user_id: UUID,
     token: str,
-) -> User | None:
-    """제공된 리프레시 토큰이 저장된 토큰과 일치하는지 확인합니다."""
-    result = await db.execute(
-        select(User).where(User.id == user_id).where(User.refresh_token == token)
-    )
-    user: User | None = result.scalar_one_or_none()
-    return user
+) -> bool:
+    """제공된 리프레시 토큰이 저장된 유효한 세션인지 확인합니다."""
+    return await refresh_token_store.verify(db, user_id, token)
+
+
+async def revoke_refresh_token(
+    db: AsyncSession,
+    user_id: UUID,
+    token: str,
+) -> None:
+    """리프레시 토큰 하나(한 기기의 세션)를 폐기합니다."""
+    await refresh_token_store.revoke(db, user_id, token)
 
 
 async def init_refresh_token(
     db: AsyncSession,
     user_id: UUID,
 ) -> None:
-    """사용자의 리프레시 토큰을 초기화합니다 (None으로 설정)."""
-    stmt = update(User).where(User.id == user_id).values(refresh_token=None)
-    await db.execute(stmt)
-    await db.commit()
+    """사용자의 모든 리프레시 토큰을 폐기합니다."""
+    await refresh_token_store.revoke_all(db, user_id)
 
 
 async def check_user_active(
@@ -1,27 +1,75 @@
+import asyncio
 from uuid import UUID
 
 from fastapi import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.core.config import settings
+from app.src.core.database import AsyncSessionLocal
 from app.src.core.dependencies.auth import (
     create_access_token,
     create_refresh_token,
     delete_refresh_token,
 )
 from app.src.core.exceptions.auth_excptions import AuthErrors
-from app.src.core.security import hash_password, verify_password
+from app.src.core.logger import logger
+from app.src.core.security import (
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+from app.src.domain.user.cache import invalidate_user_status
 from app.src.domain.user.enums import AuthLevel
 from app.src.domain.user.repositories import (
     create_user,
     get_user_by_email,
     get_user_by_id,
+    replace_password_hash,
+    revoke_refresh_token,
 )
 from app.src.domain.user.schemas import (
     LoginResponse,
     UserResponse,
 )
 
+# 진행 중인 재해싱 작업 (가비지 컬렉션으로 중단되지 않도록 참조 유지)
+_rehash_tasks: set[asyncio.Task] = set()
+
+
+async def _rehash_password(
+    user_id: UUID,
+    old_hashed_password: str,
+    password: str,
+) -> None:
+    try:
+        new_hashed_password = await hash_password_async(password)
+        # 요청 세션은 응답 후 닫히므로 별도 세션 사용
+        async with AsyncSessionLocal() as db:
+            replaced = await replace_password_hash(
+                db, user_id, old_hashed_password, new_hashed_password
+            )
+        if replaced:
+            logger.info(
+                f"사용자 {user_id}의 비밀번호를 현재 bcrypt 비용으로 재해싱했습니다."
+            )
+    except Exception as e:
+        logger.error(f"사용자 {user_id}의 비밀번호 재해싱 실패: {e}")
+
+
+def schedule_password_rehash(
+    user_id: UUID,
+    old_hashed_password: str,
+    password: str,
+) -> asyncio.Task:
+    """
+    작업 비용이 설정과 다른 해시를 백그라운드에서 다시 해싱합니다.
+    로그인 응답은 재해싱을 기다리지 않습니다.
+    """
+    task = asyncio.create_task(_rehash_password(user_id, old_hashed_password, password))
+    _rehash_tasks.add(task)
+    task.add_done_callback(_rehash_tasks.discard)
+    return task
+
 
 async def create_new_user(
     db: AsyncSession,
@@ -39,7 +87,7 @@ async def create_new_user(
     if existing_user:
         raise AuthErrors.EMAIL_ALREADY_REGISTERED
 
-    hashed_pwd = hash_password(password)
+    hashed_pwd = await hash_password_async(password)
     is_active = False
     if settings.ENVIRONMENT != "prod":
         is_active = True
@@ -66,9 +114,12 @@ async def login_user(
     if not user:
         raise AuthErrors.USER_NOT_FOUND
 
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         raise AuthErrors.INVALID_PASSWORD
 
+    if needs_rehash(user.hashed_password):
+        schedule_password_rehash(user.id, user.hashed_password, password)
+
     if not user.is_active:
         raise AuthErrors.USER_NOT_ACTIVE
 
@@ -90,6 +141,7 @@ async def logout_user(
     db: AsyncSession,
     response: Response,
     user_id: UUID,
+    refresh_token: str | None = None,
 ) -> None:
     # 실제 있는 유저인지 확인
     user = await get_user_by_id(db, user_id)
@@ -101,7 +153,8 @@ async def logout_user(
         raise AuthErrors.USER_NOT_ACTIVE
 
     # 액세스 토큰을 블랙리스트에 등록하는 로직은 생략
-    await delete_refresh_token(db, response, user_id)
+    await delete_refresh_token(db, response, user_id, refresh_token)
+    invalidate_user_status(user_id)
     return None
 
 
@@ -110,7 +163,12 @@ async def refresh_access_token(
     response: Response,
     user_id: UUID,
     email: str,
+    refresh_token: str | None = None,
 ) -> LoginResponse:
+    """
+    액세스 토큰과 리프레시 토큰을 새로 발급합니다.
+    refresh_token(사용한 기존 토큰)이 주어지면 폐기해 같은 기기의 세션을 교체합니다.
+    """
     user = await get_user_by_id(db, user_id)
     if not user:
         raise AuthErrors.USER_NOT_FOUND
@@ -130,6 +188,8 @@ async def refresh_access_token(
         user_id=user_id,
         email=email,
     )
+    if refresh_token:
+        await revoke_refresh_token(db, user_id, refresh_token)
 
     return LoginResponse(
         access_token=access_token,
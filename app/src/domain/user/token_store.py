@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.core.config import settings
+from app.src.core.database import AsyncSessionLocal
+from app.src.core.logger import logger
+
+from .models import RefreshToken
+
+
+def hash_refresh_token(token: str) -> str:
+    """
+    리프레시 토큰의 SHA-256 해시(hex)를 반환합니다.
+    저장소에는 원문 대신 이 값을 저장합니다.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class RefreshTokenStore(ABC):
+    """
+    리프레시 토큰 저장소 인터페이스.
+    사용자마다 여러 기기(세션)의 토큰을 보관하며,
+    max_sessions를 넘으면 만료가 가장 이른 세션부터 제거합니다.
+    DB 세션을 사용하지 않는 구현체도 같은 시그니처를 위해 db 인자를 받습니다.
+    """
+
+    def __init__(self, max_sessions: int = 10):
+        self.max_sessions = max_sessions
+
+    @abstractmethod
+    async def save(
+        self, db: AsyncSession, user_id: UUID, token: str, expires_at: datetime
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def verify(self, db: AsyncSession, user_id: UUID, token: str) -> bool:
+        """토큰이 해당 사용자의 만료되지 않은 세션이면 True를 반환합니다."""
+        pass
+
+    @abstractmethod
+    async def revoke(self, db: AsyncSession, user_id: UUID, token: str) -> None:
+        pass
+
+    @abstractmethod
+    async def revoke_all(self, db: AsyncSession, user_id: UUID) -> None:
+        pass
+
+    @abstractmethod
+    async def sweep_expired(self, db: AsyncSession) -> int:
+        """만료된 토큰을 삭제하고 삭제한 개수를 반환합니다."""
+        pass
+
+
+class DatabaseRefreshTokenStore(RefreshTokenStore):
+    """refresh_tokens 테이블 기반 구현. users 행은 수정하지 않습니다."""
+
+    async def save(
+        self, db: AsyncSession, user_id: UUID, token: str, expires_at: datetime
+    ) -> None:
+        db.add(
+            RefreshToken(
+                token_hash=hash_refresh_token(token),
+                user_id=user_id,
+                expires_at=expires_at,
+            )
+        )
+        await db.flush()
+        # 최근 max_sessions개를 제외한 세션 제거
+        stale_hashes = (
+            select(RefreshToken.token_hash)
+            .where(RefreshToken.user_id == user_id)
+            .order_by(RefreshToken.expires_at.desc())
+            .offset(self.max_sessions)
+        )
+        await db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.token_hash.in_(stale_hashes.scalar_subquery())
+            )
+        )
+        await db.commit()
+
+    async def verify(self, db: AsyncSession, user_id: UUID, token: str) -> bool:
+        result = await db.execute(
+            select(RefreshToken.token_hash)
+            .where(RefreshToken.token_hash == hash_refresh_token(token))
+            .where(RefreshToken.user_id == user_id)
+            .where(RefreshToken.expires_at > datetime.now(UTC))
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def revoke(self, db: AsyncSession, user_id: UUID, token: str) -> None:
+        await db.execute(
+            delete(RefreshToken)
+            .where(RefreshToken.token_hash == hash_refresh_token(token))
+            .where(RefreshToken.user_id == user_id)
+        )
+        await db.commit()
+
+    async def revoke_all(self, db: AsyncSession, user_id: UUID) -> None:
+        await db.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+        await db.commit()
+
+    async def sweep_expired(self, db: AsyncSession) -> int:
+        result = await db.execute(
+            delete(RefreshToken).where(RefreshToken.expires_at <= datetime.now(UTC))
+        )
+        await db.commit()
+        return result.rowcount
+
+
+class InMemoryRefreshTokenStore(RefreshTokenStore):
+    """
+    프로세스 메모리 기반 구현 (단일 프로세스 개발/테스트용).
+    Redis의 키(토큰 해시 -> 사용자) + 사용자별 해시 구조와 같은 형태로 보관합니다.
+    """
+
+    def __init__(self, max_sessions: int = 10):
+        super().__init__(max_sessions)
+        self._tokens: dict[str, tuple[UUID, datetime]] = {}
+        self._user_tokens: dict[UUID, dict[str, datetime]] = {}
+
+    async def save(
+        self, db: AsyncSession, user_id: UUID, token: str, expires_at: datetime
+    ) -> None:
+        token_hash = hash_refresh_token(token)
+        self._tokens[token_hash] = (user_id, expires_at)
+        sessions = self._user_tokens.setdefault(user_id, {})
+        sessions[token_hash] = expires_at
+        if len(sessions) > self.max_sessions:
+            by_expiry = sorted(sessions, key=sessions.__getitem__, reverse=True)
+            for stale_hash in by_expiry[self.max_sessions :]:
+                self._remove(stale_hash)
+
+    async def verify(self, db: AsyncSession, user_id: UUID, token: str) -> bool:
+        entry = self._tokens.get(hash_refresh_token(token))
+        return (
+            entry is not None and entry[0] == user_id and entry[1] > datetime.now(UTC)
+        )
+
+    async def revoke(self, db: AsyncSession, user_id: UUID, token: str) -> None:
+        token_hash = hash_refresh_token(token)
+        entry = self._tokens.get(token_hash)
+        if entry is not None and entry[0] == user_id:
+            self._remove(token_hash)
+
+    async def revoke_all(self, db: AsyncSession, user_id: UUID) -> None:
+        for token_hash in list(self._user_tokens.get(user_id, {})):
+            self._remove(token_hash)
+
+    async def sweep_expired(self, db: AsyncSession) -> int:
+        now = datetime.now(UTC)
+        expired = [h for h, (_, exp) in self._tokens.items() if exp <= now]
+        for token_hash in expired:
+            self._remove(token_hash)
+        return len(expired)
+
+    def _remove(self, token_hash: str) -> None:
+        entry = self._tokens.pop(token_hash, None)
+        if entry is None:
+            return
+        sessions = self._user_tokens.get(entry[0])
+        if sessions is not None:
+            sessions.pop(token_hash, None)
+            if not sessions:
+                del self._user_tokens[entry[0]]
+
+
+REFRESH_TOKEN_STORES: dict[str, type[RefreshTokenStore]] = {
+    "database": DatabaseRefreshTokenStore,
+    "memory": InMemoryRefreshTokenStore,
+}
+
+
+def create_refresh_token_store(backend: str | None = None) -> RefreshTokenStore:
+    """
+    settings.REFRESH_TOKEN_STORE_BACKEND(기본 database)에 해당하는 저장소를 생성합니다.
+    """
+    backend = backend or settings.REFRESH_TOKEN_STORE_BACKEND
+    try:
+        store_class = REFRESH_TOKEN_STORES[backend]
+    except KeyError as e:
+        raise ValueError(f"Unknown refresh token store backend: {backend}") from e
+    return store_class(max_sessions=settings.REFRESH_TOKEN_MAX_SESSIONS)
+
+
+refresh_token_store = create_refresh_token_store()
+
+
+async def sweep_expired_refresh_tokens_periodically(interval: float) -> None:
+    """interval초마다 만료된 리프레시 토큰을 삭제합니다. 취소될 때까지 실행됩니다."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted = await refresh_token_store.sweep_expired(db)
+            if deleted:
+                logger.info(f"만료된 리프레시 토큰 {deleted}개 삭제")
+        except Exception as e:
+            logger.error(f"리프레시 토큰 정리 실패: {e}")
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Cookie, Depends, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.core.dependencies.auth import authenticate_refresh_token, registered_user
@@ -101,14 +101,16 @@ async def logout(
     db: Annotated[AsyncSession, Depends(get_db)],
     response: Response,
     login_user: Annotated[AuthenticatedUser, Depends(registered_user)],
+    refresh_token: Annotated[str | None, Cookie()] = None,
 ) -> LogoutResponse:
     """
-    사용자 로그아웃
+    사용자 로그아웃 (리프레시 토큰 쿠키가 있으면 해당 기기의 세션만 종료)
     """
     await logout_user(
         db=db,
         response=response,
         user_id=login_user.user_id,
+        refresh_token=refresh_token,
     )
     return LogoutResponse()
 
@@ -131,15 +133,17 @@ async def refresh_token(
     db: Annotated[AsyncSession, Depends(get_db)],
     response: Response,
     refresh_user: Annotated[AuthenticatedUser, Depends(authenticate_refresh_token)],
+    refresh_token: Annotated[str | None, Cookie()] = None,
 ) -> LoginResponse:
     """
-    액세스 토큰 갱신
+    액세스 토큰 갱신 (사용한 리프레시 토큰은 폐기하고 새로 발급)
     """
     result = await refresh_access_token(
         db=db,
         response=response,
         user_id=refresh_user.user_id,
         email=refresh_user.email,
+        refresh_token=refresh_token,
     )
     return result
 
@@ -1,5 +1,33 @@
 from .base import LlmModels
+from .batch import BatchRequest, BatchResult, RateLimiter, TokenBucket
 from .gemini import GeminiModels
 from .grok import GrokModels
+from .metrics import LlmMetrics, llm_metrics
+from .registry import LlmClientRegistry, llm_client_registry
+from .router import ProviderStats, RouterModels
+from .token_budget import (
+    EstimatingTokenizer,
+    TiktokenTokenizer,
+    TokenBudgeter,
+    Tokenizer,
+)
 
-__all__ = ["LlmModels", "GrokModels", "GeminiModels"]
+__all__ = [
+    "LlmModels",
+    "BatchRequest",
+    "BatchResult",
+    "RateLimiter",
+    "TokenBucket",
+    "GrokModels",
+    "GeminiModels",
+    "LlmMetrics",
+    "llm_metrics",
+    "LlmClientRegistry",
+    "llm_client_registry",
+    "RouterModels",
+    "ProviderStats",
+    "Tokenizer",
+    "EstimatingTokenizer",
+    "TiktokenTokenizer",
+    "TokenBudgeter",
+]
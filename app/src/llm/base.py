@@ -1,10 +1,28 @@
 from abc import ABC, abstractmethod
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator, Iterable
+from typing import Any
 
-from app.src.models.message import Message
+from app.src.models.message_list import (
+    BaseMessageList,
+    MessageFormatter,
+    MessageSource,
+    MessageWindow,
+)
+
+from .batch import (
+    BatchRequest,
+    BatchRequestWrapper,
+    BatchResult,
+    RateLimiter,
+    iterate_in_background_loop,
+    run_batch,
+)
 
 
 class LlmModels(ABC):
+    # 제공자 식별자 (클라이언트 레지스트리, 응답 캐시 키 등에 사용)
+    provider_name: str
+
     @abstractmethod
     def get_api_key(self) -> str:
         pass
@@ -18,10 +36,15 @@ class LlmModels(ABC):
         """이 LLM 제공자가 지원하는 모델 이름 목록을 반환합니다."""
         pass
 
+    @abstractmethod
+    def get_context_window(self, model_name: str) -> int:
+        """모델의 컨텍스트 윈도우 크기(입력 + 출력 토큰 수)를 반환합니다."""
+        pass
+
     @abstractmethod
     def generate_completion_stream(
         self,
-        messages: list[Message],
+        messages: MessageSource,
         model_name: str,
         temperature: float,
         max_tokens: int,
@@ -29,3 +52,72 @@ class LlmModels(ABC):
     ) -> Generator[str, None, None]:
         """메시지 리스트와 파라미터를 받아 API 호출 후 결과를 스트리밍으로 반환합니다."""
         pass
+
+    @abstractmethod
+    def agenerate_completion_stream(
+        self,
+        messages: MessageSource,
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+    ) -> AsyncGenerator[str, None]:
+        """
+        generate_completion_stream의 비동기 버전입니다.
+        이벤트 루프를 블로킹하지 않습니다.
+        """
+        pass
+
+    def agenerate_batch(
+        self,
+        requests: Iterable[BatchRequest],
+        max_concurrency: int | None = None,
+        max_retries: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        wrap_request: BatchRequestWrapper | None = None,
+    ) -> AsyncGenerator[BatchResult, None]:
+        """
+        여러 요청을 동시성/RPM/TPM 제한 안에서 실행하고
+        완료되는 순서대로 결과를 반환합니다.
+        실패한 요청은 지터가 있는 지수 백오프로 재시도합니다.
+        """
+        return run_batch(
+            self,
+            requests,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+            rate_limiter=rate_limiter,
+            wrap_request=wrap_request,
+        )
+
+    def generate_batch(
+        self,
+        requests: Iterable[BatchRequest],
+        max_concurrency: int | None = None,
+        max_retries: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> Generator[BatchResult, None, None]:
+        """agenerate_batch의 동기 버전. 실행 중인 이벤트 루프 밖에서 호출해야 합니다."""
+        yield from iterate_in_background_loop(
+            self.agenerate_batch(
+                requests,
+                max_concurrency=max_concurrency,
+                max_retries=max_retries,
+                rate_limiter=rate_limiter,
+            )
+        )
+
+    @staticmethod
+    def _format_with_cache(
+        messages: MessageSource,
+        key: str,
+        formatter: MessageFormatter,
+    ) -> list[Any]:
+        """
+        메시지를 provider 형식으로 변환합니다.
+        MessageList 계열 저장소가 전달되면
+        캐시를 사용해 새로 추가된 메시지만 변환합니다.
+        """
+        if isinstance(messages, BaseMessageList | MessageWindow):
+            return messages.get_formatted(key, formatter)
+        return [item for msg in messages if (item := formatter(msg)) is not None]
@@ -0,0 +1,259 @@
+import asyncio
+import random
+import threading
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterable
+from typing import TYPE_CHECKING
+
+import httpx
+from google.genai import errors as genai_errors
+from openai import APIConnectionError, APIStatusError
+from pydantic import BaseModel
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.core.token_bucket import TokenBucket
+from app.src.models.message import Message
+
+from .token_budget import EstimatingTokenizer, TokenBudgeter
+
+if TYPE_CHECKING:
+    from .base import LlmModels
+
+
+class BatchRequest(BaseModel):
+    # 결과를 요청과 매칭하기 위한 식별자 (결과는 완료된 순서로 반환됨)
+    id: str
+    messages: list[Message]
+    model_name: str | None = None
+    temperature: float = 1.2
+    max_tokens: int = 2500
+    top_p: float = 0.95
+
+
+class BatchResult(BaseModel):
+    id: str
+    content: str | None = None
+    error: str | None = None
+    attempts: int = 0
+
+
+# 요청 하나를 실행해 결과를 반환하는 함수
+BatchHandler = Callable[[BatchRequest], Awaitable[BatchResult]]
+# 요청과 실행 함수를 받아 호출 전후의 처리를 더하는 함수 (캐시 조회 등)
+BatchRequestWrapper = Callable[[BatchRequest, BatchHandler], Awaitable[BatchResult]]
+
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM) 제한. None이면 제한하지 않습니다."""
+
+    def __init__(self, rpm: int | None = None, tpm: int | None = None):
+        self.requests = TokenBucket(rpm, rpm / 60) if rpm else None
+        self.tokens = TokenBucket(tpm, tpm / 60) if tpm else None
+
+    async def acquire(self, tokens: int) -> None:
+        if self.requests:
+            await self.requests.acquire(1)
+        if self.tokens:
+            await self.tokens.acquire(tokens)
+
+
+_rate_limiters: dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider_name: str) -> RateLimiter:
+    """
+    제공자별 프로세스 전역 RateLimiter를 반환합니다.
+    제한값은 settings.LLM_RATE_LIMIT_RPM / LLM_RATE_LIMIT_TPM에서
+    제공자 이름으로 조회합니다.
+    """
+    with _rate_limiters_lock:
+        rate_limiter = _rate_limiters.get(provider_name)
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                rpm=settings.LLM_RATE_LIMIT_RPM.get(provider_name),
+                tpm=settings.LLM_RATE_LIMIT_TPM.get(provider_name),
+            )
+            _rate_limiters[provider_name] = rate_limiter
+        return rate_limiter
+
+
+# TPM 차감에는 근사치면 충분하므로 빠른 추정 토크나이저 사용
+_request_budgeter = TokenBudgeter(tokenizer=EstimatingTokenizer())
+
+
+def estimate_request_tokens(request: BatchRequest) -> int:
+    """TPM 차감용 토큰 수 (입력 근사치 + 최대 출력 토큰)"""
+    return sum(_request_budgeter.count_messages(request.messages)) + request.max_tokens
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """
+    다시 시도하면 성공할 수 있는 오류인지 판단합니다.
+    429, 5xx 응답과 연결/타임아웃 오류만 재시도하고,
+    4xx 응답이나 검증 오류는 재시도하지 않습니다.
+    """
+    if isinstance(error, (httpx.TransportError, APIConnectionError)):
+        return True
+    if isinstance(error, APIStatusError):
+        status_code = error.status_code
+    elif isinstance(error, genai_errors.APIError):
+        status_code = error.code
+    else:
+        return False
+    return status_code == 429 or status_code >= 500
+
+
+async def _complete_with_retry(
+    llm_model: "LlmModels",
+    request: BatchRequest,
+    rate_limiter: RateLimiter,
+    max_retries: int,
+    backoff_base: float,
+    backoff_max: float,
+) -> BatchResult:
+    model_name = request.model_name or llm_model.get_default_model_name()
+    tokens = estimate_request_tokens(request)
+    attempt = 0
+    while True:
+        attempt += 1
+        await rate_limiter.acquire(tokens)
+        try:
+            chunks = [
+                chunk
+                async for chunk in llm_model.agenerate_completion_stream(
+                    messages=request.messages,
+                    model_name=model_name,
+                    temperature=request.temperature,
+                    max_tokens=request.max_tokens,
+                    top_p=request.top_p,
+                )
+            ]
+            return BatchResult(id=request.id, content="".join(chunks), attempts=attempt)
+        except Exception as e:
+            if not is_retryable_error(e):
+                logger.warning(f"배치 요청 {request.id} 실패 (재시도하지 않음): {e}")
+                return BatchResult(id=request.id, error=str(e), attempts=attempt)
+            if attempt > max_retries:
+                logger.warning(f"배치 요청 {request.id} 최종 실패 ({attempt}회): {e}")
+                return BatchResult(id=request.id, error=str(e), attempts=attempt)
+            # 지수 백오프 + full jitter
+            # (동시에 실패한 요청이 한꺼번에 재시도하지 않도록 분산)
+            delay = random.uniform(
+                0, min(backoff_max, backoff_base * 2 ** (attempt - 1))
+            )
+            logger.info(
+                f"배치 요청 {request.id} 실패, {delay:.2f}s 후 재시도 "
+                f"({attempt}/{max_retries}): {e}"
+            )
+            await asyncio.sleep(delay)
+
+
+async def run_batch(
+    llm_model: "LlmModels",
+    requests: Iterable[BatchRequest],
+    max_concurrency: int | None = None,
+    max_retries: int | None = None,
+    rate_limiter: RateLimiter | None = None,
+    backoff_base: float = 0.5,
+    backoff_max: float = 30.0,
+    wrap_request: BatchRequestWrapper | None = None,
+) -> AsyncGenerator[BatchResult, None]:
+    """
+    여러 요청을 동시에 실행하고 완료되는 순서대로 결과를 반환합니다.
+    - 동시에 실행 중인 요청은 max_concurrency개로 제한하며,
+      requests는 필요한 만큼만 읽습니다.
+    - 요청마다 제공자의 RPM/TPM 버킷에서 토큰을 차감한 뒤 호출합니다.
+    - 429, 5xx, 연결 오류로 실패한 요청은 max_retries번까지 재시도하고,
+      그래도 실패하면 error가 담긴 결과를 반환합니다.
+    - 재시도해도 소용없는 오류(4xx 응답, 검증 오류 등)는 재시도 없이
+      error가 담긴 결과를 반환하며, 나머지 요청은 계속 실행합니다.
+    - wrap_request가 있으면 요청마다 (요청, 실행 함수)로 호출합니다.
+      (캐시 조회처럼 호출 전후에 할 일을 요청 단위 작업 안에서 처리)
+    """
+    max_concurrency = max_concurrency or settings.LLM_BATCH_MAX_CONCURRENCY
+    if max_retries is None:
+        max_retries = settings.LLM_BATCH_MAX_RETRIES
+    rate_limiter = rate_limiter or get_rate_limiter(llm_model.provider_name)
+
+    def complete(request: BatchRequest) -> Awaitable[BatchResult]:
+        return _complete_with_retry(
+            llm_model, request, rate_limiter, max_retries, backoff_base, backoff_max
+        )
+
+    pending_requests = iter(requests)
+    running: set[asyncio.Task[BatchResult]] = set()
+    try:
+        while True:
+            for request in pending_requests:
+                if wrap_request is None:
+                    coroutine = complete(request)
+                else:
+                    coroutine = wrap_request(request, complete)
+                running.add(asyncio.create_task(coroutine))
+                if len(running) >= max_concurrency:
+                    break
+            if not running:
+                return
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        # 소비자가 중간에 멈추면 실행 중인 요청을 취소
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    동기 API가 공유하는 프로세스 전역 이벤트 루프를 반환합니다.
+    처음 호출할 때 데몬 스레드에서 루프를 시작합니다.
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="llm-background-loop", daemon=True
+            ).start()
+            _background_loop = loop
+        return _background_loop
+
+
+# 비동기 제너레이터가 끝났음을 나타내는 값
+_STREAM_END = object()
+
+
+async def _next_or_end(stream: AsyncGenerator):
+    try:
+        return await anext(stream)
+    except StopAsyncIteration:
+        return _STREAM_END
+
+
+def iterate_in_background_loop(stream: AsyncGenerator) -> Generator:
+    """
+    비동기 제너레이터를 프로세스 전역 백그라운드 이벤트 루프에서 실행하며
+    동기 제너레이터로 감쌉니다.
+    레지스트리의 비동기 SDK 클라이언트는 처음 사용한 루프에 묶이므로,
+    호출마다 새 루프를 만들지 않고 항상 같은 루프에서 실행합니다.
+    호출한 스레드는 결과가 나올 때까지 블로킹되므로
+    실행 중인 이벤트 루프 안에서는 사용하지 않습니다.
+    """
+    loop = _get_background_loop()
+
+    def run(coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    try:
+        while (item := run(_next_or_end(stream))) is not _STREAM_END:
+            yield item
+    finally:
+        run(stream.aclose())
@@ -1,23 +1,30 @@
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Any
 
 from google import genai
 from google.genai import types
 
 from app.src.models.message import Message, RoleEnum
+from app.src.models.message_list import MessageSource
 
 from .base import LlmModels
+from .metrics import instrument_astream, instrument_stream
+from .registry import llm_client_registry
 
 
 class GeminiModels(LlmModels):
+    provider_name = "gemini"
     api_key = os.getenv("GOOGLE_API_KEY", "null")
 
     def __init__(self):
         # api key가 없는 경우 오류 발생
         if self.get_api_key() == "null":
             raise ValueError("GOOGLE_API_KEY is not set")
-        self.client = genai.Client(api_key=self.get_api_key())
+        # 프로세스 전역에서 공유하는 클라이언트 사용 (커넥션 풀 재사용)
+        self.client: genai.Client = llm_client_registry.get_genai_client(
+            self.provider_name, self.get_api_key()
+        )
 
     def get_api_key(self) -> str:
         return self.api_key
@@ -31,23 +38,31 @@ class GeminiModels(LlmModels):
             "gemini-2.0-flash",
         ]
 
-    def _format_gemini_contents(self, messages: list[Message]) -> list[dict[str, Any]]:
+    def get_context_window(self, model_name: str) -> int:
+        return {
+            "gemini-2.5-flash-preview-04-17": 1_048_576,
+            "gemini-2.0-flash": 1_048_576,
+        }.get(model_name, 1_048_576)
+
+    def _format_gemini_contents(self, messages: MessageSource) -> list[dict[str, Any]]:
         """Gemini API의 'contents' 형식으로 변환합니다. system prompt는 제외합니다."""
-        contents = []
-        for msg in messages:
-            if msg.role == RoleEnum.system:
-                continue  # 시스템 메시지는 별도로 처리
-            # 역할 매핑: assistant -> model, user -> user
-            role = "model" if msg.role == RoleEnum.assistant else msg.role.value
-            contents.append({"role": role, "parts": [{"text": msg.content}]})
-        return contents
-
-    def _extract_system_instruction(self, messages: list[Message]) -> str | None:
+        return self._format_with_cache(
+            messages, "gemini.contents", self._format_gemini_content
+        )
+
+    @staticmethod
+    def _format_gemini_content(msg: Message) -> dict[str, Any] | None:
+        if msg.role == RoleEnum.system:
+            return None  # 시스템 메시지는 별도로 처리
+        # 역할 매핑: assistant -> model, user -> user
+        role = "model" if msg.role == RoleEnum.assistant else msg.role.value
+        return {"role": role, "parts": [{"text": msg.content}]}
+
+    def _extract_system_instruction(self, messages: MessageSource) -> str | None:
         """메시지 목록에서 모든 시스템 명령어 내용을 추출하여 합칩니다."""
-        system_instructions = []
-        for msg in messages:
-            if msg.role == RoleEnum.system:
-                system_instructions.append(msg.content)
+        system_instructions = self._format_with_cache(
+            messages, "gemini.system", self._format_system_instruction
+        )
 
         if not system_instructions:
             return None
@@ -55,45 +70,83 @@ class GeminiModels(LlmModels):
         # 시스템 메시지 내용을 줄 바꿈 두 개로 합침
         return "\n\n".join(system_instructions)
 
-    def generate_completion_stream(
+    @staticmethod
+    def _format_system_instruction(msg: Message) -> str | None:
+        return msg.content if msg.role == RoleEnum.system else None
+
+    def _build_request(
         self,
-        messages: list[Message],
-        model_name: str,
+        messages: MessageSource,
         temperature: float,
         max_tokens: int,
         top_p: float,
-    ) -> Generator[str, None, None]:
+    ) -> tuple[list[dict[str, Any]], types.GenerateContentConfig]:
+        """메시지 리스트를 Gemini 'contents'와 config로 변환합니다."""
         # 시스템 명령어 추출 및 사용자/어시스턴트 메시지 분리
         system_instruction = self._extract_system_instruction(messages)
-        user_assistant_messages = [
-            msg for msg in messages if msg.role != RoleEnum.system
-        ]
-
-        # Gemini용 'contents' 포맷팅 (시스템 메시지 제외된 리스트 사용)
-        gemini_contents = self._format_gemini_contents(user_assistant_messages)
 
+        # Gemini용 'contents' 포맷팅 (시스템 메시지는 제외됨)
+        gemini_contents = self._format_gemini_contents(messages)
+
+        # config 생성 시 추출된 system_instruction 사용
+        config = types.GenerateContentConfig(
+            system_instruction=system_instruction,
+            max_output_tokens=max_tokens,
+            temperature=temperature,
+            topP=top_p,
+        )
+        return gemini_contents, config
+
+    @staticmethod
+    def _extract_text(chunk: Any) -> str | None:
+        """스트림 청크에서 텍스트를 꺼냅니다."""
         try:
-            # config 생성 시 추출된 system_instruction 사용
-            config = types.GenerateContentConfig(
-                system_instruction=system_instruction,
-                max_output_tokens=max_tokens,
-                temperature=temperature,
-                topP=top_p,
-            )
-
-            stream = self.client.models.generate_content_stream(
-                model=model_name,
-                contents=gemini_contents,
-                config=config,
-            )
-            for chunk in stream:
-                try:
-                    if chunk.text:
-                        yield chunk.text
-                except ValueError:
-                    # chunk.text가 없는 경우 오류 처리 (예: 안전 등급)
-                    pass  # 텍스트 없는 청크 무시 (예: 안전 피드백)
-
-        except Exception as e:
-            print(f"Gemini API 호출 중 예외 발생: {e}")
-            raise
+            return chunk.text or None
+        except ValueError:
+            # chunk.text가 없는 경우 오류 처리 (예: 안전 등급)
+            return None  # 텍스트 없는 청크 무시 (예: 안전 피드백)
+
+    @instrument_stream
+    def generate_completion_stream(
+        self,
+        messages: MessageSource,
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+    ) -> Generator[str, None, None]:
+        gemini_contents, config = self._build_request(
+            messages, temperature, max_tokens, top_p
+        )
+        stream = self.client.models.generate_content_stream(
+            model=model_name,
+            contents=gemini_contents,
+            config=config,
+        )
+        for chunk in stream:
+            text = self._extract_text(chunk)
+            if text:
+                yield text
+
+    @instrument_astream
+    async def agenerate_completion_stream(
+        self,
+        messages: MessageSource,
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+    ) -> AsyncGenerator[str, None]:
+        gemini_contents, config = self._build_request(
+            messages, temperature, max_tokens, top_p
+        )
+        # client.aio는 동일한 설정을 공유하는 비동기 클라이언트
+        stream = await self.client.aio.models.generate_content_stream(
+            model=model_name,
+            contents=gemini_contents,
+            config=config,
+        )
+        async for chunk in stream:
+            text = self._extract_text(chunk)
+            if text:
+                yield text
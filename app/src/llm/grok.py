@@ -1,14 +1,19 @@
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from app.src.models.message import Message
+from app.src.models.message_list import MessageSource
 
 from .base import LlmModels
+from .metrics import instrument_astream, instrument_stream
+from .registry import llm_client_registry
 
 
 class GrokModels(LlmModels):
+    provider_name = "grok"
     api_key = os.getenv("GROK_API_KEY", "null")
     base_url = "https://api.x.ai/v1"
 
@@ -16,9 +21,12 @@ class GrokModels(LlmModels):
         # api key가 없는 경우 오류 발생
         if self.get_api_key() == "null":
             raise ValueError("GROK_API_KEY is not set")
-        self.client = OpenAI(
-            api_key=self.get_api_key(),
-            base_url=self.base_url,
+        # 프로세스 전역에서 공유하는 클라이언트 사용 (커넥션 풀 재사용)
+        self.client: OpenAI = llm_client_registry.get_openai_client(
+            self.provider_name, self.get_api_key(), self.base_url
+        )
+        self.async_client: AsyncOpenAI = llm_client_registry.get_async_openai_client(
+            self.provider_name, self.get_api_key(), self.base_url
         )
 
     def get_api_key(self) -> str:
@@ -33,33 +41,69 @@ class GrokModels(LlmModels):
             "grok-3-mini-beta",
         ]
 
+    def get_context_window(self, model_name: str) -> int:
+        return {
+            "grok-3-latest": 131_072,
+            "grok-3-mini-beta": 131_072,
+        }.get(model_name, 131_072)
+
+    def _format_messages(self, messages: MessageSource) -> list[dict[str, Any]]:
+        """Grok은 OpenAI 형식을 따르므로 메시지를 dict로 변환합니다."""
+        return self._format_with_cache(messages, "grok", self._format_message)
+
+    @staticmethod
+    def _format_message(msg: Message) -> dict[str, Any]:
+        return msg.model_dump()
+
+    @staticmethod
+    def _extract_content(chunk: Any) -> str | None:
+        """스트림 청크에서 텍스트 델타를 꺼냅니다."""
+        if chunk.choices and chunk.choices[0].delta and chunk.choices[0].delta.content:
+            return chunk.choices[0].delta.content
+        return None
+
+    @instrument_stream
     def generate_completion_stream(
         self,
-        messages: list[Message],
+        messages: MessageSource,
         model_name: str,
         temperature: float,
         max_tokens: int,
         top_p: float,
     ) -> Generator[str, None, None]:
-        # Grok은 OpenAI 형식을 따르므로 메시지를 dict로 변환
-        formatted_messages = [msg.model_dump() for msg in messages]
-        try:
-            stream = self.client.chat.completions.create(
-                model=model_name,
-                messages=formatted_messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
-                stream=True,
-            )
-            for chunk in stream:
-                if (
-                    chunk.choices
-                    and chunk.choices[0].delta
-                    and chunk.choices[0].delta.content
-                ):
-                    yield chunk.choices[0].delta.content
-        except Exception as e:
-            print(f"Grok API 호출 중 예외 발생: {e}")
-            # 필요시 예외를 다시 발생시키거나 다른 방식으로 처리
-            raise
+        formatted_messages = self._format_messages(messages)
+        stream = self.client.chat.completions.create(
+            model=model_name,
+            messages=formatted_messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            stream=True,
+        )
+        for chunk in stream:
+            content = self._extract_content(chunk)
+            if content:
+                yield content
+
+    @instrument_astream
+    async def agenerate_completion_stream(
+        self,
+        messages: MessageSource,
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+    ) -> AsyncGenerator[str, None]:
+        formatted_messages = self._format_messages(messages)
+        stream = await self.async_client.chat.completions.create(
+            model=model_name,
+            messages=formatted_messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            stream=True,
+        )
+        async for chunk in stream:
+            content = self._extract_content(chunk)
+            if content:
+                yield content
@@ -0,0 +1,250 @@
+import asyncio
+import functools
+import json
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import AsyncGenerator, Callable, Generator
+
+from pydantic import BaseModel
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+from app.src.models.message_list import MessageSource
+
+from .token_budget import EstimatingTokenizer, TokenBudgeter
+
+# 토큰 수는 제공자 응답과 관계없이 같은 기준으로 비교할 수 있도록 추정 토크나이저로 계산
+_budgeter = TokenBudgeter(tokenizer=EstimatingTokenizer())
+
+
+class LlmCallRecord(BaseModel):
+    """스트리밍 호출 한 번의 측정 결과"""
+
+    provider: str
+    model_name: str
+    # completed | cancelled (소비자가 중간에 중단) | error
+    outcome: str
+    error_type: str | None = None
+    ttft: float | None = None
+    inter_token_latency: float | None = None
+    duration: float
+    input_tokens: int
+    output_tokens: int
+    chunks: int
+    estimated_cost_usd: float | None = None
+
+
+def _percentile(samples: deque[float], q: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _estimate_cost(
+    model_name: str, input_tokens: int, output_tokens: int
+) -> float | None:
+    prices = settings.LLM_TOKEN_PRICES_PER_MILLION.get(model_name)
+    if prices is None:
+        return None
+    input_price, output_price = prices
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+class ModelStats:
+    """제공자/모델별 누적 지표. 지연 시간은 최근 window개 호출로 백분위를 계산합니다."""
+
+    def __init__(self, window: int):
+        self.calls = 0
+        self.outcomes: Counter[str] = Counter()
+        self.error_types: Counter[str] = Counter()
+        self.ttfts: deque[float] = deque(maxlen=window)
+        self.inter_token_latencies: deque[float] = deque(maxlen=window)
+        self.durations: deque[float] = deque(maxlen=window)
+        self.input_tokens = 0
+        self.output_tokens = 0
+        # 첫 토큰 이후 생성에 걸린 시간 합계 (tokens/sec 계산용)
+        self.generation_seconds = 0.0
+        self.estimated_cost_usd = 0.0
+
+    def record(self, call: LlmCallRecord) -> None:
+        self.calls += 1
+        self.outcomes[call.outcome] += 1
+        if call.error_type:
+            self.error_types[call.error_type] += 1
+        if call.ttft is not None:
+            self.ttfts.append(call.ttft)
+            self.generation_seconds += call.duration - call.ttft
+        if call.inter_token_latency is not None:
+            self.inter_token_latencies.append(call.inter_token_latency)
+        self.durations.append(call.duration)
+        self.input_tokens += call.input_tokens
+        self.output_tokens += call.output_tokens
+        if call.estimated_cost_usd is not None:
+            self.estimated_cost_usd += call.estimated_cost_usd
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "outcomes": dict(self.outcomes),
+            "error_types": dict(self.error_types),
+            "ttft_p50": _percentile(self.ttfts, 0.5),
+            "ttft_p95": _percentile(self.ttfts, 0.95),
+            "inter_token_latency_p50": _percentile(self.inter_token_latencies, 0.5),
+            "inter_token_latency_p95": _percentile(self.inter_token_latencies, 0.95),
+            "duration_p50": _percentile(self.durations, 0.5),
+            "duration_p95": _percentile(self.durations, 0.95),
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "output_tokens_per_second": (
+                self.output_tokens / self.generation_seconds
+                if self.generation_seconds > 0
+                else None
+            ),
+            "estimated_cost_usd": round(self.estimated_cost_usd, 6),
+        }
+
+
+class LlmMetrics:
+    """프로세스 전역 LLM 호출 지표 저장소"""
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._stats: dict[tuple[str, str], ModelStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, call: LlmCallRecord) -> None:
+        with self._lock:
+            key = (call.provider, call.model_name)
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = ModelStats(self.window)
+            stats.record(call)
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            return [
+                {"provider": provider, "model_name": model_name, **stats.snapshot()}
+                for (provider, model_name), stats in self._stats.items()
+            ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+llm_metrics = LlmMetrics()
+
+
+class StreamTracker:
+    """스트리밍 호출 하나의 시간과 토큰 수를 측정해 llm_metrics와 로그에 기록합니다."""
+
+    def __init__(
+        self,
+        provider: str,
+        model_name: str,
+        messages: MessageSource,
+        metrics: LlmMetrics | None = None,
+    ):
+        self.provider = provider
+        self.model_name = model_name
+        self.metrics = metrics or llm_metrics
+        self.input_tokens = sum(_budgeter.count_messages(messages))
+        self.started_at = time.monotonic()
+        self.first_chunk_at: float | None = None
+        self.last_chunk_at: float | None = None
+        self.chunks: list[str] = []
+
+    def on_chunk(self, chunk: str) -> None:
+        now = time.monotonic()
+        if self.first_chunk_at is None:
+            self.first_chunk_at = now
+        self.last_chunk_at = now
+        self.chunks.append(chunk)
+
+    def finish(self, outcome: str, error: BaseException | None = None) -> LlmCallRecord:
+        duration = time.monotonic() - self.started_at
+        ttft = inter_token_latency = None
+        if self.first_chunk_at is not None:
+            ttft = self.first_chunk_at - self.started_at
+            if len(self.chunks) > 1:
+                inter_token_latency = (self.last_chunk_at - self.first_chunk_at) / (
+                    len(self.chunks) - 1
+                )
+        output_tokens = _budgeter.tokenizer.count("".join(self.chunks))
+        call = LlmCallRecord(
+            provider=self.provider,
+            model_name=self.model_name,
+            outcome=outcome,
+            error_type=type(error).__name__ if error else None,
+            ttft=ttft,
+            inter_token_latency=inter_token_latency,
+            duration=duration,
+            input_tokens=self.input_tokens,
+            output_tokens=output_tokens,
+            chunks=len(self.chunks),
+            estimated_cost_usd=_estimate_cost(
+                self.model_name, self.input_tokens, output_tokens
+            ),
+        )
+        self.metrics.record(call)
+
+        payload = json.dumps(call.model_dump(exclude_none=True), ensure_ascii=False)
+        if error is not None:
+            logger.error(f"llm_call {payload} error={error}")
+        else:
+            logger.info(f"llm_call {payload}")
+        return call
+
+
+def instrument_stream(
+    func: Callable[..., Generator[str, None, None]],
+) -> Callable[..., Generator[str, None, None]]:
+    """generate_completion_stream 구현을 감싸 호출별 지표를 기록하는 데코레이터"""
+
+    @functools.wraps(func)
+    def wrapper(self, messages, model_name, temperature, max_tokens, top_p):
+        tracker = StreamTracker(self.provider_name, model_name, messages)
+        stream = func(self, messages, model_name, temperature, max_tokens, top_p)
+        try:
+            for chunk in stream:
+                tracker.on_chunk(chunk)
+                yield chunk
+        except GeneratorExit:
+            tracker.finish("cancelled")
+            raise
+        except Exception as e:
+            tracker.finish("error", e)
+            raise
+        finally:
+            stream.close()
+        tracker.finish("completed")
+
+    return wrapper
+
+
+def instrument_astream(
+    func: Callable[..., AsyncGenerator[str, None]],
+) -> Callable[..., AsyncGenerator[str, None]]:
+    """agenerate_completion_stream 구현을 감싸 호출별 지표를 기록하는 데코레이터"""
+
+    @functools.wraps(func)
+    async def wrapper(self, messages, model_name, temperature, max_tokens, top_p):
+        tracker = StreamTracker(self.provider_name, model_name, messages)
+        stream = func(self, messages, model_name, temperature, max_tokens, top_p)
+        try:
+            async for chunk in stream:
+                tracker.on_chunk(chunk)
+                yield chunk
+        except (GeneratorExit, asyncio.CancelledError):
+            tracker.finish("cancelled")
+            raise
+        except Exception as e:
+            tracker.finish("error", e)
+            raise
+        finally:
+            await stream.aclose()
+        tracker.finish("completed")
+
+    return wrapper
@@ -0,0 +1,135 @@
+import importlib.util
+import threading
+from typing import Any
+
+import httpx
+from google import genai
+from google.genai import types
+from openai import AsyncOpenAI, OpenAI
+
+from app.src.core.config import settings
+from app.src.core.logger import logger
+
+# h2는 httpx[http2] 의존성으로 설치됨. 설치되지 않은 환경에서는 HTTP/1.1로 동작
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class LlmClientRegistry:
+    """
+    (provider, api_key)별 SDK 클라이언트를 프로세스 전역에서 공유하는 레지스트리.
+    모델 객체를 새로 만들어도 TLS 세션과 커넥션 풀을 재사용합니다.
+    """
+
+    def __init__(self):
+        self._clients: dict[tuple[str, str, str], Any] = {}
+        # Gemini 클라이언트별로 레지스트리가 만들어 넘긴 (동기, 비동기) 트랜스포트
+        self._genai_transports: dict[
+            tuple[str, str, str], tuple[httpx.HTTPTransport, httpx.AsyncHTTPTransport]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def _http2(self) -> bool:
+        return settings.LLM_HTTP2 and HTTP2_AVAILABLE
+
+    def _pool_args(self) -> dict[str, Any]:
+        """커넥션 풀 생성 인자 (HTTP/2, 풀 크기, keep-alive)"""
+        return {
+            "http2": self._http2(),
+            "limits": httpx.Limits(
+                max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+            ),
+        }
+
+    def _transport_args(self) -> dict[str, Any]:
+        """httpx 클라이언트 생성 인자 (풀 크기, keep-alive, 타임아웃)"""
+        return {
+            **self._pool_args(),
+            "timeout": httpx.Timeout(settings.LLM_HTTP_TIMEOUT),
+        }
+
+    def _get_or_create(self, key: tuple[str, str, str], factory) -> Any:
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+        return client
+
+    def get_openai_client(self, provider: str, api_key: str, base_url: str) -> OpenAI:
+        return self._get_or_create(
+            (provider, api_key, "sync"),
+            lambda: OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=httpx.Client(**self._transport_args()),
+            ),
+        )
+
+    def get_async_openai_client(
+        self, provider: str, api_key: str, base_url: str
+    ) -> AsyncOpenAI:
+        return self._get_or_create(
+            (provider, api_key, "async"),
+            lambda: AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=httpx.AsyncClient(**self._transport_args()),
+            ),
+        )
+
+    def get_genai_client(self, provider: str, api_key: str) -> genai.Client:
+        """
+        동기/비동기(client.aio) 모두 같은 풀 설정을 사용하는 Gemini 클라이언트.
+        SDK에 닫는 메서드가 없으므로 커넥션 풀(트랜스포트)을 레지스트리가 만들어 넘기고
+        종료 시 직접 닫습니다.
+        """
+        key = (provider, api_key, "sync")
+
+        def create() -> genai.Client:
+            transport = httpx.HTTPTransport(**self._pool_args())
+            async_transport = httpx.AsyncHTTPTransport(**self._pool_args())
+            timeout = httpx.Timeout(settings.LLM_HTTP_TIMEOUT)
+            client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    client_args={"transport": transport, "timeout": timeout},
+                    async_client_args={
+                        "transport": async_transport,
+                        "timeout": timeout,
+                    },
+                ),
+            )
+            self._genai_transports[key] = (transport, async_transport)
+            return client
+
+        return self._get_or_create(key, create)
+
+    async def aclose(self) -> None:
+        """등록된 모든 클라이언트의 커넥션 풀을 닫습니다. (애플리케이션 종료 시 호출)"""
+        with self._lock:
+            clients = list(self._clients.items())
+            genai_transports = self._genai_transports
+            self._clients.clear()
+            self._genai_transports = {}
+
+        for key, client in clients:
+            try:
+                if isinstance(client, AsyncOpenAI):
+                    await client.close()
+                elif isinstance(client, genai.Client):
+                    transport, async_transport = genai_transports[key]
+                    await async_transport.aclose()
+                    transport.close()
+                else:
+                    client.close()
+            except Exception as e:
+                logger.warning(f"LLM 클라이언트 종료 중 오류 발생 {key[0]}: {e}")
+        logger.info(f"LLM 클라이언트 {len(clients)}개 종료 완료")
+
+
+llm_client_registry = LlmClientRegistry()
@@ -0,0 +1,289 @@
+import asyncio
+import contextlib
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, Generator
+
+from app.src.core.logger import logger
+from app.src.models.message_list import MessageSource
+
+from .base import LlmModels
+
+AUTO_MODEL_NAME = "auto"
+
+# (제공자, 모델 이름)
+Route = tuple[LlmModels, str]
+
+
+class ProviderStats:
+    """제공자/모델별 최근 첫 토큰 지연(TTFT)과 성공/실패 기록."""
+
+    def __init__(self, window: int = 100):
+        self.ttfts: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def record_ttft(self, seconds: float) -> None:
+        self.ttfts.append(seconds)
+
+    def record_success(self) -> None:
+        self.outcomes.append(True)
+        self.consecutive_failures = 0
+
+    def record_failure(self, failure_threshold: int, cooldown: float) -> None:
+        self.outcomes.append(False)
+        self.consecutive_failures += 1
+        if self.consecutive_failures >= failure_threshold:
+            self.cooldown_until = time.monotonic() + cooldown
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def ttft_percentile(self, q: float) -> float | None:
+        if not self.ttfts:
+            return None
+        samples = sorted(self.ttfts)
+        return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+    def is_healthy(self, max_error_rate: float, min_samples: int) -> bool:
+        if time.monotonic() < self.cooldown_until:
+            return False
+        if len(self.outcomes) < min_samples:
+            return True
+        return self.error_rate <= max_error_rate
+
+
+class _StreamAttempt:
+    """하나의 제공자에 보낸 비동기 스트림 요청과 첫 토큰 대기 태스크."""
+
+    def __init__(self, route: Route, stream: AsyncGenerator[str, None]):
+        self.route = route
+        self.stream = stream
+        self.started_at = time.monotonic()
+        self.first_token = asyncio.ensure_future(anext(stream))
+
+    async def close(self) -> None:
+        if not self.first_token.done():
+            self.first_token.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self.first_token
+        with contextlib.suppress(Exception):
+            await self.stream.aclose()
+
+
+class RouterModels(LlmModels):
+    """
+    여러 LLM 제공자를 묶어 가장 빠르고 정상인 제공자로 요청을 보내는 라우터.
+    - 제공자/모델별 최근 TTFT와 오류율을 기록해
+      정상인 제공자 중 TTFT 중앙값이 작은 순서로 시도
+    - 첫 토큰 전에 실패하면 다음 제공자로 넘어감 (첫 토큰 이후 실패는 그대로 전파)
+    - hedge=True이면 첫 토큰이 TTFT p95 안에 오지 않을 때
+      다음 제공자에도 동시에 요청 (비동기 전용)
+    """
+
+    provider_name = "router"
+
+    def __init__(
+        self,
+        routes: list[tuple[LlmModels, str | None]],
+        hedge: bool = False,
+        hedge_min_samples: int = 20,
+        max_error_rate: float = 0.5,
+        min_samples: int = 10,
+        failure_threshold: int = 3,
+        failure_cooldown: float = 30.0,
+        stats_window: int = 100,
+    ):
+        if not routes:
+            raise ValueError("RouterModels requires at least one route")
+        self.routes: list[Route] = [
+            (llm_model, model_name or llm_model.get_default_model_name())
+            for llm_model, model_name in routes
+        ]
+        self.hedge = hedge
+        self.hedge_min_samples = hedge_min_samples
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.failure_threshold = failure_threshold
+        self.failure_cooldown = failure_cooldown
+        self.stats: dict[tuple[str, str], ProviderStats] = {
+            (llm_model.provider_name, model_name): ProviderStats(stats_window)
+            for llm_model, model_name in self.routes
+        }
+
+    def get_api_key(self) -> str:
+        return ""
+
+    def get_default_model_name(self) -> str:
+        return AUTO_MODEL_NAME
+
+    def get_supported_models(self) -> list[str]:
+        return [AUTO_MODEL_NAME, *(model_name for _, model_name in self.routes)]
+
+    def get_context_window(self, model_name: str) -> int:
+        # 어느 제공자로 가더라도 들어가도록 가장 작은 윈도우 사용
+        return min(
+            llm_model.get_context_window(route_model_name)
+            for llm_model, route_model_name in self.routes
+        )
+
+    def get_stats(self, route: Route) -> ProviderStats:
+        llm_model, model_name = route
+        return self.stats[(llm_model.provider_name, model_name)]
+
+    def _ordered_routes(self, model_name: str) -> list[Route]:
+        """
+        정상인 제공자를 TTFT 중앙값 순으로 정렬합니다.
+        요청한 모델이 있으면 가장 먼저 둡니다.
+        """
+
+        def sort_key(route: Route) -> tuple[bool, float]:
+            median = self.get_stats(route).ttft_percentile(0.5)
+            # 기록이 없는 제공자는 먼저 시도해 측정값을 확보
+            return route[1] != model_name, median or 0.0
+
+        healthy = []
+        unhealthy = []
+        for route in self.routes:
+            stats = self.get_stats(route)
+            if stats.is_healthy(self.max_error_rate, self.min_samples):
+                healthy.append(route)
+            else:
+                unhealthy.append(route)
+        # 모두 비정상이면 쿨다운이 먼저 끝나는 제공자부터 시도
+        unhealthy.sort(key=lambda route: self.get_stats(route).cooldown_until)
+        return sorted(healthy, key=sort_key) + unhealthy
+
+    def _record_failure(self, route: Route, error: Exception) -> None:
+        llm_model, model_name = route
+        logger.warning(
+            f"LLM 라우터: {llm_model.provider_name}/{model_name} 실패: {error}"
+        )
+        self.get_stats(route).record_failure(
+            self.failure_threshold, self.failure_cooldown
+        )
+
+    def _get_hedge_delay(self, route: Route) -> float | None:
+        stats = self.get_stats(route)
+        if not self.hedge or len(stats.ttfts) < self.hedge_min_samples:
+            return None
+        return stats.ttft_percentile(0.95)
+
+    def generate_completion_stream(
+        self,
+        messages: MessageSource,
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+    ) -> Generator[str, None, None]:
+        last_error: Exception | None = None
+        for route in self._ordered_routes(model_name):
+            llm_model, route_model_name = route
+            started_at = time.monotonic()
+            received = False
+            try:
+                stream = llm_model.generate_completion_stream(
+                    messages=messages,
+                    model_name=route_model_name,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    top_p=top_p,
+                )
+                for chunk in stream:
+                    if not received:
+                        received = True
+                        self.get_stats(route).record_ttft(time.monotonic() - started_at)
+                    yield chunk
+            except Exception as e:
+                self._record_failure(route, e)
+                if received:
+                    # 이미 일부 응답을 보냈으므로 다른 제공자로 넘어갈 수 없음
+                    raise
+                last_error = e
+                continue
+            self.get_stats(route).record_success()
+            return
+        raise last_error
+
+    async def agenerate_completion_stream(
+        self,
+        messages: MessageSource,
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+        top_p: float,
+    ) -> AsyncGenerator[str, None]:
+        def start(route: Route) -> _StreamAttempt:
+            llm_model, route_model_name = route
+            stream = llm_model.agenerate_completion_stream(
+                messages=messages,
+                model_name=route_model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+            )
+            return _StreamAttempt(route, stream)
+
+        routes = deque(self._ordered_routes(model_name))
+        last_error: Exception | None = None
+        while routes:
+            primary = start(routes.popleft())
+            attempts = [primary]
+            hedge_delay = self._get_hedge_delay(primary.route)
+            if hedge_delay is not None and routes:
+                done, _ = await asyncio.wait({primary.first_token}, timeout=hedge_delay)
+                if not done:
+                    hedge_route = routes.popleft()
+                    logger.info(
+                        f"LLM 라우터: 첫 토큰이 {hedge_delay:.2f}s 안에 오지 않아 "
+                        f"{hedge_route[0].provider_name}/{hedge_route[1]}에 동시 요청"
+                    )
+                    attempts.append(start(hedge_route))
+
+            # 먼저 첫 토큰을 받은 요청을 사용하고 나머지는 취소
+            winner: _StreamAttempt | None = None
+            first_chunk: str | None = None
+            while attempts and winner is None:
+                done, _ = await asyncio.wait(
+                    {attempt.first_token for attempt in attempts},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for attempt in [a for a in attempts if a.first_token in done]:
+                    attempts.remove(attempt)
+                    try:
+                        first_chunk = attempt.first_token.result()
+                    except StopAsyncIteration:
+                        first_chunk = None
+                    except Exception as e:
+                        self._record_failure(attempt.route, e)
+                        last_error = e
+                        await attempt.close()
+                        continue
+                    winner = attempt
+                    break
+            for attempt in attempts:
+                await attempt.close()
+
+            if winner is None:
+                continue
+
+            stats = self.get_stats(winner.route)
+            stats.record_ttft(time.monotonic() - winner.started_at)
+            try:
+                if first_chunk is not None:
+                    yield first_chunk
+                    async for chunk in winner.stream:
+                        yield chunk
+            except Exception as e:
+                self._record_failure(winner.route, e)
+                raise
+            finally:
+                await winner.stream.aclose()
+            stats.record_success()
+            return
+        raise last_error
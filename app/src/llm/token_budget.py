@@ -0,0 +1,137 @@
+import importlib.util
+from abc import ABC, abstractmethod
+
+from app.src.core.logger import logger
+from app.src.models.message import Message, RoleEnum
+from app.src.models.message_list import BaseMessageList, MessageSource, MessageWindow
+
+# tiktoken 패키지가 설치된 경우에만 실제 토크나이저 사용
+TIKTOKEN_AVAILABLE = importlib.util.find_spec("tiktoken") is not None
+
+# 메시지마다 붙는 역할/구분자 토큰 (OpenAI 형식 기준 근사치)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class Tokenizer(ABC):
+    """텍스트의 토큰 수를 계산하는 토크나이저 인터페이스."""
+
+    # 캐시 키 구분에 사용 (토크나이저가 바뀌면 메시지 토큰 수를 다시 계산)
+    name: str
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        pass
+
+
+class EstimatingTokenizer(Tokenizer):
+    """
+    외부 의존성 없이 토큰 수를 근사하는 토크나이저.
+    ASCII는 4글자당 1토큰, 한글 등 비ASCII 문자는 글자당 1토큰으로 계산해
+    실제보다 약간 크게 잡습니다.
+    """
+
+    name = "estimate"
+
+    def count(self, text: str) -> int:
+        ascii_chars = sum(1 for char in text if char.isascii())
+        return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+class TiktokenTokenizer(Tokenizer):
+    """tiktoken 인코딩을 사용하는 토크나이저."""
+
+    def __init__(self, encoding_name: str = "o200k_base"):
+        import tiktoken
+
+        self.name = f"tiktoken.{encoding_name}"
+        self._encoding = tiktoken.get_encoding(encoding_name)
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+def get_default_tokenizer() -> Tokenizer:
+    if TIKTOKEN_AVAILABLE:
+        return TiktokenTokenizer()
+    return EstimatingTokenizer()
+
+
+class TokenBudgeter:
+    """
+    모델의 컨텍스트 윈도우에 맞게 오래된 대화를 잘라냅니다.
+    - 메시지별 토큰 수는 MessageList의 포맷 캐시에 저장되어 새 메시지만 토큰화합니다.
+    - 시스템 메시지와 마지막 메시지는 항상 유지합니다.
+    - 잘라낸 결과가 user 메시지로 시작하도록 맞춥니다.
+    """
+
+    def __init__(
+        self,
+        tokenizer: Tokenizer | None = None,
+        safety_margin: float = 0.05,
+    ):
+        self.tokenizer = tokenizer or get_default_tokenizer()
+        self.safety_margin = safety_margin
+
+    def count_message(self, msg: Message) -> int:
+        return self.tokenizer.count(msg.content) + MESSAGE_OVERHEAD_TOKENS
+
+    def count_messages(self, messages: MessageSource) -> list[int]:
+        """메시지별 토큰 수 (MessageList 계열은 캐시 사용)"""
+        if isinstance(messages, BaseMessageList | MessageWindow):
+            return messages.get_formatted(
+                f"tokens.{self.tokenizer.name}", self.count_message
+            )
+        return [self.count_message(msg) for msg in messages]
+
+    def get_budget(self, context_window: int, max_tokens: int) -> int:
+        """출력 토큰과 여유분을 제외한 입력 토큰 예산"""
+        return int(context_window * (1 - self.safety_margin)) - max_tokens
+
+    def fit(
+        self,
+        messages: MessageSource,
+        context_window: int,
+        max_tokens: int,
+    ) -> MessageSource:
+        """
+        예산 안에 들어오면 원본을 그대로 반환하고,
+        넘치면 오래된 메시지를 제외한 뷰(MessageWindow) 또는 리스트를 반환합니다.
+        """
+        if isinstance(messages, MessageWindow):
+            # 이미 잘린 뷰는 원본 기준으로 다시 계산
+            messages = messages.source
+
+        counts = self.count_messages(messages)
+        budget = self.get_budget(context_window, max_tokens)
+        total = sum(counts)
+        if total <= budget or len(counts) <= 1:
+            return messages
+
+        if isinstance(messages, BaseMessageList):
+            roles = messages.get_roles()
+        else:
+            roles = [msg.role for msg in messages]
+        start = 0
+        last = len(counts) - 1
+        while total > budget and start < last:
+            if roles[start] != RoleEnum.system:
+                total -= counts[start]
+            start += 1
+        # 잘린 대화가 assistant 메시지로 시작하지 않도록 다음 user 메시지까지 제외
+        while start < last and roles[start] != RoleEnum.user:
+            if roles[start] != RoleEnum.system:
+                total -= counts[start]
+            start += 1
+
+        if total > budget:
+            logger.warning(
+                f"메시지를 잘라낸 후에도 토큰 예산을 초과합니다: {total} > {budget}"
+            )
+
+        if isinstance(messages, BaseMessageList):
+            return MessageWindow(messages, start)
+        return [
+            msg
+            for index, msg in enumerate(messages)
+            if index >= start or msg.role == RoleEnum.system
+        ]
@@ -0,0 +1,59 @@
+from collections.abc import Iterator
+
+from app.src.models.message import Message, RoleEnum
+from app.src.models.message_list import DEFAULT_SYSTEM_MESSAGE, BaseMessageList
+
+# 역할은 1바이트 코드로 저장하고, 공유되는 RoleEnum 인스턴스로 복원
+_ROLES: tuple[RoleEnum, ...] = (RoleEnum.system, RoleEnum.user, RoleEnum.assistant)
+_ROLE_CODES: dict[RoleEnum, int] = {role: code for code, role in enumerate(_ROLES)}
+
+
+class CompactMessageList(BaseMessageList):
+    """
+    MessageList와 같은 API를 제공하는 메모리 절약형 메시지 저장소.
+    역할 코드(bytearray)와 내용(list[str])을 병렬 배열로 보관하고,
+    pydantic Message 객체는 get_messages() 등 API 경계에서만 생성합니다.
+    """
+
+    __slots__ = ("_roles", "_contents")
+
+    def __init__(
+        self,
+        system_message: str = DEFAULT_SYSTEM_MESSAGE,
+    ):
+        super().__init__()
+        self._roles = bytearray()
+        self._contents: list[str] = []
+        if system_message:
+            self.addSystem(system_message)
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def _append(self, role: RoleEnum, content: str) -> None:
+        self._roles.append(_ROLE_CODES[role])
+        self._contents.append(content)
+
+    def addSystem(self, content: str) -> None:
+        self._append(RoleEnum.system, content)
+
+    def addUser(self, content: str) -> None:
+        self._append(RoleEnum.user, content)
+
+    def addAssistant(self, content: str) -> None:
+        self._append(RoleEnum.assistant, content)
+
+    def get_messages(self) -> list[Message]:
+        """
+        저장된 메시지를 pydantic Message 리스트로 변환해 반환합니다.
+        호출할 때마다 새 리스트를 만들므로 반환값을 수정해도 저장소에는 영향이 없습니다.
+        """
+        return list(self._iter_messages())
+
+    def _iter_messages(self, start: int = 0) -> Iterator[Message]:
+        for index in range(start, len(self._contents)):
+            # 역할은 add 메서드가 정하므로 검증 없이 생성
+            yield Message.model_construct(
+                role=_ROLES[self._roles[index]],
+                content=self._contents[index],
+            )
@@ -1,18 +1,118 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from typing import Any
+
 from app.src.models.message import Message, RoleEnum
 
 DEFAULT_SYSTEM_MESSAGE = None
 
+# 메시지 하나를 provider 형식으로 변환하는 함수 (None을 반환하면 결과에서 제외)
+MessageFormatter = Callable[[Message], Any]
+
+
+class _FormattedCache:
+    """provider 형식으로 변환된 결과와 변환을 마친 위치를 저장합니다."""
+
+    __slots__ = ("items", "consumed", "last_message")
+
+    def __init__(self):
+        self.items: list[Any] = []
+        self.consumed: int = 0
+        self.last_message: Message | None = None
+
+
+def _get_role(msg: Message) -> RoleEnum:
+    return msg.role
+
+
+class BaseMessageList(ABC):
+    """대화 메시지 저장소의 공통 인터페이스와 provider 포맷 캐시."""
+
+    __slots__ = ("_formatted_cache",)
+
+    def __init__(self):
+        self._formatted_cache: dict[str, _FormattedCache] = {}
+
+    @abstractmethod
+    def addSystem(self, content: str) -> None:
+        pass
+
+    @abstractmethod
+    def addUser(self, content: str) -> None:
+        pass
+
+    @abstractmethod
+    def addAssistant(self, content: str) -> None:
+        pass
+
+    @abstractmethod
+    def get_messages(self) -> list[Message]:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    @abstractmethod
+    def _iter_messages(self, start: int = 0) -> Iterator[Message]:
+        """start 위치부터 메시지를 순회합니다."""
+        pass
+
+    def __iter__(self) -> Iterator[Message]:
+        return self._iter_messages()
+
+    def get_formatted(self, key: str, formatter: MessageFormatter) -> list[Any]:
+        """
+        key별로 변환 결과를 캐시하고, 마지막 호출 이후 추가된 메시지만 변환합니다.
+        메시지 리스트는 append-only로 가정하며,
+        외부에서 리스트가 수정된 경우 전체를 다시 변환합니다.
+        """
+        # 새 리스트를 반환하므로 호출자가 결과를 수정해도 캐시는 오염되지 않음
+        return [
+            item
+            for item in self._get_formatted_items(key, formatter)
+            if item is not None
+        ]
 
-class MessageList:
+    def get_roles(self) -> list[RoleEnum]:
+        """메시지별 역할 목록 (캐시되므로 메시지 객체를 다시 만들지 않음)"""
+        return self._get_formatted_items("role", _get_role)
+
+    def _get_formatted_items(self, key: str, formatter: MessageFormatter) -> list[Any]:
+        """메시지와 1:1로 대응하는 캐시된 변환 결과 (제외된 메시지는 None)"""
+        cache = self._formatted_cache.get(key)
+        if cache is None or not self._is_cache_valid(cache):
+            cache = _FormattedCache()
+            self._formatted_cache[key] = cache
+
+        cache.items.extend(
+            formatter(msg) for msg in self._iter_messages(cache.consumed)
+        )
+        cache.consumed = len(self)
+        cache.last_message = self._last_message()
+        return cache.items
+
+    def _is_cache_valid(self, cache: _FormattedCache) -> bool:
+        return cache.consumed <= len(self)
+
+    def _last_message(self) -> Message | None:
+        return None
+
+
+class MessageList(BaseMessageList):
     def __init__(
         self,
         system_message: str = DEFAULT_SYSTEM_MESSAGE,
     ):
+        super().__init__()
         # 기본 메시지를 초기화
         self.messages: list[Message] = []
         if system_message:
             self.addSystem(system_message)
 
+    def __len__(self) -> int:
+        return len(self.messages)
+
     def addSystem(self, content: str) -> None:
         # 시스템 메시지를 추가
         self.messages.append(Message(role=RoleEnum.system, content=content))
@@ -28,3 +128,60 @@ class MessageList:
     def get_messages(self) -> list[Message]:
         # 구성된 메시지 리스트를 반환
         return self.messages
+
+    def _iter_messages(self, start: int = 0) -> Iterator[Message]:
+        return iter(self.messages[start:])
+
+    def _is_cache_valid(self, cache: _FormattedCache) -> bool:
+        # self.messages는 외부에서 직접 수정될 수 있으므로 마지막 변환 메시지를 비교
+        if not super()._is_cache_valid(cache):
+            return False
+        if cache.consumed == 0:
+            return True
+        return self.messages[cache.consumed - 1] is cache.last_message
+
+    def _last_message(self) -> Message | None:
+        return self.messages[-1] if self.messages else None
+
+
+class MessageWindow:
+    """
+    BaseMessageList의 읽기 전용 뷰.
+    start 이전의 메시지는 제외하되 시스템 메시지는 유지합니다.
+    원본 저장소의 포맷 캐시를 그대로 사용하므로 잘라낸 대화도 새 메시지만 변환합니다.
+    """
+
+    __slots__ = ("source", "start")
+
+    def __init__(self, source: BaseMessageList, start: int):
+        self.source = source
+        self.start = start
+
+    def _is_kept(self, index: int, roles: list[RoleEnum]) -> bool:
+        return index >= self.start or roles[index] == RoleEnum.system
+
+    def __len__(self) -> int:
+        roles = self.source.get_roles()
+        return sum(1 for index in range(len(roles)) if self._is_kept(index, roles))
+
+    def __iter__(self) -> Iterator[Message]:
+        roles = self.source.get_roles()
+        for index, msg in enumerate(self.source):
+            if self._is_kept(index, roles):
+                yield msg
+
+    def get_messages(self) -> list[Message]:
+        return list(self)
+
+    def get_formatted(self, key: str, formatter: MessageFormatter) -> list[Any]:
+        items = self.source._get_formatted_items(key, formatter)
+        roles = self.source.get_roles()
+        return [
+            item
+            for index, item in enumerate(items)
+            if item is not None and self._is_kept(index, roles)
+        ]
+
+
+# provider와 ChatClient가 받을 수 있는 메시지 형식
+MessageSource = list[Message] | BaseMessageList | MessageWindow
@@ -1,19 +1,20 @@
 import asyncio
-import random
-from datetime import datetime
 
 import httpx
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy import Result, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import selectinload
 
 from app.src.core.config import settings
 from app.src.core.logger import logger
+from app.src.domain.hotdeal.crawl_state import CrawlStateManager
 from app.src.domain.hotdeal.enums import SiteName
-from app.src.domain.hotdeal.models import Keyword, KeywordSite
+from app.src.domain.hotdeal.models import Keyword
+from app.src.domain.hotdeal.repositories import delete_orphan_keywords
 from app.src.domain.hotdeal.schemas import CrawledKeyword
+from app.src.domain.hotdeal.utils import normalize_keyword
 from app.src.domain.mail.models import MailLog
 from app.src.domain.user.models import User, user_keywords
 
@@ -56,107 +57,68 @@ AsyncSessionLocal = async_sessionmaker(
 PROXY_MANAGER = ProxyManager()
 
 
-async def handle_keyword(
-    keyword: Keyword,
-    client: httpx.AsyncClient,
-) -> tuple[Keyword, list[CrawledKeyword]] | None:
-    """
-    단일 키워드를 크롤링하고, 신규 핫딜이 있는 경우 결과를 반환합니다.
-    """
-    # 각 작업 사이에 랜덤한 지연을 주어 서버 부하를 분산
-    delay = random.uniform(1, 5)
-    await asyncio.sleep(delay)
+# 사이트별 크롤러 (크롤링 계획의 사이트 목록)
+CRAWLERS: dict[SiteName, type[BaseCrawler]] = {
+    SiteName.ALGUMON: AlgumonCrawler,
+}
 
-    logger.info(f"[INFO] 키워드 처리: [{keyword.title}]")
+# 크롤링 계획: (사이트, 정규화된 검색어) -> 해당 요청 결과를 공유하는 키워드 목록
+CrawlPlan = dict[tuple[SiteName, str], list[Keyword]]
 
-    async with AsyncSessionLocal() as session:
-        crawled_data: list[CrawledKeyword] = await get_new_hotdeal_keywords(
-            session=session,
-            keyword=keyword,
-            client=client,
-        )
 
-    if crawled_data:
-        logger.info(
-            f"[INFO] 키워드 처리: [{keyword.title}] 신규 핫딜 {len(crawled_data)}건 발견"
-        )
-        return keyword, crawled_data
-    else:
-        logger.info(f"[INFO] 키워드 처리: [{keyword.title}] 크롤링 결과 없음")
-        return None
+def normalize_crawl_query(title: str) -> str:
+    """키워드 제목을 검색어로 정규화합니다. (normalize_keyword + 연속 공백 정리)"""
+    return " ".join(normalize_keyword(title).split())
+
+
+def build_crawl_plan(keywords: list[Keyword]) -> CrawlPlan:
+    """
+    이번 주기에 보낼 (사이트, 검색어) 요청을 중복 없이 계산합니다.
+    검색어가 같은 키워드는 한 번의 요청 결과를 함께 사용하므로,
+    요청 수는 구독 수가 아닌 서로 다른 검색어 수에 비례합니다.
+    """
+    plan: CrawlPlan = {}
+    for keyword in keywords:
+        query = normalize_crawl_query(keyword.title)
+        if not query:
+            continue
+        for site_name in CRAWLERS:
+            plan.setdefault((site_name, query), []).append(keyword)
+    return plan
 
 
-async def get_new_hotdeal_keywords(
-    session: AsyncSession,
-    keyword: Keyword,
+async def handle_crawl_target(
+    site_name: SiteName,
+    query: str,
+    keywords: list[Keyword],
     client: httpx.AsyncClient,
-) -> list[CrawledKeyword]:
+    crawl_state: CrawlStateManager,
+) -> list[tuple[Keyword, list[CrawledKeyword]]]:
     """
-    새로운 핫딜 키워드를 조회합니다.
-    1. 해당 키워드로 크롤링을 수행하여 최신 핫딜 목록을 가져옵니다.
-    2. DB에서 이전에 저장된 KeywordSite 정보를 조회하여 마지막으로 확인한 핫딜을 찾습니다.
-    3. 최신 핫딜 목록과 마지막 확인 핫딜을 비교하여 새로운 핫딜만 필터링합니다.
-    4. 새로운 핫딜이 있는 경우, KeywordSite 정보를 최신 핫딜로 업데이트하고 새로운 핫딜 목록을 반환합니다.
-    5. 새로운 핫딜이 없는 경우, 빈 목록을 반환합니다.
+    (사이트, 검색어)를 한 번 크롤링하고, 결과를 검색어가 같은 키워드마다 비교해
+    신규 핫딜이 있는 키워드와 핫딜 목록을 반환합니다.
+    비교는 crawl_state에서 메모리로 처리하며, DB 저장은 주기 끝에 한 번에 합니다.
     """
-    # 1. 크롤링으로 최신 핫딜 목록 가져오기
-    algumon_crawler: BaseCrawler = AlgumonCrawler(keyword=keyword.title, client=client)
-    latest_products: list[CrawledKeyword] = await algumon_crawler.fetchparse()
+    logger.info(
+        f"[INFO] 검색어 처리: [{site_name.value}:{query}] 키워드 {len(keywords)}개"
+    )
 
+    crawler: BaseCrawler = CRAWLERS[site_name](keyword=query, client=client)
+    latest_products: list[CrawledKeyword] = await crawler.fetchparse()
     if not latest_products:
+        logger.info(f"[INFO] 검색어 처리: [{query}] 크롤링 결과 없음")
         return []
 
-    # 2. DB에서 이전에 저장된 KeywordSite 정보 조회
-    stmt = select(KeywordSite).where(
-        KeywordSite.site_name == SiteName.ALGUMON,
-        KeywordSite.keyword_id == keyword.id,
-    )
-    result: Result = await session.execute(stmt)
-    last_crawled_site: KeywordSite | None = result.scalars().one_or_none()
-
-    # 3. 새로운 핫딜 필터링
-    new_deals: list[CrawledKeyword] = []
-    if not last_crawled_site:
-        # 첫 크롤링인 경우, 최신 1개만 새로운 핫딜로 간주
-        new_deals = latest_products[:1]
-    else:
-        # 마지막으로 크롤링된 핫딜의 인덱스를 찾음
-        try:
-            last_crawled_index = [p.id for p in latest_products].index(
-                last_crawled_site.external_id
-            )
-            new_deals = latest_products[:last_crawled_index]
-        except ValueError:
-            # 마지막으로 크롤링된 핫딜이 목록에 없으면 전부 새로운 핫딜로 간주
-            new_deals = latest_products
-
-    # 4. 새로운 핫딜이 있으면 DB 업데이트 및 반환
-    if new_deals:
-        newest_product = new_deals[0]
-        if last_crawled_site:
-            # 기존 정보 업데이트
-            last_crawled_site.external_id = newest_product.id
-            last_crawled_site.link = newest_product.link
-            last_crawled_site.price = newest_product.price
-            last_crawled_site.meta_data = newest_product.meta_data
-            last_crawled_site.wdate = datetime.now()
-        else:
-            # 첫 크롤링 정보 저장
-            new_site_entry = KeywordSite(
-                keyword_id=keyword.id,
-                site_name=SiteName.ALGUMON,
-                external_id=newest_product.id,
-                link=newest_product.link,
-                price=newest_product.price,
-                meta_data=newest_product.meta_data,
+    results: list[tuple[Keyword, list[CrawledKeyword]]] = []
+    for keyword in keywords:
+        new_deals = crawl_state.find_new_deals(keyword.id, site_name, latest_products)
+        if new_deals:
+            logger.info(
+                f"[INFO] 키워드 처리: [{keyword.title}] "
+                f"신규 핫딜 {len(new_deals)}건 발견"
             )
-            session.add(new_site_entry)
-
-        await session.commit()
-        return new_deals
-
-    # 5. 새로운 핫딜이 없으면 빈 목록 반환
-    return []
+            results.append((keyword, new_deals))
+    return results
 
 
 async def job():
@@ -196,6 +158,11 @@ async def job():
             user_stmt = select(User).options(selectinload(User.keywords))
             user_result = await session.execute(user_stmt)
             all_users_with_keywords = user_result.scalars().unique().all()
+
+            # 이번 주기의 크롤링 상태를 한 번에 조회
+            crawl_state = await CrawlStateManager.load(
+                session, [keyword.id for keyword in keywords_to_process]
+            )
     except Exception as e:
         logger.error(f"DB 조회 중 오류 발생: {e}")
         return  # DB 조회 실패 시 작업 중단
@@ -207,34 +174,46 @@ async def job():
     PROXY_MANAGER.reset_proxies()
     PROXY_MANAGER.fetch_proxies()
 
-    id_to_crawled_keyword: dict[Keyword, list[CrawledKeyword]] = {}
+    # 검색어가 같은 키워드는 한 번만 크롤링
+    crawl_plan = build_crawl_plan(keywords_to_process)
+    logger.info(
+        f"[INFO] 크롤링 계획: 키워드 {len(keywords_to_process)}개 "
+        f"-> 요청 {len(crawl_plan)}개"
+    )
 
-    # 동시 실행 개수를 5개로 제한하는 세마포어 생성
-    semaphore = asyncio.Semaphore(5)
+    id_to_crawled_keyword: dict[Keyword, list[CrawledKeyword]] = {}
 
     async with httpx.AsyncClient() as client:
-        # 각 키워드를 세마포어 제어 하에 처리하는 태스크 리스트 생성
-        async def sem_handle_keyword(keyword: Keyword):
-            async with semaphore:
-                # 세마포어 내에서도 짧은 랜덤 딜레이를 주면 부하를 더 분산시킬 수 있습니다.
-                await asyncio.sleep(random.uniform(0.5, 1.5))
-                return await handle_keyword(keyword, client)
+        # 요청 간격과 동시 요청 수는 크롤러의 호스트별 스케줄러가 조절
+        targets = list(crawl_plan.items())
+        tasks = [
+            handle_crawl_target(site_name, query, keywords, client, crawl_state)
+            for (site_name, query), keywords in targets
+        ]
 
-        tasks = [sem_handle_keyword(kw) for kw in keywords_to_process]
-
-        # asyncio.gather로 모든 작업을 동시에 실행 (세마포어가 동시성 제어)
         # return_exceptions=True를 통해 일부 작업이 실패해도 전체가 중단되지 않도록 함
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    # 결과 처리
-    for i, res in enumerate(results):
+    # 결과를 검색어를 공유하는 키워드마다 분배
+    for ((site_name, query), _), res in zip(targets, results, strict=True):
         if isinstance(res, Exception):
-            # 실패한 경우, 어떤 키워드에서 오류가 났는지 로깅
-            failed_keyword = keywords_to_process[i]
-            logger.error(f"키워드 '[{failed_keyword.title}]' 처리 중 오류 발생: {res}")
-        elif res:
-            keyword, deals = res
-            id_to_crawled_keyword[keyword] = deals
+            # 실패한 경우, 어떤 검색어에서 오류가 났는지 로깅
+            logger.error(
+                f"검색어 '[{site_name.value}:{query}]' 처리 중 오류 발생: {res}"
+            )
+            continue
+        for keyword, deals in res:
+            id_to_crawled_keyword.setdefault(keyword, []).extend(deals)
+
+    # 바뀐 크롤링 상태를 한 번에 저장
+    # (저장 실패 시 다음 주기에 다시 감지되도록 메일 발송 생략)
+    try:
+        async with AsyncSessionLocal() as session:
+            saved = await crawl_state.flush(session)
+        logger.info(f"[INFO] 크롤링 상태 {saved}건 저장")
+    except Exception as e:
+        logger.error(f"크롤링 상태 저장 중 오류 발생: {e}")
+        return
 
     logger.info("[INFO] 모든 키워드 크롤링 완료. 메일 발송 시작...")
 
@@ -308,6 +287,21 @@ async def job():
     logger.info("[INFO] 메일 발송 완료 및 크롤링 결과 초기화")
 
 
+async def sweep_orphan_keywords():
+    """
+    구독자가 없는 키워드와 KeywordSite를 일괄 삭제합니다.
+    연결 해제 시 즉시 정리되지만,
+    사용자 삭제 등 일괄 변경으로 남은 키워드를 주기적으로 정리합니다.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            deleted = await delete_orphan_keywords(session)
+        if deleted:
+            logger.info(f"[INFO] 구독자가 없는 키워드 {deleted}개 삭제")
+    except Exception as e:
+        logger.error(f"고아 키워드 정리 중 오류 발생: {e}")
+
+
 async def main():
     scheduler = AsyncIOScheduler(timezone="Asia/Seoul")
 
@@ -321,6 +315,13 @@ async def main():
         id="hotdeal_worker",
         replace_existing=True,
     )
+    # 크롤링 작업과 겹치지 않는 시각에 매시간 실행
+    scheduler.add_job(
+        sweep_orphan_keywords,
+        trigger=CronTrigger(minute="15"),
+        id="orphan_keyword_sweeper",
+        replace_existing=True,
+    )
     scheduler.start()
     logger.info(
         "[INFO] Worker 스케줄러 시작: 매시 정각 및 30분마다 크롤링 및 메일 발송"
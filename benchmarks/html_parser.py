@@ -0,0 +1,53 @@
+"""
+알구몬 검색 결과 HTML 파서 구현별 처리량 비교
+
+저장된 검색 결과 페이지(기본: tests/Infrastructure/crawling/fixtures/*.html)를
+각 파서로 반복 파싱하여 초당 처리 페이지 수를 측정합니다.
+
+실행: PYTHONPATH=. poetry run python benchmarks/html_parser.py [페이지 파일 ...]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler
+
+FIXTURE_DIR = Path(__file__).parent.parent / "tests/Infrastructure/crawling/fixtures"
+
+
+def measure(parser, pages: list[str], iterations: int, repeat: int) -> float:
+    """repeat번 측정한 값 중 가장 높은 초당 처리 페이지 수 반환"""
+    best = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for page in pages:
+                parser(page)
+        best = max(best, iterations * len(pages) / (time.perf_counter() - started))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("pages", nargs="*", type=Path)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = args.pages or sorted(FIXTURE_DIR.glob("*.html"))
+    pages = [path.read_text(encoding="utf-8") for path in paths]
+    total_kb = sum(len(page.encode()) for page in pages) / 1024
+    print(
+        f"페이지 {len(pages)}개 ({total_kb:.0f}KB), "
+        f"반복 {args.iterations}회 x {args.repeat}"
+    )
+    print(f"{'backend':<8} {'pages/s':>10} {'items':>6}")
+    for name, parse in AlgumonCrawler.parsers.items():
+        items = sum(len(parse(page)) for page in pages)
+        pages_per_second = measure(parse, pages, args.iterations, args.repeat)
+        print(f"{name:<8} {pages_per_second:10.0f} {items:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+액세스 토큰 검증 캐시 유무에 따른 /api/hotdeal/v1/keywords 처리량 비교
+
+SQLite 인메모리 DB에 사용자 한 명을 만들고 같은 토큰으로 반복 요청합니다.
+
+실행: PYTHONPATH=. poetry run python benchmarks/keyword_list_auth.py
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.main import app
+from app.src.core.config import settings
+from app.src.core.database import Base
+from app.src.core.dependencies.auth import access_token_cache, create_access_token
+from app.src.core.dependencies.db_session import get_db
+from app.src.domain.user.enums import AuthLevel
+from app.src.domain.user.models import User
+
+
+async def setup_database() -> async_sessionmaker[AsyncSession]:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+
+async def run(
+    client: httpx.AsyncClient, token: str, requests: int, concurrency: int
+) -> float:
+    """초당 처리 요청 수 반환"""
+    headers = {"Authorization": f"Bearer {token}"}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request():
+        async with semaphore:
+            response = await client.get("/api/hotdeal/v1/keywords", headers=headers)
+            assert response.status_code == 200, response.text
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request() for _ in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def main_async(args: argparse.Namespace):
+    session_factory = await setup_database()
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    user_id = uuid.uuid4()
+    async with session_factory() as session:
+        session.add(
+            User(
+                id=user_id,
+                email="bench@example.com",
+                nickname="bench",
+                hashed_password="unused",
+                is_active=True,
+            )
+        )
+        await session.commit()
+    token = await create_access_token(
+        user_id, "bench@example.com", "bench", AuthLevel.USER
+    )
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # 워밍업
+        await run(client, token, 50, args.concurrency)
+        for enabled in (False, True):
+            settings.ACCESS_TOKEN_CACHE_ENABLED = enabled
+            access_token_cache.clear()
+            rps = await run(client, token, args.requests, args.concurrency)
+            label = "캐시 사용" if enabled else "캐시 없음"
+            print(f"{label:<8} {rps:8.1f} req/s")
+        print(f"캐시 통계: {access_token_cache.stats()}")
+
+    app.dependency_overrides.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    print(f"요청 {args.requests}개, 동시성 {args.concurrency}")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
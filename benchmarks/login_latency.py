@@ -0,0 +1,106 @@
+"""
+동시 로그인 부하에서 bcrypt 동기 호출과 전용 스레드 풀 호출의 지연 시간 비교
+
+로그인 요청은 DB 조회(sleep으로 대체) + 비밀번호 검증으로 구성하고,
+같은 이벤트 루프에서 가벼운 요청(ping)을 함께 보내 루프가 막히는 정도를 측정합니다.
+
+실행: PYTHONPATH=. poetry run python benchmarks/login_latency.py
+"""
+
+import argparse
+import asyncio
+import time
+
+import bcrypt
+
+from app.src.core.security import (
+    PasswordHashExecutor,
+    verify_password,
+)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def run_load(
+    mode: str,
+    hashed: str,
+    concurrency: int,
+    requests: int,
+    db_latency: float,
+    executor: PasswordHashExecutor,
+) -> tuple[list[float], list[float]]:
+    """(로그인 지연 목록, ping 지연 목록) 반환"""
+    semaphore = asyncio.Semaphore(concurrency)
+    login_latencies: list[float] = []
+    ping_latencies: list[float] = []
+
+    async def login():
+        async with semaphore:
+            started = time.perf_counter()
+            await asyncio.sleep(db_latency)
+            if mode == "sync":
+                ok = verify_password("password", hashed)
+            else:
+                ok = await executor.run(verify_password, "password", hashed)
+            assert ok
+            login_latencies.append(time.perf_counter() - started)
+
+    async def ping(stop: asyncio.Event):
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            ping_latencies.append(time.perf_counter() - started - 0.005)
+
+    stop = asyncio.Event()
+    ping_task = asyncio.create_task(ping(stop))
+    await asyncio.gather(*(login() for _ in range(requests)))
+    stop.set()
+    await ping_task
+    return login_latencies, ping_latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--db-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    hashed = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=args.rounds)).decode()
+    executor = PasswordHashExecutor(max_workers=args.workers)
+    print(f"bcrypt cost {args.rounds}, 요청 {args.requests}개, 스레드 {args.workers}개")
+    print(
+        f"{'mode':<6} {'동시성':>6} {'login p50':>10} {'login p99':>10} "
+        f"{'ping p99':>10} {'처리량':>10}"
+    )
+    for concurrency in args.concurrency:
+        for mode in ("sync", "async"):
+            started = time.perf_counter()
+            logins, pings = asyncio.run(
+                run_load(
+                    mode,
+                    hashed,
+                    concurrency,
+                    args.requests,
+                    args.db_latency_ms / 1000,
+                    executor,
+                )
+            )
+            elapsed = time.perf_counter() - started
+            print(
+                f"{mode:<6} {concurrency:>6} "
+                f"{percentile(logins, 0.5) * 1000:8.1f}ms "
+                f"{percentile(logins, 0.99) * 1000:8.1f}ms "
+                f"{percentile(pings, 0.99) * 1000:8.1f}ms "
+                f"{args.requests / elapsed:7.1f}/s"
+            )
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+MessageList와 CompactMessageList의 메모리 사용량 비교 벤치마크
+
+실행: PYTHONPATH=. poetry run python benchmarks/message_list_memory.py
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from app.src.models.compact_message_list import CompactMessageList
+from app.src.models.message_list import BaseMessageList, MessageList
+
+
+def build_conversations(
+    list_class: type[BaseMessageList],
+    conversations: int,
+    turns: int,
+) -> list[BaseMessageList]:
+    result = []
+    for i in range(conversations):
+        message_list = list_class(system_message="당신은 친절한 어시스턴트입니다.")
+        for turn in range(turns):
+            message_list.addUser(f"질문 {i}-{turn}")
+            message_list.addAssistant(f"답변 {i}-{turn}")
+        result.append(message_list)
+    return result
+
+
+def measure(
+    list_class: type[BaseMessageList],
+    conversations: int,
+    turns: int,
+) -> tuple[int, float]:
+    """(할당된 바이트 수, 생성 시간) 반환"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    conversations_ = build_conversations(list_class, conversations, turns)
+    elapsed = time.perf_counter() - started
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del conversations_
+    return allocated, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--conversations", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    messages = args.conversations * (args.turns * 2 + 1)
+    print(f"대화 {args.conversations}개, 메시지 총 {messages}개")
+
+    baseline = None
+    for list_class in (MessageList, CompactMessageList):
+        allocated, elapsed = measure(list_class, args.conversations, args.turns)
+        baseline = baseline or allocated
+        print(
+            f"{list_class.__name__:<20} "
+            f"{allocated / 1024 / 1024:8.2f} MiB "
+            f"({allocated / messages:6.1f} B/msg, {allocated / baseline:5.1%}) "
+            f"생성 {elapsed * 1000:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
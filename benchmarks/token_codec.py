@@ -0,0 +1,53 @@
+"""
+JWT 코덱 구현별 인코딩/디코딩 처리량 비교
+
+액세스 토큰과 같은 형식의 페이로드로 각 구현의 초당 처리 횟수를 측정합니다.
+
+실행: PYTHONPATH=. poetry run python benchmarks/token_codec.py
+"""
+
+import argparse
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.src.core.token_codec import TOKEN_CODECS
+from app.src.domain.user.enums import AuthLevel
+
+
+def measure(func, arg, iterations: int, repeat: int) -> float:
+    """repeat번 측정한 값 중 가장 높은 초당 처리 횟수 반환"""
+    best = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func(arg)
+        best = max(best, iterations / (time.perf_counter() - started))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    payload = {
+        "user_id": str(uuid.uuid4()),
+        "email": "bench@example.com",
+        "nickname": "bench",
+        "auth_level": AuthLevel.USER,
+        "exp": datetime.now(UTC) + timedelta(minutes=30),
+    }
+    print(f"반복 {args.iterations}회 x {args.repeat}")
+    print(f"{'backend':<8} {'encode ops/s':>14} {'decode ops/s':>14}")
+    for name, codec_class in TOKEN_CODECS.items():
+        codec = codec_class("benchmark-secret-key")
+        token = codec.encode(payload)
+        encode_ops = measure(codec.encode, payload, args.iterations, args.repeat)
+        decode_ops = measure(codec.decode, token, args.iterations, args.repeat)
+        print(f"{name:<8} {encode_ops:14.0f} {decode_ops:14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,7 +12,7 @@ message_list = MessageList()
 
 chat_client = ChatClient(
     llm_model=GeminiModels(),
-    messages=message_list.get_messages(),
+    messages=message_list,
 )
 
 message_list.addUser(
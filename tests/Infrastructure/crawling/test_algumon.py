@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.src.Infrastructure.crawling.crawlers.algumon import (
+    AlgumonCrawler,
+    parse_with_bs4,
+    parse_with_stream,
+)
+
+FIXTURE_PAGES = sorted((Path(__file__).parent / "fixtures").glob("*.html"))
+
+EDGE_CASE_PAGE = """
+<ul class="menu"><li data-post-id="0" data-action-uri="/l/d/0">
+  <a class="product-link">메뉴</a></li></ul>
+<ul class="product  post-list">
+  <li data-post-id="3" data-action-uri=" /l/d/3 ">
+    <a class="title product-link" href="/l/d/3"> 키보드 <b>특가</b> &lt;한정&gt; </a>
+    <small class="product-price">10,000원</small>
+    <small class="deal-price-meta-info">
+      무료 배송
+    </small>
+    <small class="product-price">두 번째 가격</small>
+  </li>
+  <li data-post-id="2"><a class="product-link">action-uri 없음</a></li>
+  <li data-post-id="1" data-action-uri="/l/d/1"><span>링크 없음</span></li>
+  <li data-post-id="4" data-action-uri="/l/d/4"><a class="product-link"></a></li>
+</ul>
+<ul class="product post-list"><li data-post-id="9" data-action-uri="/l/d/9">
+  <a class="product-link">두 번째 리스트</a></li></ul>
+"""
+
+
+@pytest.mark.parametrize("page_path", FIXTURE_PAGES, ids=lambda path: path.name)
+def test_stream_parser_matches_bs4_on_fixture_pages(page_path: Path):
+    """저장된 검색 결과 페이지에서 두 파서의 결과가 같은지 테스트"""
+    html = page_path.read_text(encoding="utf-8")
+
+    products = parse_with_stream(html)
+
+    assert products
+    assert products == parse_with_bs4(html)
+
+
+@pytest.mark.parametrize("parser", [parse_with_stream, parse_with_bs4])
+def test_parsers_handle_edge_cases(parser):
+    """첫 번째 상품 리스트만, 필수 값이 있는 항목만 뽑는지 테스트"""
+    products = parser(EDGE_CASE_PAGE)
+
+    assert [product.model_dump() for product in products] == [
+        {
+            "id": "3",
+            "title": "키보드 특가 <한정>",
+            "link": "https://www.algumon.com/l/d/3",
+            "price": "10,000원",
+            "meta_data": "무료배송",
+        },
+        {
+            "id": "4",
+            "title": "",
+            "link": "https://www.algumon.com/l/d/4",
+            "price": None,
+            "meta_data": "",
+        },
+    ]
+    assert parser("<html><body><ul><li>없음</li></ul></body></html>") == []
+
+
+@pytest.mark.asyncio
+async def test_crawler_uses_parser_backend():
+    """parser_backend 설정에 따라 파서를 선택하는지 테스트"""
+    async with httpx.AsyncClient() as client:
+        crawler = AlgumonCrawler(keyword="키보드", client=client)
+        assert crawler.parser_backend == "stream"
+        assert [product.id for product in crawler.parse(EDGE_CASE_PAGE)] == ["3", "4"]
+
+        crawler = AlgumonCrawler(keyword="키보드", client=client, parser_backend="bs4")
+        assert [product.id for product in crawler.parse(EDGE_CASE_PAGE)] == ["3", "4"]
+
+        crawler = AlgumonCrawler(
+            keyword="키보드", client=client, parser_backend="unknown"
+        )
+        with pytest.raises(ValueError):
+            crawler.parse(EDGE_CASE_PAGE)
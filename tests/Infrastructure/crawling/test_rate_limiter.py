@@ -0,0 +1,161 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.src.Infrastructure.crawling.crawlers.algumon import AlgumonCrawler
+from app.src.Infrastructure.crawling.rate_limiter import (
+    HostRateLimiter,
+    get_host_rate_limiter,
+    parse_retry_after,
+)
+
+
+@pytest.mark.asyncio
+async def test_host_rate_limiter_paces_requests():
+    """버킷이 비면 초당 rate개로 요청 간격을 조절하는지 테스트"""
+    rate_limiter = HostRateLimiter(rate=20, burst=1, max_concurrency=5)
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    for _ in range(3):
+        async with rate_limiter.slot():
+            rate_limiter.record(200)
+
+    # 첫 요청 이후 2개는 각각 0.05초씩 기다려야 함
+    assert loop.time() - started_at >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_host_rate_limiter_limits_concurrency():
+    """동시에 실행 중인 요청이 concurrency개를 넘지 않는지 테스트"""
+    rate_limiter = HostRateLimiter(rate=1000, burst=100, max_concurrency=2)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def request():
+        nonlocal in_flight, max_in_flight
+        async with rate_limiter.slot():
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            rate_limiter.record(200)
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert max_in_flight == 2
+
+
+def test_host_rate_limiter_backs_off_and_recovers():
+    """
+    차단 응답이면 동시 요청 수와 속도를 줄이고, 성공이 이어지면 다시 늘리는지 테스트
+    """
+    rate_limiter = HostRateLimiter(rate=4, burst=1, max_concurrency=4, cooldown=10)
+
+    rate_limiter.record(429)
+    assert rate_limiter.concurrency == 2
+    assert rate_limiter.rate == 2
+    assert rate_limiter.throttled
+    # 대기 시간 동안은 토큰을 받을 수 없음
+    assert rate_limiter.try_acquire() > 9
+
+    rate_limiter.record(430, retry_after=0)
+    assert rate_limiter.concurrency == 1
+    assert rate_limiter.rate == 1
+
+    for _ in range(1 + 2 + 3):
+        rate_limiter.record(200)
+    assert rate_limiter.concurrency == 4
+    assert rate_limiter.throttled
+    for _ in range(4):
+        rate_limiter.record(200)
+    assert rate_limiter.rate == 4
+    assert not rate_limiter.throttled
+
+
+def test_parse_retry_after():
+    """Retry-After 헤더의 초 단위 값만 사용하는지 테스트"""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+
+def test_get_host_rate_limiter_is_shared_per_host():
+    """같은 호스트의 URL은 같은 스케줄러를 사용하는지 테스트"""
+    first = get_host_rate_limiter("https://www.algumon.com/search/a")
+    second = get_host_rate_limiter("https://www.algumon.com/search/b")
+    other = get_host_rate_limiter("https://www.fmkorea.com/search")
+
+    assert first is second
+    assert first is not other
+
+
+@pytest.mark.asyncio
+async def test_proxy_fallback_goes_through_rate_limiter(mocker):
+    """차단 응답 후 프록시로 재시도하는 요청도 같은 호스트 스케줄러를 거치는지 테스트"""
+    rate_limiter = HostRateLimiter(rate=1000, burst=10, max_concurrency=5, cooldown=0)
+    mocker.patch(
+        "app.src.Infrastructure.crawling.base_crawler.get_host_rate_limiter",
+        return_value=rate_limiter,
+    )
+    slot = mocker.spy(rate_limiter, "slot")
+    record = mocker.spy(rate_limiter, "record")
+
+    # 직접 요청은 403, 프록시 요청은 200
+    status_codes = iter([403, 200])
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(next(status_codes), text="ok")
+    )
+    real_async_client = httpx.AsyncClient
+    mocker.patch(
+        "app.src.Infrastructure.crawling.base_crawler.httpx.AsyncClient",
+        side_effect=lambda **kwargs: real_async_client(transport=transport),
+    )
+    async with real_async_client(transport=transport) as client:
+        crawler = AlgumonCrawler(keyword="test", client=client)
+        mocker.patch.object(
+            crawler.proxy_manager, "get_next_proxy", return_value="http://proxy:8080"
+        )
+
+        assert await crawler.fetch() == "ok"
+
+    assert slot.call_count == 2
+    # 프록시 응답은 호스트의 요청 속도에 반영하지 않음
+    assert [call.args[0] for call in record.call_args_list] == [403]
+
+
+@pytest.mark.asyncio
+async def test_proxy_blocked_responses_keep_host_rate(mocker):
+    """차단된 프록시의 403/430 응답이 이어져도 호스트의 요청 속도가 그대로인지 테스트"""
+    rate_limiter = HostRateLimiter(rate=10, burst=10, max_concurrency=5, cooldown=5)
+    mocker.patch(
+        "app.src.Infrastructure.crawling.base_crawler.get_host_rate_limiter",
+        return_value=rate_limiter,
+    )
+    slot = mocker.spy(rate_limiter, "slot")
+
+    # 프록시 5개가 차례로 403/430으로 차단된 뒤 여섯 번째 프록시로 성공
+    status_codes = iter([403, 430, 403, 403, 430, 200])
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(next(status_codes), text="ok")
+    )
+    real_async_client = httpx.AsyncClient
+    mocker.patch(
+        "app.src.Infrastructure.crawling.base_crawler.httpx.AsyncClient",
+        side_effect=lambda **kwargs: real_async_client(transport=transport),
+    )
+    async with real_async_client(transport=transport) as client:
+        crawler = AlgumonCrawler(keyword="test", client=client)
+        mocker.patch.object(
+            crawler.proxy_manager,
+            "get_next_proxy",
+            side_effect=[f"http://proxy{index}:8080" for index in range(6)],
+        )
+
+        assert await crawler._fetch_with_proxy(crawler.url) == "ok"
+
+    assert slot.call_count == 6
+    assert rate_limiter.rate == 10
+    assert rate_limiter.concurrency == 5
+    assert rate_limiter.try_acquire() == 0
@@ -0,0 +1,80 @@
+import pytest
+
+from app.src.clients.chat_client import ChatClient
+from app.src.clients.completion_cache import MemoryCompletionCache
+from app.src.llm import BatchRequest
+from app.src.models.message import Message, RoleEnum
+from app.src.models.message_list import MessageList
+
+
+def test_get_completion_stream(mock_llm_model):
+    """동기 스트림이 모델의 청크를 그대로 전달하는지 테스트"""
+    message_list = MessageList()
+    message_list.addUser("안녕")
+    model = mock_llm_model(["안녕", "하세요"])
+    client = ChatClient(llm_model=model, messages=message_list.get_messages())
+
+    assert "".join(client.get_completion_stream()) == "안녕하세요"
+    assert model.calls[0]["model_name"] == "fake-model"
+
+
+@pytest.mark.asyncio
+async def test_aget_completion_stream(mock_llm_model):
+    """비동기 스트림이 모델의 청크를 그대로 전달하는지 테스트"""
+    message_list = MessageList()
+    message_list.addUser("안녕")
+    model = mock_llm_model(["안녕", "하세요"])
+    client = ChatClient(llm_model=model, messages=message_list.get_messages())
+
+    chunks = [chunk async for chunk in client.aget_completion_stream()]
+
+    assert chunks == ["안녕", "하세요"]
+    assert len(model.calls[0]["messages"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_client_batch_uses_cache(mock_llm_model):
+    """ChatClient 배치가 캐시된 요청은 호출하지 않고 결과를 반환하는지 테스트"""
+    model = mock_llm_model(["답"])
+    requests = [
+        BatchRequest(
+            id=str(index), messages=[Message(role=RoleEnum.user, content="안녕")]
+        )
+        for index in range(2)
+    ]
+    client = ChatClient(
+        llm_model=model, messages=[], completion_cache=MemoryCompletionCache()
+    )
+
+    first = [result async for result in client.agenerate_batch(requests)]
+    second = [result async for result in client.agenerate_batch(requests)]
+
+    assert {result.content for result in first + second} == {"답"}
+    assert len(model.calls) == 2
+    assert all(call["model_name"] == "fake-model" for call in model.calls)
+
+
+@pytest.mark.asyncio
+async def test_chat_client_batch_reads_requests_lazily(mock_llm_model):
+    """ChatClient 배치가 요청을 미리 읽지 않고 동시 실행 한도만큼만 읽는지 테스트"""
+    model = mock_llm_model(["답"])
+    read_ids = []
+
+    def requests():
+        for index in range(5):
+            read_ids.append(str(index))
+            yield BatchRequest(
+                id=str(index),
+                messages=[Message(role=RoleEnum.user, content=f"질문 {index}")],
+            )
+
+    client = ChatClient(
+        llm_model=model, messages=[], completion_cache=MemoryCompletionCache()
+    )
+    batch = client.agenerate_batch(requests(), max_concurrency=2)
+
+    first = await anext(batch)
+    await batch.aclose()
+
+    assert first.content == "답"
+    assert len(read_ids) <= 3
@@ -0,0 +1,115 @@
+import os
+import time
+
+import pytest
+
+from app.src.clients.chat_client import ChatClient
+from app.src.clients.completion_cache import (
+    STALE_TMP_FILE_SECONDS,
+    DiskCompletionCache,
+    MemoryCompletionCache,
+    TieredCompletionCache,
+    make_cache_key,
+)
+from app.src.models.message import Message, RoleEnum
+from app.src.models.message_list import MessageList
+
+
+def test_make_cache_key_normalizes_request():
+    """공백 차이는 같은 키, 파라미터 차이는 다른 키를 만드는지 테스트"""
+    messages = [Message(role=RoleEnum.user, content="안녕")]
+    padded = [Message(role=RoleEnum.user, content="  안녕\n")]
+    key = make_cache_key("grok", "grok-3-latest", messages, 1.2, 0.95, 100)
+
+    assert key == make_cache_key("grok", "grok-3-latest", padded, 1.2, 0.95, 100)
+    assert key != make_cache_key("gemini", "grok-3-latest", messages, 1.2, 0.95, 100)
+    assert key != make_cache_key("grok", "grok-3-latest", messages, 0.5, 0.95, 100)
+
+
+def test_memory_cache_lru_and_ttl():
+    """메모리 캐시의 LRU 제거와 TTL 만료 테스트"""
+    cache = MemoryCompletionCache(max_entries=2, ttl=60)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+
+    assert cache.get("a") == "A"
+    assert cache.get("b") is None
+    assert cache.get("c") == "C"
+
+    expired = MemoryCompletionCache(ttl=-1)
+    expired.set("a", "A")
+    assert expired.get("a") is None
+
+
+def test_disk_cache_size_bound_and_reload(tmp_path):
+    """디스크 캐시의 크기 제한과 재시작 후 인덱스 복원 테스트"""
+    cache = DiskCompletionCache(tmp_path, max_bytes=200, ttl=60)
+    cache.set("a", "x" * 100)
+    time.sleep(0.01)
+    cache.set("b", "y" * 100)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "y" * 100
+
+    reloaded = DiskCompletionCache(tmp_path, max_bytes=200, ttl=60)
+    assert reloaded.get("b") == "y" * 100
+
+
+def test_disk_cache_treats_malformed_entry_as_miss(tmp_path):
+    """
+    형식이 맞지 않는 항목(created_at 없음 등)을 캐시 미스로 처리하고 삭제하는지 테스트
+    """
+    cache = DiskCompletionCache(tmp_path)
+    cache.set("a", "A")
+    (tmp_path / "a.json").write_text('{"value": "A"}', encoding="utf-8")
+
+    assert cache.get("a") is None
+    assert not (tmp_path / "a.json").exists()
+
+
+def test_disk_cache_sweeps_stale_tmp_files(tmp_path):
+    """시작 시 쓰다가 남은 오래된 임시 파일만 삭제하는지 테스트"""
+    stale = tmp_path / "stale.tmp"
+    stale.write_text("partial", encoding="utf-8")
+    old = time.time() - STALE_TMP_FILE_SECONDS - 1
+    os.utime(stale, (old, old))
+    recent = tmp_path / "recent.tmp"
+    recent.write_text("writing", encoding="utf-8")
+
+    DiskCompletionCache(tmp_path)
+
+    assert not stale.exists()
+    assert recent.exists()
+
+
+def test_tiered_cache_promotes_hits(tmp_path):
+    """하위 계층에서 찾은 값을 상위 계층에 채우는지 테스트"""
+    memory_cache = MemoryCompletionCache()
+    disk_cache = DiskCompletionCache(tmp_path)
+    disk_cache.set("a", "A")
+    cache = TieredCompletionCache(memory_cache, disk_cache)
+
+    assert cache.get("a") == "A"
+    assert memory_cache.get("a") == "A"
+
+
+@pytest.mark.asyncio
+async def test_chat_client_replays_cached_completion(mock_llm_model):
+    """같은 요청은 모델을 다시 호출하지 않고 캐시를 스트림으로 재생하는지 테스트"""
+    message_list = MessageList()
+    message_list.addUser("안녕")
+    model = mock_llm_model(["안녕", "하세요"])
+    client = ChatClient(
+        llm_model=model,
+        messages=message_list,
+        completion_cache=MemoryCompletionCache(),
+    )
+
+    first = "".join([chunk async for chunk in client.aget_completion_stream()])
+    second = "".join([chunk async for chunk in client.aget_completion_stream()])
+    third = "".join(client.get_completion_stream())
+
+    assert first == second == third == "안녕하세요"
+    assert len(model.calls) == 1
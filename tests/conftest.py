@@ -1,4 +1,5 @@
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Generator
 from uuid import UUID, uuid4
 
 import pytest
@@ -20,6 +21,7 @@ from app.src.core.security import hash_password
 from app.src.domain.user.enums import AuthLevel
 from app.src.domain.user.models import User
 from app.src.domain.user.schemas import AuthenticatedUser
+from app.src.llm import LlmModels
 
 # SQLite 인메모리 데이터베이스 설정 (비동기)
 # 참고: SQLite 비동기 드라이버 필요 (e.g., aiosqlite)
@@ -227,3 +229,79 @@ def override_authenticate_user(mock_client: TestClient):
 
     # 테스트에서 사용할 오버라이드 함수 반환
     return _override
+
+
+class FakeLlmModels(LlmModels):
+    """네트워크 호출 없이 정해진 청크를 스트리밍하는 테스트용 LLM 모델"""
+
+    provider_name = "fake"
+
+    def __init__(
+        self,
+        chunks: list[str],
+        error: Exception | None = None,
+        context_window: int = 100_000,
+        provider_name: str = "fake",
+        first_token_delay: float = 0,
+    ):
+        self.chunks = chunks
+        self.error = error
+        self.context_window = context_window
+        self.provider_name = provider_name
+        self.first_token_delay = first_token_delay
+        self.calls: list[dict] = []
+
+    def get_api_key(self) -> str:
+        return "fake"
+
+    def get_default_model_name(self) -> str:
+        return "fake-model"
+
+    def get_supported_models(self) -> list[str]:
+        return ["fake-model"]
+
+    def get_context_window(self, model_name: str) -> int:
+        return self.context_window
+
+    def generate_completion_stream(
+        self, messages, model_name, temperature, max_tokens, top_p
+    ) -> Generator[str, None, None]:
+        self.calls.append({"model_name": model_name, "messages": list(messages)})
+        yield from self.chunks
+        if self.error:
+            raise self.error
+
+    async def agenerate_completion_stream(
+        self, messages, model_name, temperature, max_tokens, top_p
+    ) -> AsyncGenerator[str, None]:
+        self.calls.append({"model_name": model_name, "messages": list(messages)})
+        if self.first_token_delay:
+            await asyncio.sleep(self.first_token_delay)
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise self.error
+
+
+@pytest.fixture
+def mock_llm_model():
+    """
+    테스트용 LLM 모델을 생성하는 함수
+    """
+
+    def _mock_llm_model(
+        chunks: list[str] | None = None,
+        error: Exception | None = None,
+        context_window: int = 100_000,
+        provider_name: str = "fake",
+        first_token_delay: float = 0,
+    ) -> FakeLlmModels:
+        return FakeLlmModels(
+            chunks=chunks or [],
+            error=error,
+            context_window=context_window,
+            provider_name=provider_name,
+            first_token_delay=first_token_delay,
+        )
+
+    return _mock_llm_model
@@ -13,7 +13,7 @@ from app.src.core.config import (
 
 # 테스트 대상 함수 및 관련 모듈 임포트
 from app.src.core.dependencies.auth import (
-    ALGORITHM,
+    access_token_cache,
     authenticate_admin_user,
     authenticate_user,
     create_access_token,
@@ -21,6 +21,8 @@ from app.src.core.dependencies.auth import (
     registered_user,
 )
 from app.src.core.exceptions.auth_excptions import AuthErrors
+from app.src.core.token_codec import ALGORITHM, access_token_codec
+from app.src.domain.user.cache import invalidate_user_status
 from app.src.domain.user.enums import AuthLevel
 from app.src.domain.user.schemas import AuthenticatedUser
 
@@ -115,8 +117,11 @@ async def test_create_refresh_token():
             datetime.fromtimestamp(exp_timestamp, UTC) - expected_exp
         ) < timedelta(seconds=60)
 
-        # save_refresh_token 호출 검증
-        mock_save_token.assert_awaited_once_with(mock_db, test_user_id, token)
+        # save_refresh_token 호출 검증 (토큰의 exp와 같은 만료 시각 전달)
+        mock_save_token.assert_awaited_once()
+        args = mock_save_token.await_args.args
+        assert args[:3] == (mock_db, test_user_id, token)
+        assert int(args[3].timestamp()) == exp_timestamp
 
 
 # ---- registered_user 테스트 시작 ----
@@ -438,3 +443,90 @@ async def test_authenticate_admin_user_inactive():
 # authenticate_user와 동일한 방식으로 처리되므로 생략 가능 (또는 필요한 경우 추가)
 
 # ---- authenticate_admin_user 테스트 끝 ----
+
+
+# ---- 액세스 토큰 캐시 테스트 ----
+
+
+@pytest.mark.asyncio
+async def test_registered_user_uses_token_cache():
+    """
+    같은 토큰을 다시 검증하면 JWT 디코딩 없이 캐시된 사용자를 반환하는지 테스트
+    """
+    access_token_cache.clear()
+    token = await create_access_token(
+        user_id=uuid.uuid4(),
+        email="cached@example.com",
+        nickname="cached_user",
+        auth_level=AuthLevel.USER,
+    )
+    auth_header = f"Bearer {token}"
+
+    first = await registered_user(authorization=auth_header)
+    with patch.object(access_token_codec, "decode") as mock_decode:
+        second = await registered_user(authorization=auth_header)
+
+    mock_decode.assert_not_called()
+    assert second == first
+    assert access_token_cache.stats()["hits"] == 1
+    assert access_token_cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_token_cache_expires_with_token():
+    """
+    토큰의 exp가 지나면 캐시 항목이 만료되어 다시 검증(만료 오류)하는지 테스트
+    """
+    access_token_cache.clear()
+    token = await create_access_token(
+        user_id=uuid.uuid4(),
+        email="expiring@example.com",
+        nickname="expiring_user",
+        auth_level=AuthLevel.USER,
+        expires_delta=timedelta(minutes=5),
+    )
+    auth_header = f"Bearer {token}"
+    await registered_user(authorization=auth_header)
+
+    after_exp = datetime.now(UTC) + timedelta(minutes=10)
+    with (
+        patch("app.src.core.ttl_cache.time.time", return_value=after_exp.timestamp()),
+        # python-jose는 datetime.now로 만료 시간을 확인
+        patch("jose.jwt.datetime", wraps=datetime) as mock_datetime,
+        patch.object(
+            access_token_codec, "decode", wraps=access_token_codec.decode
+        ) as mock_decode,
+        pytest.raises(AuthErrors.ACCESS_TOKEN_EXPIRED.__class__) as exc_info,
+    ):
+        mock_datetime.now.return_value = after_exp
+        await registered_user(authorization=auth_header)
+
+    assert exc_info.value.detail == AuthErrors.ACCESS_TOKEN_EXPIRED.detail
+    mock_decode.assert_called_once()
+    assert access_token_cache.stats()["hits"] == 0
+
+
+# ---- 사용자 상태 캐시 테스트 ----
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_caches_user_status():
+    """
+    같은 사용자의 두 번째 인증은 DB 조회 없이 캐시된 활성 상태를 사용하고,
+    무효화 후에는 다시 조회하는지 테스트
+    """
+    test_user_id = uuid.uuid4()
+    token = await create_test_token(test_user_id, "status@example.com", AuthLevel.USER)
+    auth_header = f"Bearer {token}"
+    mock_db = AsyncMock(spec=AsyncSession)
+
+    with patch(
+        "app.src.core.dependencies.auth.check_user_active", return_value=True
+    ) as mock_check_active:
+        await authenticate_user(db=mock_db, authorization=auth_header)
+        await authenticate_user(db=mock_db, authorization=auth_header)
+        assert mock_check_active.await_count == 1
+
+        invalidate_user_status(test_user_id)
+        await authenticate_user(db=mock_db, authorization=auth_header)
+        assert mock_check_active.await_count == 2
@@ -0,0 +1,98 @@
+import asyncio
+import time
+
+import bcrypt
+import pytest
+
+from app.src.core.security import (
+    PasswordHashExecutor,
+    calibrate_bcrypt_rounds,
+    get_hash_rounds,
+    hash_password,
+    hash_password_async,
+    needs_rehash,
+    verify_password,
+    verify_password_async,
+)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password_async():
+    """비동기 해싱 결과가 동기 검증과 호환되는지 테스트"""
+    hashed = await hash_password_async("password")
+
+    assert verify_password("password", hashed)
+    assert await verify_password_async("password", hashed)
+    assert not await verify_password_async("wrong", hashed)
+
+
+@pytest.mark.asyncio
+async def test_verify_password_async_does_not_block_event_loop():
+    """동시 검증 중에도 이벤트 루프가 다른 작업을 계속 처리하는지 테스트"""
+    hashed = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=10)).decode("utf-8")
+    started = time.perf_counter()
+    verify_password("password", hashed)
+    single_verify = time.perf_counter() - started
+
+    executor = PasswordHashExecutor(max_workers=2)
+    gaps: list[float] = []
+
+    async def ticker(stop: asyncio.Event):
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    stop = asyncio.Event()
+    ticker_task = asyncio.create_task(ticker(stop))
+    results = await asyncio.gather(
+        *(executor.run(verify_password, "password", hashed) for _ in range(8))
+    )
+    stop.set()
+    await ticker_task
+    executor.shutdown()
+
+    assert all(results)
+    # 동기 호출이었다면 한 번의 검증 시간만큼 루프가 멈췄을 것
+    assert max(gaps) < single_verify
+
+
+@pytest.mark.asyncio
+async def test_password_hash_executor_tracks_queue_depth():
+    """작업자 수보다 많은 요청이 대기열 지표에 기록되는지 테스트"""
+    executor = PasswordHashExecutor(max_workers=1)
+
+    await asyncio.gather(*(executor.run(time.sleep, 0.01) for _ in range(4)))
+    stats = executor.stats()
+    executor.shutdown()
+
+    assert stats["completed"] == 4
+    assert stats["pending"] == 0
+    assert stats["running"] == 0
+    assert stats["max_pending"] >= 3
+    assert stats["queue_wait_p99"] > 0
+
+
+def test_hash_password_uses_configured_rounds(mocker):
+    """
+    설정된 작업 비용으로 해싱하고
+    더 낮은 비용의 해시만 재해싱 대상으로 판단하는지 테스트
+    """
+    mocker.patch("app.src.core.security.settings.PASSWORD_HASH_ROUNDS", 5)
+
+    hashed = hash_password("password")
+
+    assert get_hash_rounds(hashed) == 5
+    assert not needs_rehash(hashed)
+    assert needs_rehash(hash_password("password", rounds=4))
+    assert not needs_rehash(hash_password("password", rounds=6))
+
+
+def test_calibrate_bcrypt_rounds(mocker):
+    """측정 시간이 두 배가 될 때마다 작업 비용이 1씩 오르도록 추정하는지 테스트"""
+    # 비용 4에서 검증 1ms -> 목표 10ms면 비용 7 (8ms)
+    mocker.patch("app.src.core.security.time.perf_counter", side_effect=[0, 0.001] * 3)
+
+    assert calibrate_bcrypt_rounds(target_ms=10, min_rounds=4) == 7
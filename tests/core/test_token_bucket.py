@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+import pytest
+
+from app.src.core.token_bucket import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_for_refill():
+    """토큰이 부족하면 채워질 때까지 기다리는지 테스트"""
+    bucket = TokenBucket(capacity=2, refill_rate=100)
+
+    assert bucket.try_acquire(2) == 0
+    assert bucket.try_acquire(1) > 0
+    await bucket.acquire(1)
+
+
+def test_token_bucket_does_not_refill_while_paused():
+    """멈춘 동안에는 토큰을 채우지 않아, 멈춤이 끝나도 한꺼번에 내주지 않는지 테스트"""
+    with patch("app.src.core.token_bucket.time.monotonic", return_value=0.0) as now:
+        bucket = TokenBucket(capacity=5, refill_rate=10)
+        bucket.pause(1.0)
+
+        now.return_value = 0.5
+        assert bucket.try_acquire() == pytest.approx(0.5)
+
+        # 멈춤이 끝난 시점에는 토큰이 없고, 그 뒤로 초당 refill_rate개씩 채워짐
+        now.return_value = 1.0
+        assert bucket.try_acquire() > 0
+        now.return_value = 1.1
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() > 0
+
+
+def test_token_bucket_set_rate():
+    """속도를 바꾸면 이후 대기 시간이 새 속도로 계산되는지 테스트"""
+    with patch("app.src.core.token_bucket.time.monotonic", return_value=0.0):
+        bucket = TokenBucket(capacity=1, refill_rate=10)
+        assert bucket.try_acquire() == 0
+
+        bucket.set_rate(1)
+
+        assert bucket.try_acquire() == pytest.approx(1.0)
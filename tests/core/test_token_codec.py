@@ -0,0 +1,103 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from jose import jwt
+
+from app.src.core.token_codec import (
+    ALGORITHM,
+    HmacTokenCodec,
+    JoseTokenCodec,
+    TokenError,
+    TokenExpiredError,
+    create_token_codec,
+)
+from app.src.domain.user.enums import AuthLevel
+
+SECRET_KEY = "test-secret"
+
+
+def make_payload(expires_delta: timedelta = timedelta(minutes=5)) -> dict:
+    return {
+        "user_id": str(uuid.uuid4()),
+        "email": "test@example.com",
+        "nickname": "닉네임",
+        "auth_level": AuthLevel.ADMIN,
+        "exp": datetime.now(UTC) + expires_delta,
+    }
+
+
+@pytest.mark.parametrize("codec_class", [HmacTokenCodec, JoseTokenCodec])
+def test_codec_round_trip(codec_class):
+    """인코딩한 토큰을 디코딩하면 같은 페이로드(exp는 타임스탬프)가 나오는지 테스트"""
+    codec = codec_class(SECRET_KEY)
+    payload = make_payload()
+
+    decoded = codec.decode(codec.encode(payload))
+
+    assert decoded["user_id"] == payload["user_id"]
+    assert decoded["nickname"] == "닉네임"
+    assert decoded["auth_level"] == AuthLevel.ADMIN.value
+    assert decoded["exp"] == int(payload["exp"].timestamp())
+
+
+def test_hmac_codec_is_interoperable_with_jose():
+    """HMAC 코덱과 python-jose가 서로의 토큰을 검증할 수 있는지 테스트"""
+    codec = HmacTokenCodec(SECRET_KEY)
+    payload = make_payload()
+
+    from_codec = jwt.decode(codec.encode(payload), SECRET_KEY, algorithms=[ALGORITHM])
+    from_jose = codec.decode(jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM))
+
+    assert from_codec == from_jose
+
+
+@pytest.mark.parametrize("codec_class", [HmacTokenCodec, JoseTokenCodec])
+def test_codec_rejects_expired_token(codec_class):
+    """exp가 지난 토큰은 TokenExpiredError를 발생시키는지 테스트"""
+    codec = codec_class(SECRET_KEY)
+    token = codec.encode(make_payload(expires_delta=timedelta(minutes=-1)))
+
+    with pytest.raises(TokenExpiredError):
+        codec.decode(token)
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        jwt.encode({"user_id": "1"}, "wrong-secret", algorithm=ALGORITHM),
+        jwt.encode({"user_id": "1"}, SECRET_KEY, algorithm="HS512"),
+        jwt.encode({"exp": "soon"}, SECRET_KEY, algorithm=ALGORITHM),
+        "not-a-token",
+        "a.b.c",
+        "",
+    ],
+)
+def test_hmac_codec_rejects_invalid_token(token):
+    """서명/알고리즘/형식이 잘못된 토큰은 TokenError를 발생시키는지 테스트"""
+    codec = HmacTokenCodec(SECRET_KEY)
+
+    with pytest.raises(TokenError):
+        codec.decode(token)
+
+
+def test_hmac_codec_rejects_tampered_payload():
+    """서명 이후 페이로드를 바꾼 토큰을 거부하는지 테스트"""
+    codec = HmacTokenCodec(SECRET_KEY)
+    header, _, signature = codec.encode(make_payload()).split(".")
+    _, forged, _ = codec.encode(make_payload() | {"auth_level": 99}).split(".")
+
+    with pytest.raises(TokenError):
+        codec.decode(f"{header}.{forged}.{signature}")
+
+
+def test_create_token_codec_uses_configured_backend(mocker):
+    """settings.JWT_BACKEND에 따라 구현체를 선택하는지 테스트"""
+    assert isinstance(create_token_codec(SECRET_KEY), JoseTokenCodec)
+
+    mocker.patch("app.src.core.token_codec.settings.JWT_BACKEND", "hmac")
+
+    assert isinstance(create_token_codec(SECRET_KEY), HmacTokenCodec)
+    assert isinstance(create_token_codec(SECRET_KEY, "hmac"), HmacTokenCodec)
+    with pytest.raises(ValueError):
+        create_token_codec(SECRET_KEY, "unknown")
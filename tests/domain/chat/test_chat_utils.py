@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from app.src.domain.chat.utils import coalesce_tokens, format_sse
+
+
+async def _token_stream(tokens: list[str], delay: float = 0.0):
+    for token in tokens:
+        if delay:
+            await asyncio.sleep(delay)
+        yield token
+
+
+def test_format_sse():
+    """SSE 프레임 형식 테스트"""
+    assert format_sse("hello") == "data: hello\n\n"
+    assert format_sse("a\nb", event="error") == "event: error\ndata: a\ndata: b\n\n"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_tokens_flushes_first_token_immediately():
+    """첫 토큰은 바로 내보내고 나머지는 하나의 프레임으로 합치는지 테스트"""
+    frames = [
+        frame
+        async for frame in coalesce_tokens(
+            _token_stream(["a", "b", "c", "d"]), flush_interval=10, max_chars=100
+        )
+    ]
+    assert frames == ["a", "bcd"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_tokens_respects_max_chars():
+    """버퍼가 max_chars에 도달하면 프레임을 내보내는지 테스트"""
+    frames = [
+        frame
+        async for frame in coalesce_tokens(
+            _token_stream(["a", "bb", "cc", "d"]), flush_interval=10, max_chars=4
+        )
+    ]
+    assert frames == ["a", "bbcc", "d"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_tokens_flushes_on_interval():
+    """다음 토큰이 늦게 와도 interval이 지나면 모인 내용을 내보내는지 테스트"""
+    frames = [
+        frame
+        async for frame in coalesce_tokens(
+            _token_stream(["a", "b", "c"], delay=0.05),
+            flush_interval=0.01,
+            max_chars=100,
+        )
+    ]
+    assert "".join(frames) == "abc"
+    assert len(frames) == 3
@@ -0,0 +1,104 @@
+import pytest
+
+from app.src.core.config import settings
+from app.src.core.exceptions.client_exceptions import ClientErrors
+
+
+@pytest.mark.asyncio
+async def test_post_completions_streams_sse(
+    mocker,
+    mock_client,
+    mock_authenticated_user,
+    override_registered_user,
+    mock_llm_model,
+):
+    """채팅 스트리밍 API가 SSE 프레임과 종료 이벤트를 내보내는지 테스트"""
+    override_registered_user(mock_authenticated_user)
+    model = mock_llm_model(["안녕", "하세요"])
+    mocker.patch(
+        "app.src.domain.chat.services.get_llm_model",
+        return_value=(model, "fake-model"),
+    )
+
+    response = mock_client.post(
+        "/api/chat/v1/completions",
+        json={"messages": [{"role": "user", "content": "안녕"}]},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    body = response.text
+    assert 'data: {"content":"안녕"}' in body
+    assert body.endswith("data: [DONE]\n\n")
+
+
+@pytest.mark.asyncio
+async def test_post_completions_stream_error(
+    mocker,
+    mock_client,
+    mock_authenticated_user,
+    override_registered_user,
+    mock_llm_model,
+):
+    """스트리밍 중 오류가 error 이벤트로 전달되는지 테스트"""
+    override_registered_user(mock_authenticated_user)
+    model = mock_llm_model(["안녕"], error=RuntimeError("boom"))
+    mocker.patch(
+        "app.src.domain.chat.services.get_llm_model",
+        return_value=(model, "fake-model"),
+    )
+
+    response = mock_client.post(
+        "/api/chat/v1/completions",
+        json={"messages": [{"role": "user", "content": "안녕"}]},
+    )
+
+    assert response.status_code == 200
+    assert "event: error" in response.text
+    assert "[DONE]" not in response.text
+
+
+@pytest.mark.asyncio
+async def test_post_completions_unsupported_model(
+    mocker,
+    mock_client,
+    mock_authenticated_user,
+    override_registered_user,
+):
+    """지원하지 않는 모델이면 스트리밍 전에 오류를 반환하는지 테스트"""
+    override_registered_user(mock_authenticated_user)
+    mocker.patch(
+        "app.src.domain.chat.services.get_llm_model",
+        side_effect=ClientErrors.UNSUPPORTED_LLM_MODEL,
+    )
+
+    response = mock_client.post(
+        "/api/chat/v1/completions",
+        json={
+            "model_name": "unknown",
+            "messages": [{"role": "user", "content": "안녕"}],
+        },
+    )
+
+    assert response.status_code == ClientErrors.UNSUPPORTED_LLM_MODEL.status_code
+    assert response.json()["detail"] == ClientErrors.UNSUPPORTED_LLM_MODEL.detail
+
+
+@pytest.mark.asyncio
+async def test_post_completions_rejects_too_many_max_tokens(
+    mock_client,
+    mock_authenticated_user,
+    override_registered_user,
+):
+    """max_tokens가 허용 범위를 넘으면 요청을 거부하는지 테스트"""
+    override_registered_user(mock_authenticated_user)
+
+    response = mock_client.post(
+        "/api/chat/v1/completions",
+        json={
+            "messages": [{"role": "user", "content": "안녕"}],
+            "max_tokens": settings.CHAT_MAX_TOKENS + 1,
+        },
+    )
+
+    assert response.status_code == 422
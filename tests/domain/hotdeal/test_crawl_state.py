@@ -0,0 +1,155 @@
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.domain.hotdeal.crawl_state import (
+    SEEN_IDS_MAX_ENTRIES,
+    CrawlStateManager,
+    KeywordCrawlState,
+)
+from app.src.domain.hotdeal.enums import SiteName
+from app.src.domain.hotdeal.models import Keyword, KeywordSite
+from app.src.domain.hotdeal.schemas import CrawledKeyword
+
+LATEST_PRODUCTS = [
+    CrawledKeyword(id="3", title="새상품2", link="link3", price="3000원"),
+    CrawledKeyword(id="2", title="새상품1", link="link2", price="2000원"),
+    CrawledKeyword(id="1", title="기존상품", link="link1", price="1000원"),
+]
+
+
+@pytest.mark.asyncio
+async def test_crawl_state_batches_load_and_save(mock_db_session: AsyncSession):
+    """
+    크롤링 상태를 한 번의 쿼리로 불러와 메모리에서 비교하고,
+    바뀐 상태만 한 번에 저장하는지 테스트
+    """
+    seen, first, unchanged, deleted = (
+        Keyword(title="seen"),
+        Keyword(title="first"),
+        Keyword(title="unchanged"),
+        Keyword(title="deleted"),
+    )
+    mock_db_session.add_all([seen, first, unchanged, deleted])
+    await mock_db_session.flush()
+    mock_db_session.add_all(
+        [
+            KeywordSite(
+                keyword_id=seen.id, site_name=SiteName.ALGUMON, external_id="1"
+            ),
+            KeywordSite(
+                keyword_id=unchanged.id, site_name=SiteName.ALGUMON, external_id="3"
+            ),
+        ]
+    )
+    await mock_db_session.commit()
+    keyword_ids = [seen.id, first.id, unchanged.id, deleted.id]
+
+    statements: list[str] = []
+    sync_engine = mock_db_session.bind.sync_engine
+
+    def count_statement(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sync_engine, "before_cursor_execute", count_statement)
+    try:
+        crawl_state = await CrawlStateManager.load(mock_db_session, keyword_ids)
+        assert len(statements) == 1
+
+        new_deals = crawl_state.find_new_deals(
+            seen.id, SiteName.ALGUMON, LATEST_PRODUCTS
+        )
+        assert [deal.id for deal in new_deals] == ["3", "2"]
+        # 같은 결과를 다시 비교하면 새로운 핫딜이 없음
+        assert (
+            crawl_state.find_new_deals(seen.id, SiteName.ALGUMON, LATEST_PRODUCTS) == []
+        )
+        assert [
+            deal.id
+            for deal in crawl_state.find_new_deals(
+                first.id, SiteName.ALGUMON, LATEST_PRODUCTS
+            )
+        ] == ["3"]
+        assert (
+            crawl_state.find_new_deals(unchanged.id, SiteName.ALGUMON, LATEST_PRODUCTS)
+            == []
+        )
+        crawl_state.find_new_deals(deleted.id, SiteName.ALGUMON, LATEST_PRODUCTS)
+        assert len(statements) == 1
+
+        # 크롤링 도중 삭제된 키워드는 저장에서 제외
+        await mock_db_session.delete(deleted)
+        await mock_db_session.commit()
+
+        statements.clear()
+        assert await crawl_state.flush(mock_db_session) == 2
+        assert sum("INSERT" in statement for statement in statements) == 1
+        assert await crawl_state.flush(mock_db_session) == 0
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", count_statement)
+
+    result = await mock_db_session.execute(
+        select(KeywordSite.keyword_id, KeywordSite.external_id, KeywordSite.link)
+        .execution_options(populate_existing=True)
+        .order_by(KeywordSite.keyword_id)
+    )
+    assert result.all() == [
+        (seen.id, "3", "link3"),
+        (first.id, "3", "link3"),
+        (unchanged.id, "3", None),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_crawl_state_ignores_deleted_cursor(mock_db_session: AsyncSession):
+    """마지막으로 확인한 글이 삭제되어도 이미 확인한 핫딜은 다시 알리지 않는지 테스트"""
+    keyword = Keyword(title="keyword")
+    mock_db_session.add(keyword)
+    await mock_db_session.commit()
+    keyword_id = keyword.id
+
+    crawl_state = await CrawlStateManager.load(mock_db_session, [keyword_id])
+    crawl_state.find_new_deals(keyword_id, SiteName.ALGUMON, LATEST_PRODUCTS)
+    await crawl_state.flush(mock_db_session)
+
+    # 가장 최근에 확인한 "3"이 삭제되고 "4"가 새로 올라옴
+    latest_products = [
+        CrawledKeyword(id="4", title="새상품3", link="link4"),
+        *LATEST_PRODUCTS[1:],
+    ]
+    crawl_state = await CrawlStateManager.load(mock_db_session, [keyword_id])
+    new_deals = crawl_state.find_new_deals(
+        keyword_id, SiteName.ALGUMON, latest_products
+    )
+    assert [deal.id for deal in new_deals] == ["4"]
+    await crawl_state.flush(mock_db_session)
+
+    result = await mock_db_session.execute(
+        select(KeywordSite.external_id, KeywordSite.seen_ids).execution_options(
+            populate_existing=True
+        )
+    )
+    assert result.one() == ("4", '["4", "2", "1", "3"]')
+
+
+def test_crawl_state_bounds_seen_ids():
+    """확인한 ID는 최근 SEEN_IDS_MAX_ENTRIES개까지만 기억하는지 테스트"""
+    crawl_state = CrawlStateManager(
+        {
+            (1, SiteName.ALGUMON): KeywordCrawlState(
+                external_id="0",
+                seen_ids=[str(i) for i in range(SEEN_IDS_MAX_ENTRIES)],
+            )
+        }
+    )
+
+    new_deals = crawl_state.find_new_deals(1, SiteName.ALGUMON, LATEST_PRODUCTS)
+
+    assert new_deals == []
+    new_deals = crawl_state.find_new_deals(
+        1, SiteName.ALGUMON, [CrawledKeyword(id="new", title="새상품", link="link")]
+    )
+    assert [deal.id for deal in new_deals] == ["new"]
+    seen_ids = crawl_state._states[(1, SiteName.ALGUMON)].seen_ids
+    assert len(seen_ids) == SEEN_IDS_MAX_ENTRIES
+    assert seen_ids[:2] == ["new", "0"]
@@ -1,16 +1,33 @@
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
 from uuid import UUID
 
 import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.core.exceptions.base_exceptions import BaseHTTPException
 from app.src.core.exceptions.client_exceptions import ClientErrors
-from app.src.domain.hotdeal.repositories import is_my_keyword
+from app.src.domain.hotdeal import repositories
+from app.src.domain.hotdeal.cache import keyword_list_cache
+from app.src.domain.hotdeal.enums import KeywordLinkStatus, SiteName
+from app.src.domain.hotdeal.models import Keyword, KeywordSite
+from app.src.domain.hotdeal.repositories import (
+    delete_orphan_keywords,
+    is_my_keyword,
+    link_keywords_by_titles,
+    upsert_and_link_keyword,
+)
 from app.src.domain.hotdeal.schemas import KeywordResponse
 from app.src.domain.hotdeal.services import (
     register_keyword,
+    register_keywords,
+    replace_keywords,
     unlink_keyword,
+    unlink_keywords,
     view_users_keywords,
+    view_users_keywords_snapshot,
 )
 from app.src.domain.hotdeal.utils import normalize_keyword
 
@@ -53,6 +70,7 @@ async def test_register_keyword(
             db=mock_db_session,
             title=f"Keyword{i}",
             user_id=UUID("00000000-0000-0000-0000-00000000000a"),
+            background_tasks=BackgroundTasks(),
         )
 
     if expected_exception:
@@ -61,12 +79,14 @@ async def test_register_keyword(
             db=mock_db_session,
             title="Keyword10",
             user_id=UUID("00000000-0000-0000-0000-00000000000a"),
+            background_tasks=BackgroundTasks(),
         )
         try:
             await register_keyword(
                 db=mock_db_session,
                 title=title,
                 user_id=UUID(user_id),
+                background_tasks=BackgroundTasks(),
             )
         except BaseHTTPException as exc:
             assert exc.status_code == expected_exception.status_code
@@ -78,6 +98,7 @@ async def test_register_keyword(
             db=mock_db_session,
             title=title,
             user_id=UUID(user_id),
+            background_tasks=BackgroundTasks(),
         )
         assert isinstance(result, KeywordResponse)
         assert result.title == normalize_keyword(title)
@@ -134,6 +155,7 @@ async def test_unlink_keyword(
             db=mock_db_session,
             title="Keyword",
             user_id=UUID(user_id),
+            background_tasks=BackgroundTasks(),
         )
         # 키워드 삭제
         await unlink_keyword(
@@ -163,6 +185,7 @@ async def test_view_users_keywords(
         db=mock_db_session,
         title="Keyword",
         user_id=UUID("00000000-0000-0000-0000-00000000000a"),
+        background_tasks=BackgroundTasks(),
     )
     # 키워드 리스트 조회
     result: list[KeywordResponse] = await view_users_keywords(
@@ -171,3 +194,274 @@ async def test_view_users_keywords(
     )
     assert len(result) == 1
     assert result[0].title == "keyword"
+
+
+@pytest.mark.asyncio
+async def test_upsert_and_link_keyword(
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """
+    같은 키워드를 여러 사용자가 등록해도 키워드는 하나만 생성되고,
+    중복/개수 초과 시 연결하지 않으며 새로 만든 키워드도 남기지 않는지 테스트
+    """
+    # 실패 시 롤백으로 세션 객체가 만료되므로 id를 미리 저장
+    first_user_id = (await add_mock_user(email="first@example.com", nickname="a")).id
+    second_user_id = (await add_mock_user(email="second@example.com", nickname="b")).id
+
+    first_id, first_status = await upsert_and_link_keyword(
+        mock_db_session, first_user_id, "keyword", max_keywords=1
+    )
+    second_id, second_status = await upsert_and_link_keyword(
+        mock_db_session, second_user_id, "keyword", max_keywords=1
+    )
+    assert first_status is KeywordLinkStatus.LINKED
+    assert second_status is KeywordLinkStatus.LINKED
+    assert first_id == second_id
+
+    _, duplicate_status = await upsert_and_link_keyword(
+        mock_db_session, first_user_id, "keyword", max_keywords=1
+    )
+    assert duplicate_status is KeywordLinkStatus.DUPLICATE
+
+    _, overflow_status = await upsert_and_link_keyword(
+        mock_db_session, first_user_id, "another", max_keywords=1
+    )
+    assert overflow_status is KeywordLinkStatus.LIMIT_EXCEEDED
+    result = await mock_db_session.execute(select(Keyword.title))
+    assert result.scalars().all() == ["keyword"]
+
+
+@pytest.mark.asyncio
+async def test_single_and_bulk_registration_lock_user_row(
+    add_mock_user,
+    mock_db_session: AsyncSession,
+    mocker,
+):
+    """
+    단건 등록과 일괄 등록이 같은 사용자 행 잠금으로 개수 확인을 직렬화하는지 테스트
+    """
+    user_id = (await add_mock_user()).id
+    lock = mocker.spy(repositories, "_lock_user_keywords")
+
+    await upsert_and_link_keyword(mock_db_session, user_id, "single", max_keywords=10)
+    await link_keywords_by_titles(mock_db_session, user_id, ["bulk"], max_keywords=10)
+
+    assert [call.args[1] for call in lock.call_args_list] == [user_id, user_id]
+
+
+@pytest.mark.asyncio
+async def test_register_keyword_sends_email_in_background(
+    mocker,
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """등록 안내 메일은 응답 후 별도 세션으로 사용자를 조회해 발송하는지 테스트"""
+
+    @asynccontextmanager
+    async def session_factory():
+        yield mock_db_session
+
+    mocker.patch("app.src.domain.hotdeal.services.AsyncSessionLocal", session_factory)
+    mock_send_email = mocker.patch(
+        "app.src.domain.hotdeal.services.send_email", new_callable=AsyncMock
+    )
+    user = await add_mock_user(is_active=True)
+
+    background_tasks = BackgroundTasks()
+    await register_keyword(
+        db=mock_db_session,
+        title="Keyword",
+        user_id=user.id,
+        background_tasks=background_tasks,
+    )
+    mock_send_email.assert_not_awaited()
+    # 응답 후 실행되는 작업을 직접 실행
+    await background_tasks()
+
+    mock_send_email.assert_awaited_once()
+    assert mock_send_email.await_args.kwargs["to"] == user.email
+
+
+@pytest.mark.asyncio
+async def test_unlink_keyword_deletes_orphan_keyword_and_sites(
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """
+    다른 구독자가 있으면 키워드를 유지하고,
+    마지막 구독자가 연결을 끊으면 키워드와 KeywordSite를 함께 삭제하는지 테스트
+    """
+    first_user_id = (await add_mock_user(email="first@example.com", nickname="a")).id
+    second_user_id = (await add_mock_user(email="second@example.com", nickname="b")).id
+    keyword = await register_keyword(
+        db=mock_db_session,
+        title="Keyword",
+        user_id=first_user_id,
+        background_tasks=BackgroundTasks(),
+    )
+    await register_keyword(
+        db=mock_db_session,
+        title="Keyword",
+        user_id=second_user_id,
+        background_tasks=BackgroundTasks(),
+    )
+    mock_db_session.add(
+        KeywordSite(keyword_id=keyword.id, site_name=SiteName.ALGUMON, external_id="1")
+    )
+    await mock_db_session.commit()
+
+    await unlink_keyword(
+        db=mock_db_session, keyword_id=keyword.id, user_id=first_user_id
+    )
+    result = await mock_db_session.execute(select(Keyword.id))
+    assert result.scalars().all() == [keyword.id]
+
+    await unlink_keyword(
+        db=mock_db_session, keyword_id=keyword.id, user_id=second_user_id
+    )
+    assert (await mock_db_session.execute(select(Keyword.id))).scalars().all() == []
+    assert (
+        await mock_db_session.execute(select(KeywordSite.keyword_id))
+    ).scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_delete_orphan_keywords(
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """구독자가 없는 키워드만 일괄 삭제하는지 테스트"""
+    user = await add_mock_user()
+    await register_keyword(
+        db=mock_db_session,
+        title="subscribed",
+        user_id=user.id,
+        background_tasks=BackgroundTasks(),
+    )
+    mock_db_session.add_all([Keyword(title="orphan1"), Keyword(title="orphan2")])
+    await mock_db_session.commit()
+
+    assert await delete_orphan_keywords(mock_db_session) == 2
+    result = await mock_db_session.execute(select(Keyword.title))
+    assert result.scalars().all() == ["subscribed"]
+
+
+@pytest.mark.asyncio
+async def test_register_keywords_bulk(
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """여러 키워드를 한 번에 등록하고 10개 제한과 키워드별 결과를 반환하는지 테스트"""
+    user_id = (await add_mock_user()).id
+    await register_keyword(
+        db=mock_db_session,
+        title="existing",
+        user_id=user_id,
+        background_tasks=BackgroundTasks(),
+    )
+    titles = ["Existing", "!!!", "new0", "NEW0"] + [f"new{i}" for i in range(1, 11)]
+
+    response = await register_keywords(
+        db=mock_db_session,
+        titles=titles,
+        user_id=user_id,
+        background_tasks=BackgroundTasks(),
+    )
+
+    statuses = {item.title: item.status for item in response.results}
+    assert statuses["existing"] is KeywordLinkStatus.DUPLICATE
+    assert statuses["!!!"] is KeywordLinkStatus.INVALID_TITLE
+    assert [statuses[f"new{i}"] for i in range(11)] == [
+        KeywordLinkStatus.LINKED
+    ] * 9 + [KeywordLinkStatus.LIMIT_EXCEEDED] * 2
+    assert len(response.results) == 13
+    keywords = await view_users_keywords(db=mock_db_session, user_id=user_id)
+    assert len(keywords) == 10
+    # 연결하지 못한 키워드는 남기지 않음
+    result = await mock_db_session.execute(select(Keyword.title))
+    assert "new10" not in result.scalars().all()
+
+
+@pytest.mark.asyncio
+async def test_unlink_and_replace_keywords_bulk(
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """여러 키워드 제거와 키워드 목록 교체 결과를 테스트"""
+    user_id = (await add_mock_user()).id
+    await register_keywords(
+        db=mock_db_session,
+        titles=["a", "b", "c", "d"],
+        user_id=user_id,
+        background_tasks=BackgroundTasks(),
+    )
+
+    removed = await unlink_keywords(
+        db=mock_db_session, titles=["a", "unknown"], user_id=user_id
+    )
+    assert [(item.title, item.status) for item in removed.results] == [
+        ("a", KeywordLinkStatus.UNLINKED),
+        ("unknown", KeywordLinkStatus.NOT_FOUND),
+    ]
+
+    replaced = await replace_keywords(
+        db=mock_db_session,
+        titles=["c", "e"],
+        user_id=user_id,
+        background_tasks=BackgroundTasks(),
+    )
+    assert {(item.title, item.status) for item in replaced.results} == {
+        ("c", KeywordLinkStatus.DUPLICATE),
+        ("e", KeywordLinkStatus.LINKED),
+        ("b", KeywordLinkStatus.UNLINKED),
+        ("d", KeywordLinkStatus.UNLINKED),
+    }
+    keywords = await view_users_keywords(db=mock_db_session, user_id=user_id)
+    assert [keyword.title for keyword in keywords] == ["c", "e"]
+    result = await mock_db_session.execute(select(Keyword.title))
+    assert sorted(result.scalars().all()) == ["c", "e"]
+
+
+@pytest.mark.asyncio
+async def test_keyword_list_snapshot_is_cached_and_invalidated(
+    mocker,
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """키워드 리스트 스냅샷이 캐시되고 등록/해제 시 ETag가 바뀌는지 테스트"""
+    keyword_list_cache.clear()
+    user_id = (await add_mock_user()).id
+    await register_keywords(
+        db=mock_db_session,
+        titles=["a", "b"],
+        user_id=user_id,
+        background_tasks=BackgroundTasks(),
+    )
+
+    first = await view_users_keywords_snapshot(db=mock_db_session, user_id=user_id)
+    assert first.body == b'[{"id":1,"title":"a"},{"id":2,"title":"b"}]'
+
+    # 캐시 적중 시 DB를 조회하지 않음
+    select_mock = mocker.patch(
+        "app.src.domain.hotdeal.services.select_users_keywords",
+        side_effect=AssertionError("cache miss"),
+    )
+    assert await view_users_keywords_snapshot(mock_db_session, user_id) == first
+    select_mock.assert_not_called()
+    mocker.stopall()
+
+    await unlink_keywords(db=mock_db_session, titles=["a"], user_id=user_id)
+    unlinked = await view_users_keywords_snapshot(mock_db_session, user_id)
+    assert unlinked.etag != first.etag
+    assert unlinked.body == b'[{"id":2,"title":"b"}]'
+
+    await register_keywords(
+        db=mock_db_session,
+        titles=["a"],
+        user_id=user_id,
+        background_tasks=BackgroundTasks(),
+    )
+    relinked = await view_users_keywords_snapshot(mock_db_session, user_id)
+    assert relinked.etag != unlinked.etag
+    keyword_list_cache.clear()
@@ -2,7 +2,13 @@ import pytest
 from fastapi import Response
 
 from app.src.core.exceptions.client_exceptions import ClientErrors
-from app.src.domain.hotdeal.schemas import KeywordResponse
+from app.src.domain.hotdeal.cache import keyword_list_cache
+from app.src.domain.hotdeal.enums import KeywordLinkStatus
+from app.src.domain.hotdeal.schemas import (
+    KeywordBulkItemResult,
+    KeywordBulkResponse,
+    KeywordResponse,
+)
 
 
 @pytest.mark.asyncio
@@ -141,8 +147,9 @@ async def test_get_my_keywords_list(
     # 테스트용 인증 유저 오버라이드
     override_registered_user(mock_authenticated_user)
 
+    keyword_list_cache.clear()
     mocker.patch(
-        "app.src.domain.hotdeal.v1.router.view_users_keywords",
+        "app.src.domain.hotdeal.services.view_users_keywords",
         return_value=[KeywordResponse(id=1, title="keyword")],
     )
     # API 호출
@@ -153,3 +160,91 @@ async def test_get_my_keywords_list(
     assert response.json() == [
         {"id": 1, "title": "keyword"},
     ]
+    keyword_list_cache.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "if_none_match, expected_status",
+    [
+        ("{etag}", 304),
+        ("W/{etag}", 304),
+        ('"other", {etag}', 304),
+        ("*", 304),
+        ('"other"', 200),
+    ],
+)
+async def test_get_my_keywords_list_conditional(
+    mocker,
+    mock_client,
+    mock_authenticated_user,
+    override_registered_user,
+    if_none_match,
+    expected_status,
+):
+    """If-None-Match가 ETag와 일치하면 304를 반환하는지 테스트"""
+    override_registered_user(mock_authenticated_user)
+    keyword_list_cache.clear()
+    view_mock = mocker.patch(
+        "app.src.domain.hotdeal.services.view_users_keywords",
+        return_value=[KeywordResponse(id=1, title="keyword")],
+    )
+
+    first: Response = mock_client.get("/api/hotdeal/v1/keywords")
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    response: Response = mock_client.get(
+        "/api/hotdeal/v1/keywords",
+        headers={"If-None-Match": if_none_match.format(etag=etag)},
+    )
+
+    assert response.status_code == expected_status
+    assert response.headers["etag"] == etag
+    if expected_status == 304:
+        assert response.content == b""
+    else:
+        assert response.json() == [{"id": 1, "title": "keyword"}]
+    # 두 번째 요청은 캐시에서 응답
+    view_mock.assert_called_once()
+    keyword_list_cache.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method, url, service_name",
+    [
+        ("post", "/api/hotdeal/v1/keywords/bulk", "register_keywords"),
+        ("post", "/api/hotdeal/v1/keywords/bulk/remove", "unlink_keywords"),
+        ("put", "/api/hotdeal/v1/keywords", "replace_keywords"),
+    ],
+)
+async def test_bulk_keyword_endpoints(
+    mocker,
+    mock_client,
+    mock_authenticated_user,
+    override_registered_user,
+    method,
+    url,
+    service_name,
+):
+    """키워드 일괄 등록/삭제/교체 API 테스트"""
+    override_registered_user(mock_authenticated_user)
+    mock_service = mocker.patch(
+        f"app.src.domain.hotdeal.v1.router.{service_name}",
+        return_value=KeywordBulkResponse(
+            results=[
+                KeywordBulkItemResult(
+                    title="keyword", id=1, status=KeywordLinkStatus.LINKED
+                )
+            ]
+        ),
+    )
+
+    response: Response = mock_client.request(method, url, json={"titles": ["Keyword"]})
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "results": [{"title": "keyword", "status": "linked", "id": 1}]
+    }
+    assert mock_service.call_args.kwargs["titles"] == ["Keyword"]
@@ -0,0 +1,148 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from fastapi import Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.src.core.dependencies.auth import authenticate_refresh_token
+from app.src.core.exceptions.auth_excptions import AuthErrors
+from app.src.domain.user.models import RefreshToken, User
+from app.src.domain.user.services import logout_user, refresh_access_token
+from app.src.domain.user.token_store import (
+    DatabaseRefreshTokenStore,
+    InMemoryRefreshTokenStore,
+    create_refresh_token_store,
+    hash_refresh_token,
+)
+
+
+@pytest.fixture(params=[DatabaseRefreshTokenStore, InMemoryRefreshTokenStore])
+def store(request):
+    return request.param(max_sessions=2)
+
+
+def expires_in(**kwargs) -> datetime:
+    return datetime.now(UTC) + timedelta(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_store_keeps_sessions_per_device(
+    store, add_mock_user, mock_db_session: AsyncSession
+):
+    """기기별 토큰을 따로 보관하고 하나만 폐기할 수 있는지 테스트"""
+    user: User = await add_mock_user()
+    other: User = await add_mock_user(email="other@example.com", nickname="other")
+
+    await store.save(mock_db_session, user.id, "phone", expires_in(days=1))
+    await store.save(mock_db_session, user.id, "laptop", expires_in(days=1))
+
+    assert await store.verify(mock_db_session, user.id, "phone")
+    assert await store.verify(mock_db_session, user.id, "laptop")
+    assert not await store.verify(mock_db_session, other.id, "phone")
+
+    await store.revoke(mock_db_session, user.id, "phone")
+    assert not await store.verify(mock_db_session, user.id, "phone")
+    assert await store.verify(mock_db_session, user.id, "laptop")
+
+    await store.revoke_all(mock_db_session, user.id)
+    assert not await store.verify(mock_db_session, user.id, "laptop")
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_sessions_over_limit(
+    store, add_mock_user, mock_db_session: AsyncSession
+):
+    """max_sessions를 넘으면 만료가 가장 이른 세션부터 제거하는지 테스트"""
+    user: User = await add_mock_user()
+
+    await store.save(mock_db_session, user.id, "first", expires_in(days=1))
+    await store.save(mock_db_session, user.id, "second", expires_in(days=2))
+    await store.save(mock_db_session, user.id, "third", expires_in(days=3))
+
+    assert not await store.verify(mock_db_session, user.id, "first")
+    assert await store.verify(mock_db_session, user.id, "second")
+    assert await store.verify(mock_db_session, user.id, "third")
+
+
+@pytest.mark.asyncio
+async def test_store_sweeps_expired_tokens(
+    store, add_mock_user, mock_db_session: AsyncSession
+):
+    """만료된 토큰은 검증에 실패하고 정리 시 삭제되는지 테스트"""
+    user: User = await add_mock_user()
+    await store.save(mock_db_session, user.id, "expired", expires_in(minutes=-1))
+    await store.save(mock_db_session, user.id, "valid", expires_in(days=1))
+
+    assert not await store.verify(mock_db_session, user.id, "expired")
+    assert await store.sweep_expired(mock_db_session) == 1
+    assert await store.sweep_expired(mock_db_session) == 0
+    assert await store.verify(mock_db_session, user.id, "valid")
+
+
+@pytest.mark.asyncio
+async def test_database_store_saves_only_token_hash(
+    add_mock_user, mock_db_session: AsyncSession
+):
+    """DB에는 토큰 원문 대신 해시를 저장하는지 테스트"""
+    user: User = await add_mock_user()
+    store = DatabaseRefreshTokenStore()
+
+    await store.save(mock_db_session, user.id, "raw-token", expires_in(days=1))
+
+    result = await mock_db_session.execute(select(RefreshToken.token_hash))
+    assert result.scalars().all() == [hash_refresh_token("raw-token")]
+
+
+def test_create_refresh_token_store_uses_backend():
+    """백엔드 이름에 따라 저장소 구현체를 선택하는지 테스트"""
+    assert isinstance(create_refresh_token_store("memory"), InMemoryRefreshTokenStore)
+    assert isinstance(create_refresh_token_store("database"), DatabaseRefreshTokenStore)
+    with pytest.raises(ValueError):
+        create_refresh_token_store("unknown")
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token_and_logout_revokes_device(
+    add_mock_user, mock_db_session: AsyncSession
+):
+    """
+    토큰 갱신 시 사용한 리프레시 토큰은 폐기되고,
+    로그아웃 시 해당 기기의 세션만 종료되는지 테스트
+    """
+    user: User = await add_mock_user(is_active=True)
+
+    async def issue(old_token: str | None = None) -> str:
+        response = Response()
+        await refresh_access_token(
+            db=mock_db_session,
+            response=response,
+            user_id=user.id,
+            email=user.email,
+            refresh_token=old_token,
+        )
+        cookie = response.headers["set-cookie"]
+        return cookie.split("refresh_token=", 1)[1].split(";", 1)[0]
+
+    phone_token = await issue()
+    laptop_token = await issue()
+    rotated_phone_token = await issue(phone_token)
+
+    with pytest.raises(AuthErrors.INVALID_TOKEN.__class__) as exc_info:
+        await authenticate_refresh_token(
+            db=mock_db_session, response=Response(), refresh_token=phone_token
+        )
+    assert exc_info.value.detail == AuthErrors.INVALID_TOKEN.detail
+    refreshed = await authenticate_refresh_token(
+        db=mock_db_session, response=Response(), refresh_token=rotated_phone_token
+    )
+    assert refreshed.nickname == user.nickname
+
+    await logout_user(
+        db=mock_db_session,
+        response=Response(),
+        user_id=user.id,
+        refresh_token=rotated_phone_token,
+    )
+    result = await mock_db_session.execute(select(RefreshToken.token_hash))
+    assert result.scalars().all() == [hash_refresh_token(laptop_token)]
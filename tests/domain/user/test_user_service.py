@@ -1,3 +1,5 @@
+import asyncio
+from contextlib import asynccontextmanager
 from uuid import UUID
 
 import pytest
@@ -6,15 +8,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.src.core.exceptions.auth_excptions import AuthErrors
 from app.src.core.exceptions.base_exceptions import BaseHTTPException
+from app.src.core.security import get_hash_rounds, hash_password, verify_password
+from app.src.domain.user.cache import user_status_cache
+from app.src.domain.user.enums import AuthLevel
 from app.src.domain.user.models import User
+from app.src.domain.user.repositories import activate_user, update_user_auth_level
 from app.src.domain.user.schemas import (
     LoginResponse,
     UserResponse,
 )
 from app.src.domain.user.services import (
+    _rehash_tasks,
     create_new_user,
     get_user_info,
     login_user,
+    logout_user,
     refresh_access_token,
 )
 
@@ -275,3 +283,64 @@ async def test_get_user_info(
         assert result.nickname == user.nickname
         assert result.is_active == user.is_active
         assert result.auth_level == user.auth_level
+
+
+@pytest.mark.asyncio
+async def test_login_user_rehashes_stale_password(
+    mocker,
+    mock_db_session: AsyncSession,
+):
+    """작업 비용이 설정과 다른 해시는 로그인 후 백그라운드에서 재해싱되는지 테스트"""
+    mocker.patch("app.src.core.security.settings.PASSWORD_HASH_ROUNDS", 5)
+
+    login_done = asyncio.Event()
+
+    # 테스트는 세션 하나를 공유하므로 로그인이 끝난 뒤에 재해싱이 세션을 사용하도록 함
+    @asynccontextmanager
+    async def session_factory():
+        await login_done.wait()
+        yield mock_db_session
+
+    mocker.patch("app.src.domain.user.services.AsyncSessionLocal", session_factory)
+    user = User(
+        email="test@example.com",
+        hashed_password=hash_password("securepassword", rounds=4),
+        nickname="test_user",
+        is_active=True,
+    )
+    mock_db_session.add(user)
+    await mock_db_session.commit()
+
+    await login_user(
+        db=mock_db_session,
+        response=Response(),
+        email="test@example.com",
+        password="securepassword",
+    )
+    login_done.set()
+    await asyncio.gather(*_rehash_tasks)
+
+    await mock_db_session.refresh(user)
+    assert get_hash_rounds(user.hashed_password) == 5
+    assert verify_password("securepassword", user.hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_user_status_cache_invalidated_on_change(
+    add_mock_user,
+    mock_db_session: AsyncSession,
+):
+    """활성화, 권한 변경, 로그아웃 시 사용자 상태 캐시가 제거되는지 테스트"""
+    user: User = await add_mock_user(is_active=False)
+
+    user_status_cache.set(user.id, False)
+    await activate_user(mock_db_session, user.id)
+    assert user_status_cache.get(user.id) is None
+
+    user_status_cache.set(user.id, True)
+    await update_user_auth_level(mock_db_session, user.id, AuthLevel.ADMIN)
+    assert user_status_cache.get(user.id) is None
+
+    user_status_cache.set(user.id, True)
+    await logout_user(db=mock_db_session, response=Response(), user_id=user.id)
+    assert user_status_cache.get(user.id) is None
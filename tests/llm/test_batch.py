@@ -0,0 +1,186 @@
+import asyncio
+
+import httpx
+import openai
+import pytest
+
+from app.src.llm import BatchRequest, RateLimiter, TokenBucket
+from app.src.llm.batch import is_retryable_error, run_batch
+from app.src.models.message import Message, RoleEnum
+
+
+def _status_error(status_code: int) -> openai.APIStatusError:
+    request = httpx.Request("POST", "https://example.com/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return openai.APIStatusError(str(status_code), response=response, body=None)
+
+
+def _requests(count: int) -> list[BatchRequest]:
+    return [
+        BatchRequest(
+            id=str(index),
+            messages=[Message(role=RoleEnum.user, content=f"질문 {index}")],
+            max_tokens=10,
+        )
+        for index in range(count)
+    ]
+
+
+def test_generate_batch_returns_all_results(mock_llm_model):
+    """동기 배치 API가 모든 요청의 결과를 반환하는지 테스트"""
+    model = mock_llm_model(["답", "변"])
+
+    results = list(model.generate_batch(_requests(5), max_concurrency=2))
+
+    assert sorted(result.id for result in results) == ["0", "1", "2", "3", "4"]
+    assert all(result.content == "답변" for result in results)
+    assert len(model.calls) == 5
+
+
+def test_generate_batch_reuses_background_loop(mock_llm_model):
+    """동기 배치 API가 호출마다 새 루프를 만들지 않고 같은 루프에서 실행되는지 테스트"""
+    model = mock_llm_model(["답"])
+    loops = []
+    original = model.agenerate_completion_stream
+
+    async def loop_tracking_stream(**kwargs):
+        loops.append(asyncio.get_running_loop())
+        async for chunk in original(**kwargs):
+            yield chunk
+
+    model.agenerate_completion_stream = loop_tracking_stream
+
+    list(model.generate_batch(_requests(2)))
+    list(model.generate_batch(_requests(2)))
+
+    assert len(loops) == 4
+    assert len(set(loops)) == 1
+
+
+@pytest.mark.asyncio
+async def test_run_batch_limits_concurrency(mock_llm_model):
+    """동시에 실행되는 요청 수가 max_concurrency를 넘지 않는지 테스트"""
+    model = mock_llm_model(["답"], first_token_delay=0.01)
+    running = 0
+    max_running = 0
+    original = model.agenerate_completion_stream
+
+    async def tracking_stream(**kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        try:
+            async for chunk in original(**kwargs):
+                yield chunk
+        finally:
+            running -= 1
+
+    model.agenerate_completion_stream = tracking_stream
+
+    results = [
+        result async for result in run_batch(model, _requests(10), max_concurrency=3)
+    ]
+
+    assert len(results) == 10
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+async def test_run_batch_retries_then_succeeds(mock_llm_model):
+    """실패한 요청을 재시도해 성공하면 시도 횟수와 함께 결과를 반환하는지 테스트"""
+    model = mock_llm_model(["답"])
+    original = model.agenerate_completion_stream
+    failures = iter([True, True, False])
+
+    async def flaky_stream(**kwargs):
+        if next(failures):
+            raise _status_error(429)
+        async for chunk in original(**kwargs):
+            yield chunk
+
+    model.agenerate_completion_stream = flaky_stream
+
+    results = [
+        result
+        async for result in run_batch(
+            model, _requests(1), max_retries=3, backoff_base=0.001
+        )
+    ]
+
+    assert results[0].content == "답"
+    assert results[0].attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_run_batch_reports_error_after_retries(mock_llm_model):
+    """재시도를 모두 소진하면 error가 담긴 결과를 반환하는지 테스트"""
+    model = mock_llm_model(error=httpx.ConnectError("down"))
+
+    results = [
+        result
+        async for result in run_batch(
+            model, _requests(1), max_retries=2, backoff_base=0.001
+        )
+    ]
+
+    assert results[0].error == "down"
+    assert results[0].content is None
+    assert results[0].attempts == 3
+
+
+@pytest.mark.asyncio
+async def test_run_batch_returns_non_retryable_error(mock_llm_model):
+    """4xx 응답은 재시도 없이 해당 요청의 error로 반환하고 나머지는 계속하는지 테스트"""
+    model = mock_llm_model(["답"])
+    original = model.agenerate_completion_stream
+
+    async def failing_stream(**kwargs):
+        if kwargs["messages"][0].content == "질문 1":
+            model.calls.append(kwargs)
+            raise _status_error(400)
+        async for chunk in original(**kwargs):
+            yield chunk
+
+    model.agenerate_completion_stream = failing_stream
+
+    results = {
+        result.id: result
+        async for result in run_batch(
+            model, _requests(3), max_concurrency=3, max_retries=3
+        )
+    }
+
+    assert results["1"].content is None
+    assert results["1"].error == "400"
+    assert results["1"].attempts == 1
+    assert results["0"].content == results["2"].content == "답"
+    assert len(model.calls) == 3
+
+
+def test_is_retryable_error():
+    """429, 5xx, 연결 오류만 재시도 대상으로 판단하는지 테스트"""
+    assert is_retryable_error(_status_error(429))
+    assert is_retryable_error(_status_error(503))
+    assert is_retryable_error(httpx.ReadTimeout("timeout"))
+    assert not is_retryable_error(_status_error(400))
+    assert not is_retryable_error(_status_error(401))
+    assert not is_retryable_error(ValueError("invalid"))
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_throttles_requests(mock_llm_model):
+    """RPM 제한을 넘는 요청은 버킷이 채워질 때까지 지연되는지 테스트"""
+    model = mock_llm_model(["답"])
+    rate_limiter = RateLimiter(rpm=60)
+    rate_limiter.requests = TokenBucket(capacity=1, refill_rate=20)
+
+    loop = asyncio.get_running_loop()
+    started_at = loop.time()
+    results = [
+        result
+        async for result in run_batch(model, _requests(3), rate_limiter=rate_limiter)
+    ]
+
+    assert len(results) == 3
+    # 첫 요청 이후 2개는 각각 0.05초씩 기다려야 함
+    assert loop.time() - started_at >= 0.09
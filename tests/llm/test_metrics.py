@@ -0,0 +1,107 @@
+import pytest
+
+from app.src.llm.metrics import (
+    LlmMetrics,
+    StreamTracker,
+    instrument_astream,
+    instrument_stream,
+    llm_metrics,
+)
+from app.src.models.message import Message, RoleEnum
+from tests.conftest import FakeLlmModels
+
+MESSAGES = [Message(role=RoleEnum.user, content="hello world")]
+PARAMS = {"temperature": 1.0, "max_tokens": 100, "top_p": 0.9}
+
+
+class InstrumentedFakeModels(FakeLlmModels):
+    generate_completion_stream = instrument_stream(
+        FakeLlmModels.generate_completion_stream
+    )
+    agenerate_completion_stream = instrument_astream(
+        FakeLlmModels.agenerate_completion_stream
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    llm_metrics.reset()
+    yield
+    llm_metrics.reset()
+
+
+def test_stream_tracker_records_latency_and_tokens():
+    """TTFT, 토큰 간 지연, 입력/출력 토큰 수를 기록하는지 테스트"""
+    metrics = LlmMetrics()
+    tracker = StreamTracker("fake", "fake-model", MESSAGES, metrics=metrics)
+    tracker.on_chunk("abcd")
+    tracker.on_chunk("efgh")
+
+    call = tracker.finish("completed")
+
+    assert call.ttft is not None
+    assert call.inter_token_latency is not None
+    # "hello world" 11자 -> 3토큰 + 메시지 오버헤드 4토큰
+    assert call.input_tokens == 7
+    assert call.output_tokens == 2
+    snapshot = metrics.snapshot()[0]
+    assert snapshot["calls"] == 1
+    assert snapshot["outcomes"] == {"completed": 1}
+
+
+def test_instrument_stream_records_error():
+    """스트림 오류가 error 종료 사유와 예외 타입으로 기록되는지 테스트"""
+    model = InstrumentedFakeModels(["a"], error=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError):
+        list(model.generate_completion_stream(MESSAGES, "fake-model", **PARAMS))
+
+    snapshot = llm_metrics.snapshot()[0]
+    assert snapshot["outcomes"] == {"error": 1}
+    assert snapshot["error_types"] == {"RuntimeError": 1}
+
+
+def test_instrument_stream_records_cancel():
+    """소비자가 중간에 멈추면 cancelled로 기록되는지 테스트"""
+    model = InstrumentedFakeModels(["a", "b", "c"])
+
+    stream = model.generate_completion_stream(MESSAGES, "fake-model", **PARAMS)
+    next(stream)
+    stream.close()
+
+    assert llm_metrics.snapshot()[0]["outcomes"] == {"cancelled": 1}
+
+
+@pytest.mark.asyncio
+async def test_instrument_astream_records_completion():
+    """비동기 스트림 완료 시 지표가 기록되는지 테스트"""
+    model = InstrumentedFakeModels(["안녕", "하세요"])
+
+    chunks = [
+        chunk
+        async for chunk in model.agenerate_completion_stream(
+            MESSAGES, "fake-model", **PARAMS
+        )
+    ]
+
+    assert chunks == ["안녕", "하세요"]
+    snapshot = llm_metrics.snapshot()[0]
+    assert snapshot["provider"] == "fake"
+    assert snapshot["outcomes"] == {"completed": 1}
+    assert snapshot["output_tokens"] == 5
+
+
+def test_get_llm_metrics_endpoint(mock_client, mock_authenticated_user):
+    """관리자 지표 API가 모델별 지표를 반환하는지 테스트"""
+    from app.src.core.dependencies.auth import authenticate_admin_user
+
+    mock_client.app.dependency_overrides[authenticate_admin_user] = lambda: (
+        mock_authenticated_user
+    )
+    model = InstrumentedFakeModels(["a"])
+    list(model.generate_completion_stream(MESSAGES, "fake-model", **PARAMS))
+
+    response = mock_client.get("/api/admin/llm/metrics")
+
+    assert response.status_code == 200
+    assert response.json()["models"][0]["model_name"] == "fake-model"
@@ -0,0 +1,48 @@
+import httpx
+import pytest
+
+from app.src.llm.registry import LlmClientRegistry
+
+
+@pytest.mark.asyncio
+async def test_registry_reuses_clients_per_provider_and_key():
+    """같은 (provider, api_key)에는 같은 클라이언트를 재사용하는지 테스트"""
+    registry = LlmClientRegistry()
+
+    first = registry.get_async_openai_client("grok", "key-1", "https://example.com")
+    second = registry.get_async_openai_client("grok", "key-1", "https://example.com")
+    other_key = registry.get_async_openai_client("grok", "key-2", "https://example.com")
+    genai_client = registry.get_genai_client("gemini", "key-1")
+
+    assert first is second
+    assert first is not other_key
+    assert genai_client is registry.get_genai_client("gemini", "key-1")
+
+    await registry.aclose()
+
+    # 종료 후에는 새 클라이언트를 생성
+    assert (
+        registry.get_async_openai_client("grok", "key-1", "https://example.com")
+        is not first
+    )
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_registry_closes_genai_connection_pools(mocker):
+    """Gemini 클라이언트가 레지스트리의 커넥션 풀을 사용하고 종료 시 닫히는지 테스트"""
+    registry = LlmClientRegistry()
+    close = mocker.spy(httpx.HTTPTransport, "close")
+    aclose = mocker.spy(httpx.AsyncHTTPTransport, "aclose")
+
+    genai_client = registry.get_genai_client("gemini", "key-1")
+    transport, async_transport = registry._genai_transports[("gemini", "key-1", "sync")]
+    api_client = genai_client._api_client
+
+    assert api_client._httpx_client._transport is transport
+    assert api_client._async_httpx_client._transport is async_transport
+
+    await registry.aclose()
+
+    close.assert_called_once_with(transport)
+    aclose.assert_called_once_with(async_transport)
@@ -0,0 +1,122 @@
+import pytest
+
+from app.src.llm import RouterModels
+from app.src.models.message import Message, RoleEnum
+
+MESSAGES = [Message(role=RoleEnum.user, content="안녕")]
+PARAMS = {"temperature": 1.0, "max_tokens": 100, "top_p": 0.9}
+
+
+async def _collect(router: RouterModels, model_name: str = "auto") -> list[str]:
+    return [
+        chunk
+        async for chunk in router.agenerate_completion_stream(
+            messages=MESSAGES, model_name=model_name, **PARAMS
+        )
+    ]
+
+
+def test_router_falls_back_before_first_token(mock_llm_model):
+    """첫 토큰 전에 실패하면 다음 제공자로 넘어가고 실패를 기록하는지 테스트"""
+    broken = mock_llm_model(error=RuntimeError("down"), provider_name="broken")
+    healthy = mock_llm_model(["안녕"], provider_name="healthy")
+    router = RouterModels(routes=[(broken, None), (healthy, None)])
+
+    chunks = list(
+        router.generate_completion_stream(
+            messages=MESSAGES, model_name="auto", **PARAMS
+        )
+    )
+
+    assert chunks == ["안녕"]
+    assert router.get_stats((broken, "fake-model")).error_rate == 1.0
+    assert len(router.get_stats((healthy, "fake-model")).ttfts) == 1
+
+
+def test_router_does_not_fall_back_after_first_token(mock_llm_model):
+    """첫 토큰 이후 실패는 다른 제공자로 넘기지 않고 그대로 전파하는지 테스트"""
+    partial = mock_llm_model(["안"], error=RuntimeError("cut"), provider_name="a")
+    healthy = mock_llm_model(["안녕"], provider_name="b")
+    router = RouterModels(routes=[(partial, None), (healthy, None)])
+
+    with pytest.raises(RuntimeError):
+        list(
+            router.generate_completion_stream(
+                messages=MESSAGES, model_name="auto", **PARAMS
+            )
+        )
+    assert healthy.calls == []
+
+
+def test_router_orders_by_ttft_and_health(mock_llm_model):
+    """TTFT가 작은 제공자를 먼저, 쿨다운 중인 제공자를 마지막에 시도하는지 테스트"""
+    slow = mock_llm_model(provider_name="slow")
+    fast = mock_llm_model(provider_name="fast")
+    down = mock_llm_model(provider_name="down")
+    router = RouterModels(
+        routes=[(down, None), (slow, None), (fast, None)], failure_threshold=1
+    )
+    router.get_stats((slow, "fake-model")).record_ttft(2.0)
+    router.get_stats((fast, "fake-model")).record_ttft(0.1)
+    router.get_stats((down, "fake-model")).record_failure(
+        failure_threshold=1, cooldown=60
+    )
+
+    ordered = [route[0] for route in router._ordered_routes("auto")]
+
+    assert ordered == [fast, slow, down]
+
+
+def test_router_context_window_is_smallest(mock_llm_model):
+    """라우터의 컨텍스트 윈도우가 제공자 중 가장 작은 값인지 테스트"""
+    router = RouterModels(
+        routes=[
+            (mock_llm_model(context_window=8_000, provider_name="a"), None),
+            (mock_llm_model(context_window=4_000, provider_name="b"), None),
+        ]
+    )
+
+    assert router.get_context_window("auto") == 4_000
+
+
+@pytest.mark.asyncio
+async def test_arouter_falls_back_before_first_token(mock_llm_model):
+    """비동기 스트림도 첫 토큰 전 실패 시 다음 제공자로 넘어가는지 테스트"""
+    broken = mock_llm_model(error=RuntimeError("down"), provider_name="broken")
+    healthy = mock_llm_model(["안녕", "하세요"], provider_name="healthy")
+    router = RouterModels(routes=[(broken, None), (healthy, None)])
+
+    assert await _collect(router) == ["안녕", "하세요"]
+    assert router.get_stats((broken, "fake-model")).error_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_arouter_hedges_slow_provider(mock_llm_model):
+    """
+    첫 토큰이 p95보다 늦으면 다음 제공자에도 요청해 먼저 온 응답을 사용하는지 테스트
+    """
+    slow = mock_llm_model(["느림"], provider_name="slow", first_token_delay=1.0)
+    fast = mock_llm_model(["빠름"], provider_name="fast")
+    router = RouterModels(
+        routes=[(slow, None), (fast, None)], hedge=True, hedge_min_samples=1
+    )
+    # slow가 먼저 선택되도록 과거 TTFT를 작게 기록
+    router.get_stats((slow, "fake-model")).record_ttft(0.01)
+    router.get_stats((fast, "fake-model")).record_ttft(0.5)
+
+    assert await _collect(router) == ["빠름"]
+    assert len(slow.calls) == 1
+    assert len(fast.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_arouter_without_hedge_waits_for_primary(mock_llm_model):
+    """hedge가 꺼져 있으면 느린 제공자의 응답을 기다리는지 테스트"""
+    slow = mock_llm_model(["느림"], provider_name="slow", first_token_delay=0.05)
+    fast = mock_llm_model(["빠름"], provider_name="fast")
+    router = RouterModels(routes=[(slow, None), (fast, None)])
+    router.get_stats((slow, "fake-model")).record_ttft(0.01)
+    router.get_stats((fast, "fake-model")).record_ttft(0.5)
+
+    assert await _collect(router) == ["느림"]
+    assert fast.calls == []
@@ -0,0 +1,87 @@
+from app.src.llm.token_budget import EstimatingTokenizer, TokenBudgeter
+from app.src.models.compact_message_list import CompactMessageList
+from app.src.models.message import RoleEnum
+from app.src.models.message_list import MessageList, MessageWindow
+
+
+class CountingTokenizer(EstimatingTokenizer):
+    """토큰화 호출 횟수를 세는 테스트용 토크나이저 (글자당 1토큰)"""
+
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text)
+
+
+def _build_conversation(list_class=MessageList) -> MessageList:
+    message_list = list_class(system_message="sys")
+    for turn in range(5):
+        message_list.addUser(f"user{turn}" * 10)
+        message_list.addAssistant(f"assistant{turn}" * 10)
+    return message_list
+
+
+def test_estimating_tokenizer():
+    """ASCII는 4글자당 1토큰, 비ASCII는 글자당 1토큰으로 계산하는지 테스트"""
+    tokenizer = EstimatingTokenizer()
+    assert tokenizer.count("abcdefgh") == 2
+    assert tokenizer.count("안녕하세요") == 5
+
+
+def test_fit_returns_original_when_within_budget():
+    """예산 안이면 원본을 그대로 반환하는지 테스트"""
+    message_list = _build_conversation()
+    budgeter = TokenBudgeter(tokenizer=CountingTokenizer(), safety_margin=0)
+
+    assert budgeter.fit(message_list, context_window=100_000, max_tokens=100) is (
+        message_list
+    )
+
+
+def test_fit_trims_oldest_turns_and_keeps_system():
+    """예산을 넘으면 오래된 턴을 제외하고 시스템 메시지는 유지하는지 테스트"""
+    message_list = _build_conversation()
+    budgeter = TokenBudgeter(tokenizer=CountingTokenizer(), safety_margin=0)
+
+    window = budgeter.fit(message_list, context_window=500, max_tokens=100)
+
+    assert isinstance(window, MessageWindow)
+    messages = window.get_messages()
+    assert messages[0].role == RoleEnum.system
+    assert messages[1].role == RoleEnum.user
+    assert messages[-1] is message_list.get_messages()[-1]
+    assert sum(budgeter.count_messages(messages)) <= 400
+    # 잘린 뷰도 provider 포맷 캐시를 그대로 사용
+    assert window.get_formatted("content", lambda msg: msg.content) == [
+        msg.content for msg in messages
+    ]
+
+
+def test_fit_only_tokenizes_new_messages():
+    """메시지별 토큰 수를 캐시해 새 메시지만 토큰화하는지 테스트"""
+    message_list = _build_conversation(CompactMessageList)
+    tokenizer = CountingTokenizer()
+    budgeter = TokenBudgeter(tokenizer=tokenizer, safety_margin=0)
+
+    budgeter.fit(message_list, context_window=500, max_tokens=100)
+    assert tokenizer.calls == 11
+
+    message_list.addUser("new question")
+    budgeter.fit(message_list, context_window=500, max_tokens=100)
+    assert tokenizer.calls == 12
+
+
+def test_fit_trims_plain_list():
+    """일반 리스트도 잘라낸 리스트로 반환하는지 테스트"""
+    messages = _build_conversation().get_messages()
+    budgeter = TokenBudgeter(tokenizer=CountingTokenizer(), safety_margin=0)
+
+    trimmed = budgeter.fit(messages, context_window=500, max_tokens=100)
+
+    assert isinstance(trimmed, list)
+    assert trimmed[0].role == RoleEnum.system
+    assert len(trimmed) < len(messages)
@@ -0,0 +1,78 @@
+from app.src.models.compact_message_list import CompactMessageList
+from app.src.models.message import Message, RoleEnum
+from app.src.models.message_list import MessageList
+
+
+def test_get_formatted_only_formats_new_messages():
+    """get_formatted가 마지막 호출 이후 추가된 메시지만 변환하는지 테스트"""
+    message_list = MessageList(system_message="시스템")
+    message_list.addUser("안녕")
+    calls: list[str] = []
+
+    def formatter(msg: Message) -> str | None:
+        calls.append(msg.content)
+        return None if msg.role == RoleEnum.system else msg.content
+
+    assert message_list.get_formatted("test", formatter) == ["안녕"]
+    assert calls == ["시스템", "안녕"]
+
+    message_list.addAssistant("반가워요")
+    assert message_list.get_formatted("test", formatter) == ["안녕", "반가워요"]
+    assert calls == ["시스템", "안녕", "반가워요"]
+
+
+def test_get_formatted_rebuilds_when_list_is_modified():
+    """외부에서 메시지 리스트가 수정되면 전체를 다시 변환하는지 테스트"""
+    message_list = MessageList()
+    message_list.addUser("첫번째")
+    message_list.addUser("두번째")
+    assert message_list.get_formatted("test", lambda msg: msg.content) == [
+        "첫번째",
+        "두번째",
+    ]
+
+    message_list.messages[-1] = Message(role=RoleEnum.user, content="수정됨")
+    assert message_list.get_formatted("test", lambda msg: msg.content) == [
+        "첫번째",
+        "수정됨",
+    ]
+
+    message_list.messages.clear()
+    assert message_list.get_formatted("test", lambda msg: msg.content) == []
+
+
+def test_compact_message_list_matches_message_list():
+    """CompactMessageList가 MessageList와 같은 메시지를 반환하는지 테스트"""
+    message_list = MessageList(system_message="시스템")
+    compact_list = CompactMessageList(system_message="시스템")
+    for target in (message_list, compact_list):
+        target.addUser("안녕")
+        target.addAssistant("반가워요")
+
+    assert compact_list.get_messages() == message_list.get_messages()
+    assert len(compact_list) == 3
+    assert [msg.role for msg in compact_list] == [
+        RoleEnum.system,
+        RoleEnum.user,
+        RoleEnum.assistant,
+    ]
+
+
+def test_compact_message_list_get_formatted_and_isolation():
+    """CompactMessageList의 포맷 캐시와 반환값 격리 테스트"""
+    compact_list = CompactMessageList()
+    compact_list.addUser("안녕")
+    calls: list[str] = []
+
+    def formatter(msg: Message) -> str:
+        calls.append(msg.content)
+        return msg.content
+
+    assert compact_list.get_formatted("test", formatter) == ["안녕"]
+    compact_list.addAssistant("반가워요")
+    assert compact_list.get_formatted("test", formatter) == ["안녕", "반가워요"]
+    assert calls == ["안녕", "반가워요"]
+
+    # get_messages 반환값을 수정해도 저장소는 변하지 않음
+    compact_list.get_messages().clear()
+    assert len(compact_list) == 2
@@ -5,22 +5,33 @@ import pytest
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.src.domain.hotdeal.crawl_state import CrawlStateManager
 from app.src.domain.hotdeal.enums import SiteName
 from app.src.domain.hotdeal.models import Keyword, KeywordSite
 from app.src.domain.hotdeal.schemas import CrawledKeyword
-from app.worker_main import get_new_hotdeal_keywords, job
+from app.worker_main import build_crawl_plan, handle_crawl_target, job
 
 # --- 테스트 데이터 ---
 
 CRAWLED_DATA_NEW = [
-    CrawledKeyword(id="101", title="[새상품] 키보드", link="new_link1", price="10000원"),
-    CrawledKeyword(id="102", title="[새상품] 마우스", link="new_link2", price="20000원"),
-    CrawledKeyword(id="103", title="[기존상품] 모니터", link="old_link3", price="30000원"),
+    CrawledKeyword(
+        id="101", title="[새상품] 키보드", link="new_link1", price="10000원"
+    ),
+    CrawledKeyword(
+        id="102", title="[새상품] 마우스", link="new_link2", price="20000원"
+    ),
+    CrawledKeyword(
+        id="103", title="[기존상품] 모니터", link="old_link3", price="30000원"
+    ),
 ]
 
 CRAWLED_DATA_NO_NEW = [
-    CrawledKeyword(id="103", title="[기존상품] 모니터", link="old_link3", price="30000원"),
-    CrawledKeyword(id="104", title="[기존상품] 스피커", link="old_link4", price="40000원"),
+    CrawledKeyword(
+        id="103", title="[기존상품] 모니터", link="old_link3", price="30000원"
+    ),
+    CrawledKeyword(
+        id="104", title="[기존상품] 스피커", link="old_link4", price="40000원"
+    ),
 ]
 
 
@@ -58,13 +69,25 @@ async def keyword_and_site_in_db(
 # --- 테스트 케이스 ---
 
 
+async def crawl_keyword(
+    session: AsyncSession, keyword: Keyword, client: httpx.AsyncClient
+) -> list[CrawledKeyword]:
+    """job과 같은 순서로 크롤링 상태를 불러오고, 키워드 하나를 처리한 뒤 저장합니다."""
+    crawl_state = await CrawlStateManager.load(session, [keyword.id])
+    results = await handle_crawl_target(
+        SiteName.ALGUMON, keyword.title, [keyword], client, crawl_state
+    )
+    await crawl_state.flush(session)
+    return results[0][1] if results else []
+
+
 @pytest.mark.asyncio
-async def test_get_new_hotdeal_keywords_first_crawl(
+async def test_handle_crawl_target_first_crawl(
     mock_db_session: AsyncSession, keyword_in_db: Keyword
 ):
     """
     시나리오 1: 키워드가 처음으로 크롤링될 때
-    - 기대: 크롤링된 모든 항목이 '새로운 핫딜'로 반환되고, 첫 번째 항목이 DB에 저장되어야 함
+    - 기대: 최신 1개만 '새로운 핫딜'로 반환되고, 해당 항목이 DB에 저장되어야 함
     """
     # GIVEN: 크롤러가 CRAWLED_DATA_NEW를 반환하도록 모킹
     with patch(
@@ -73,23 +96,21 @@ async def test_get_new_hotdeal_keywords_first_crawl(
         mock_fetch.return_value = CRAWLED_DATA_NEW
         async with httpx.AsyncClient() as client:
             # WHEN: 새로운 핫딜을 조회
-            new_deals = await get_new_hotdeal_keywords(mock_db_session, keyword_in_db, client)
+            new_deals = await crawl_keyword(mock_db_session, keyword_in_db, client)
 
-            # THEN: 모든 결과가 반환되어야 함
-            assert len(new_deals) == 3
-            assert new_deals[0].id == "101"
+            # THEN: 최신 1개만 반환되어야 함
+            assert [deal.id for deal in new_deals] == ["101"]
 
             # AND: 첫 번째 결과가 DB에 저장되어야 함
             stmt = select(KeywordSite).where(KeywordSite.keyword_id == keyword_in_db.id)
             result = await mock_db_session.execute(stmt)
             saved_site = result.scalars().one()
 
-            assert saved_site is not None
             assert saved_site.external_id == "101"
 
 
 @pytest.mark.asyncio
-async def test_get_new_hotdeal_keywords_no_new_deals(
+async def test_handle_crawl_target_no_new_deals(
     mock_db_session: AsyncSession, keyword_and_site_in_db: tuple[Keyword, KeywordSite]
 ):
     """
@@ -104,14 +125,14 @@ async def test_get_new_hotdeal_keywords_no_new_deals(
         mock_fetch.return_value = CRAWLED_DATA_NO_NEW
         async with httpx.AsyncClient() as client:
             # WHEN: 새로운 핫딜을 조회
-            new_deals = await get_new_hotdeal_keywords(mock_db_session, keyword, client)
+            new_deals = await crawl_keyword(mock_db_session, keyword, client)
 
             # THEN: 빈 리스트가 반환되어야 함
             assert len(new_deals) == 0
 
 
 @pytest.mark.asyncio
-async def test_get_new_hotdeal_keywords_with_new_deals(
+async def test_handle_crawl_target_with_new_deals(
     mock_db_session: AsyncSession, keyword_and_site_in_db: tuple[Keyword, KeywordSite]
 ):
     """
@@ -126,7 +147,7 @@ async def test_get_new_hotdeal_keywords_with_new_deals(
         mock_fetch.return_value = CRAWLED_DATA_NEW
         async with httpx.AsyncClient() as client:
             # WHEN: 새로운 핫딜을 조회
-            new_deals = await get_new_hotdeal_keywords(mock_db_session, keyword, client)
+            new_deals = await crawl_keyword(mock_db_session, keyword, client)
 
             # THEN: 새로운 핫딜 2개만 반환되어야 함 (기존 103 제외)
             assert len(new_deals) == 2
@@ -144,19 +165,29 @@ async def test_job_e2e(mock_db_session, keyword_in_db):
     """E2E 테스트: job 함수가 올바르게 동작하는지 검증"""
     # GIVEN: DB에 사용자, 키워드, 사용자-키워드 관계 설정
     from app.src.domain.user.models import User
-    user = User(email="test@example.com", nickname="testuser", hashed_password="hashed_password")
+
+    user = User(
+        email="test@example.com", nickname="testuser", hashed_password="hashed_password"
+    )
     user.keywords.append(keyword_in_db)
     mock_db_session.add(user)
     await mock_db_session.commit()
 
     # GIVEN: 크롤링, 메일 발송, DB 조회 모킹
-    with patch("app.worker_main.get_new_hotdeal_keywords", new_callable=AsyncMock) as mock_get_new:
-        with patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email:
-            with patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session):
+    with patch(
+        "app.worker_main.AlgumonCrawler.fetchparse", new_callable=AsyncMock
+    ) as mock_get_new:
+        with patch(
+            "app.worker_main.send_email", new_callable=AsyncMock
+        ) as mock_send_email:
+            with patch(
+                "app.worker_main.AsyncSessionLocal", return_value=mock_db_session
+            ):
                 with patch("app.worker_main.settings.ENVIRONMENT", "prod"):
-
                     mock_get_new.return_value = CRAWLED_DATA_NEW
-                    mock_send_email.return_value = None  # Ensure the mock returns a completed coroutine
+                    mock_send_email.return_value = (
+                        None  # Ensure the mock returns a completed coroutine
+                    )
 
                     # WHEN: job 실행
                     await job()
@@ -166,4 +197,52 @@ async def test_job_e2e(mock_db_session, keyword_in_db):
                     args, kwargs = mock_send_email.call_args
                     assert kwargs["to"] == "test@example.com"
                     assert "테스트키워드" in kwargs["subject"]
-                    assert "[새상품] 키보드" in kwargs["body"]
\ No newline at end of file
+                    assert "[새상품] 키보드" in kwargs["body"]
+
+
+def test_build_crawl_plan_dedupes_queries():
+    """정규화한 검색어가 같은 키워드는 하나의 요청으로 묶이는지 테스트"""
+    keywords = [
+        Keyword(id=1, title="rtx 4090"),
+        Keyword(id=2, title="RTX  4090!"),
+        Keyword(id=3, title="모니터"),
+        Keyword(id=4, title="!!"),
+    ]
+
+    plan = build_crawl_plan(keywords)
+
+    assert plan == {
+        (SiteName.ALGUMON, "rtx 4090"): [keywords[0], keywords[1]],
+        (SiteName.ALGUMON, "모니터"): [keywords[2]],
+    }
+
+
+@pytest.mark.asyncio
+async def test_job_shares_fetch_between_keywords(mock_db_session: AsyncSession):
+    """검색어가 같은 키워드는 한 번만 크롤링하고 각 구독자에게 결과를 보내는지 테스트"""
+    from app.src.domain.user.models import User
+
+    first = User(email="first@example.com", nickname="first", hashed_password="pw")
+    second = User(email="second@example.com", nickname="second", hashed_password="pw")
+    first.keywords.append(Keyword(title="rtx 4090"))
+    second.keywords.append(Keyword(title="rtx  4090"))
+    mock_db_session.add_all([first, second])
+    await mock_db_session.commit()
+
+    with (
+        patch(
+            "app.worker_main.AlgumonCrawler.fetchparse", new_callable=AsyncMock
+        ) as mock_fetch,
+        patch("app.worker_main.send_email", new_callable=AsyncMock) as mock_send_email,
+        patch("app.worker_main.AsyncSessionLocal", return_value=mock_db_session),
+        patch("app.worker_main.PROXY_MANAGER"),
+        patch("app.worker_main.settings.ENVIRONMENT", "prod"),
+    ):
+        mock_fetch.return_value = CRAWLED_DATA_NEW
+        await job()
+
+    mock_fetch.assert_called_once()
+    recipients = sorted(call.kwargs["to"] for call in mock_send_email.call_args_list)
+    assert recipients == ["first@example.com", "second@example.com"]
+    result = await mock_db_session.execute(select(KeywordSite.external_id))
+    assert result.scalars().all() == ["101", "101"]